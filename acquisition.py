@@ -0,0 +1,170 @@
+import asyncio
+import csv
+import json
+import threading
+import time
+from pathlib import Path
+
+import calcs
+
+
+# =========================
+# LIVE ACQUISITION FEED
+# =========================
+# Samples are dicts: {"t": seconds, "depth": m, "rate": m³/min, "pressure": kPa}
+# Sources are async iterators; LiveTracker turns each sample into readings
+# without re-walking the geometry.
+
+def _sample(raw):
+    t = raw.get("t", raw.get("time"))
+    return {
+        "t": time.time() if t in (None, "") else float(t),
+        "depth": float(raw.get("depth") or 0.0),
+        "rate": float(raw.get("rate") or 0.0),
+        "pressure": float(raw.get("pressure") or 0.0)
+    }
+
+
+async def replay_file(path, speed: float = 1.0):
+    """Replay a recorded CSV or JSON-lines file, paced by its timestamps (speed 0 = as fast as possible)."""
+    path = Path(path)
+    with path.open(newline="", encoding="utf-8") as fh:
+        if path.suffix == ".csv":
+            rows = csv.DictReader(fh)
+        else:
+            rows = (json.loads(line) for line in fh if line.strip())
+
+        last_t = None
+        for raw in rows:
+            sample = _sample(raw)
+            if speed > 0 and last_t is not None:
+                await asyncio.sleep(max(sample["t"] - last_t, 0.0) / speed)
+            last_t = sample["t"]
+            yield sample
+
+
+async def read_socket(host: str, port: int):
+    """JSON-lines samples from a data acquisition unit over TCP."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                yield _sample(json.loads(line))
+            except ValueError:
+                continue  # garbled line from the unit — skip it
+    finally:
+        writer.close()
+
+
+class LiveTracker:
+    """Incremental annular velocity at the CT tip, bottoms-up time and hydrostatic readings.
+
+    The annular volume to the tip is kept as (interval index, cumulative volume at its
+    top), so a sample that stays inside the current casing interval costs a multiply;
+    only crossing an interval boundary costs a bisect.
+    """
+
+    def __init__(self, geom, density_kg_m3: float = None, tvd_at=None):
+        self.geom = geom
+        self.density = density_kg_m3
+        self.tvd_at = tvd_at or (lambda md: md)
+        self._k = None
+        self.pumped_m3 = 0.0
+        self.last = None
+        self.reading = None
+
+    def _interval(self, depth):
+        k = self._k
+        geom = self.geom
+        if k is not None and geom.tops[k] <= depth <= geom.bottoms[k]:
+            return k
+        self._k = geom.interval_at(depth)
+        return self._k
+
+    def update(self, sample: dict) -> dict:
+        depth = sample["depth"]
+        rate = sample["rate"]
+        geom = self.geom
+
+        # running pumped volume (trapezoid between samples, rate per minute)
+        if self.last is not None:
+            dt_min = (sample["t"] - self.last["t"]) / 60.0
+            self.pumped_m3 += 0.5 * (rate + self.last["rate"]) * max(dt_min, 0.0)
+        self.last = sample
+
+        k = self._interval(depth)
+        if k is None:
+            ann_area = None
+            ann_vol = geom.annular_volume_to(depth)
+        else:
+            ann_area = geom.ann_areas[k]
+            ann_vol = geom.cum_ann[k] + ann_area * (depth - geom.tops[k])
+
+        reading = {
+            "t": sample["t"],
+            "depth_m": depth,
+            "rate_m3_min": rate,
+            "pressure_kpa": sample["pressure"],
+            "pumped_m3": self.pumped_m3,
+            "annular_m3": ann_vol,
+            "annular_velocity_m_min": rate / ann_area if ann_area and rate > 0 else None,
+            "bottoms_up_min": ann_vol / rate if rate > 0 else None,
+            "hydrostatic_kpa": None
+        }
+        if self.density:
+            reading["hydrostatic_kpa"] = calcs.hydrostatic_pa(self.density, self.tvd_at(depth)) / 1000.0
+
+        self.reading = reading
+        return reading
+
+
+async def track(source, tracker: LiveTracker, on_reading=None):
+    """Feed every sample from an async source through the tracker."""
+    async for sample in source:
+        reading = tracker.update(sample)
+        if on_reading is not None:
+            on_reading(reading)
+    return tracker.reading
+
+
+class LiveFeed:
+    """Runs track() on its own event loop in a daemon thread so a UI can poll .tracker.reading."""
+
+    def __init__(self, source, tracker: LiveTracker, on_reading=None, on_done=None):
+        self.source = source
+        self.tracker = tracker
+        self.on_reading = on_reading
+        self.on_done = on_done      # called on the feed thread once tracking ends, is stopped or fails
+        self.error = None
+        self._loop = asyncio.new_event_loop()
+        self._task = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._task = self._loop.create_task(track(self.source, self.tracker, self.on_reading))
+        try:
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:  # surfaced to the UI instead of killing the thread silently
+            self.error = exc
+        finally:
+            self._loop.close()
+            if self.on_done is not None:
+                self.on_done()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    def stop(self):
+        if self._task is not None and self.running:
+            self._loop.call_soon_threadsafe(self._task.cancel)
@@ -0,0 +1,291 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+
+import numpy as np
+
+import calcs
+from geometry import geometry_for, depth_sweep
+from job_store import JobStore
+from model import migrate
+
+
+# =========================
+# LOCAL JSON-OVER-HTTP CALCULATION API
+# =========================
+# python api.py --port 8765
+#
+# POST /flow      {casing, ct_od_mm | job | job_id, depths: [...], rates_m3_min: [...]}
+# POST /volumes   {casing, ct_sections | job | job_id, depths: [...]}
+# POST /fluids    {base_density, chemicals} or {"fluids": [{...}, ...]}
+# POST /pressure  {densities: [...], depths: [...]}
+# POST /batch     {"requests": [{"endpoint": "/flow", ...}, ...]}
+# GET  /health
+#
+# Every numeric input may be a list; results come back as arrays in one response.
+
+MAX_BODY = 32 * 1024 * 1024
+
+
+class ApiError(Exception):
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _jsonable(value):
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f":
+            return np.where(np.isnan(value), None, value).tolist()
+        return value.tolist()
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _array(body, key, required=True):
+    if key not in body:
+        if required:
+            raise ApiError(400, f"'{key}' is required")
+        return None
+    value = body[key]
+    return np.atleast_1d(np.asarray(value, dtype=float))
+
+
+class CalcApi:
+
+    def __init__(self, job_store=None):
+        self.job_store = job_store
+        self.routes = {
+            "/flow": self.flow,
+            "/volumes": self.volumes,
+            "/fluids": self.fluids,
+            "/pressure": self.pressure,
+            "/batch": self.batch
+        }
+
+    # --- Inputs ---
+    def _job(self, body):
+        if "job" in body:
+            try:
+                return migrate(body["job"])
+            except (AttributeError, ValueError) as exc:
+                raise ApiError(400, f"Invalid job: {exc}")
+        if "job_id" in body:
+            if self.job_store is None:
+                raise ApiError(400, "No job store configured; send the job inline")
+            try:
+                return self.job_store.load(body["job_id"])
+            except (OSError, ValueError):
+                raise ApiError(404, f"Job {body['job_id']!r} not found")
+        return None
+
+    def _well(self, body):
+        """(casing list, CT sections or None, CT OD mm) from inline geometry or a job."""
+        job = self._job(body)
+        if job is not None:
+            ct = calcs.active_string(job)
+            if not ct or not len(ct["sections"]):
+                raise ApiError(422, "Job has no active CT string with sections")
+            return job["well"]["casing"], ct["sections"], float(ct["sections"][0]["od"])
+
+        if "casing" not in body:
+            raise ApiError(400, "Send 'casing' with 'ct_od_mm' / 'ct_sections', or a 'job' / 'job_id'")
+
+        sections = body.get("ct_sections")
+        if "ct_od_mm" in body:
+            ct_od_mm = float(body["ct_od_mm"])
+        elif sections:
+            ct_od_mm = float(sections[0]["od"])
+        else:
+            raise ApiError(400, "'ct_od_mm' or 'ct_sections' is required")
+        return body["casing"], sections, ct_od_mm
+
+    # --- Endpoints ---
+    def flow(self, body):
+        casing, sections, ct_od_mm = self._well(body)
+        geom = geometry_for(casing, ct_od_mm)
+        depths = _array(body, "depths")
+        rates = _array(body, "rates_m3_min")
+
+        results = []
+        for rate in rates:
+            sweep = depth_sweep(geom, depths, float(rate))
+            results.append({
+                "rate_m3_min": float(rate),
+                "annular_velocity_m_min": sweep["annular_velocity_m_min"],
+                "bottoms_up_min": sweep["bottoms_up_min"]
+            })
+        return {"depths": depths, "results": results}
+
+    def volumes(self, body):
+        casing, sections, ct_od_mm = self._well(body)
+        geom = geometry_for(casing, ct_od_mm)
+        depths = _array(body, "depths")
+
+        ct_summary = calcs.ct_string_summary(sections) if sections is not None and len(sections) else None
+        ct_length = ct_summary["total_length"] if ct_summary else None
+        sweep = depth_sweep(geom, depths, 0.0, ct_length)
+
+        out = {
+            "depths": depths,
+            "hole_m3": sweep["hole_m3"],
+            "annular_m3": sweep["annular_m3"],
+            "ct_displacement_m3": sweep["ct_displacement_m3"]
+        }
+        if ct_summary:
+            out["ct_internal_m3"] = ct_summary["internal_volume"]
+            out["ct_length_m"] = ct_length
+            out["total_circulating_m3"] = ct_summary["internal_volume"] + sweep["annular_m3"]
+        return out
+
+    def fluids(self, body):
+        items = body["fluids"] if "fluids" in body else [body]
+        densities = []
+        for item in items:
+            if "base_density" not in item:
+                raise ApiError(400, "'base_density' is required")
+            densities.append(calcs.blended_density(float(item["base_density"]), item.get("chemicals", [])))
+        return {"blended_density_kg_m3": densities}
+
+    def pressure(self, body):
+        densities = _array(body, "densities")
+        depths = _array(body, "depths")
+        # rows: densities, columns: depths
+        p_kpa = calcs.hydrostatic_pa(densities[:, None], depths[None, :]) / 1000.0
+        return {
+            "densities": densities,
+            "depths": depths,
+            "hydrostatic_kpa": p_kpa,
+            "gradient_kpa_m": densities * calcs.G / 1000.0
+        }
+
+    def batch(self, body):
+        requests = body.get("requests")
+        if not isinstance(requests, list):
+            raise ApiError(400, "'requests' must be a list")
+
+        responses = []
+        for req in requests:
+            if isinstance(req, dict):
+                status, payload = self.dispatch(req.get("endpoint"), req, nested=True)
+            else:
+                status, payload = 400, {"error": "Each batch request must be a JSON object"}
+            responses.append({"status": status, **payload})
+        return {"responses": responses}
+
+    def dispatch(self, path, body, nested=False):
+        handler = self.routes.get(path)
+        if handler is None or (nested and path == "/batch"):
+            return 404, {"error": f"Unknown endpoint {path!r}"}
+        if not isinstance(body, dict):
+            return 400, {"error": "Request body must be a JSON object"}
+        try:
+            return 200, {"result": _jsonable(handler(body))}
+        except ApiError as exc:
+            return exc.status, {"error": str(exc)}
+        except (KeyError, TypeError, ValueError) as exc:
+            return 400, {"error": f"{type(exc).__name__}: {exc}"}
+
+
+# =========================
+# HTTP SERVER (asyncio streams, keep-alive)
+# =========================
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 422: "Unprocessable Entity"}
+
+
+async def _handle(api, reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+
+            try:
+                method, path, version = request_line.decode("latin-1").split()
+            except ValueError:
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                length = int(headers.get("content-length", 0))
+            except ValueError:
+                length = -1
+            if length < 0:
+                # no way to find where the body ends, so the connection can't be reused
+                status, payload = 400, {"error": "Invalid Content-Length"}
+                keep_alive = False
+            elif length > MAX_BODY:
+                status, payload = 413, {"error": "Request body too large"}
+                keep_alive = False
+            else:
+                raw = await reader.readexactly(length) if length else b""
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                path = path.split("?", 1)[0]
+
+                if method == "GET" and path == "/health":
+                    status, payload = 200, {"status": "ok"}
+                elif method != "POST":
+                    status, payload = 405, {"error": "Use POST"}
+                else:
+                    try:
+                        body = json.loads(raw or b"{}")
+                    except ValueError:
+                        status, payload = 400, {"error": "Body is not valid JSON"}
+                    else:
+                        status, payload = api.dispatch(path, body)
+
+            data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=8765, job_dir=None):
+    api = CalcApi(JobStore(job_dir) if job_dir else None)
+    server = await asyncio.start_server(lambda r, w: _handle(api, r, w), host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local WellOps calculation API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--jobs", default=os.environ.get("WELLOPS_JOB_DIR"), help="Job store folder for job_id lookups")
+    args = parser.parse_args(argv)
+
+    print(f"WellOps API on http://{args.host}:{args.port}")
+    asyncio.run(serve(args.host, args.port, args.jobs))
+
+
+if __name__ == "__main__":
+    main()
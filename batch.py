@@ -0,0 +1,101 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from calcs import evaluate_job
+from job_store import JobStore
+from model import migrate
+
+
+# =========================
+# HEADLESS BATCH RUNNER
+# =========================
+# python batch.py jobs/ other_jobs/*.json -o fleet.csv --rate 0.5 --workers 8
+
+def _collect(paths):
+    """(store_dir | None, job path or id) for every job found under the given paths."""
+    specs = []
+    for p in map(Path, paths):
+        if p.is_dir() and (p / "index.json").exists():
+            specs.extend((str(p), j["id"]) for j in JobStore(p).list_jobs())
+        elif p.is_dir():
+            specs.extend((None, str(f)) for f in sorted(p.glob("*.json")))
+        else:
+            specs.append((None, str(p)))
+    return specs
+
+
+def _load(spec):
+    store_dir, ref = spec
+    if store_dir is not None:
+        return JobStore(store_dir).load(ref)
+
+    data = json.loads(Path(ref).read_text(encoding="utf-8"))
+    return migrate(data["job"] if "job" in data and "version" in data else data)
+
+
+def _run_one(args):
+    spec, rate_m3_min, depth_m = args
+    source = spec[1] if spec[0] is None else f"{spec[0]}:{spec[1]}"
+    try:
+        row = evaluate_job(_load(spec), rate_m3_min, depth_m)
+        row["error"] = None
+    except Exception as exc:  # one bad job should not sink the fleet report
+        row = {"error": f"{type(exc).__name__}: {exc}"}
+    return {"source": source, **row}
+
+
+def run(paths, rate_m3_min=0.0, depth_m=None, workers=None):
+    specs = _collect(paths)
+    tasks = [(spec, rate_m3_min, depth_m) for spec in specs]
+
+    if workers == 1 or len(tasks) < 2:
+        return [_run_one(t) for t in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_one, tasks, chunksize=max(1, len(tasks) // (4 * (workers or os.cpu_count() or 1)))))
+
+
+def write_rows(rows, out_path):
+    out_path = Path(out_path)
+
+    if out_path.suffix == ".parquet":
+        try:
+            import pandas as pd
+        except ImportError:
+            sys.exit("Parquet output needs pandas + pyarrow; use a .csv output instead.")
+        pd.DataFrame(rows).to_parquet(out_path, index=False)
+        return
+
+    fields = []
+    for row in rows:
+        fields.extend(k for k in row if k not in fields)
+
+    with out_path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run WellOps calculations over many saved jobs.")
+    parser.add_argument("paths", nargs="+", help="Job store folders, folders of job .json files, or job files")
+    parser.add_argument("-o", "--output", default="jobs_report.csv", help="Output .csv or .parquet")
+    parser.add_argument("--rate", type=float, default=0.0, help="Pump rate (m³/min) for velocity / bottoms-up")
+    parser.add_argument("--depth", type=float, default=None, help="Evaluation depth (m); defaults to each job's TD")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    rows = run(args.paths, args.rate, args.depth, args.workers)
+    write_rows(rows, args.output)
+
+    failed = sum(1 for r in rows if r.get("error"))
+    print(f"{len(rows)} jobs -> {args.output}" + (f" ({failed} failed)" if failed else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import hashlib
+import io
+import os
+import tempfile
+from pathlib import Path
+
+
+# =========================
+# CONTENT-ADDRESSED BLOB STORE
+# =========================
+# <root>/objects/ab/abcdef...   file bytes, named by SHA-256 (deduplicated)
+# <root>/thumbs/<hash>_<w>.png  lazily generated thumbnails
+#
+# Jobs only hold {"hash", "name", "type"}; the bytes live on disk once.
+
+CHUNK = 1 << 20
+IMAGE_TYPES = {"png", "jpg", "jpeg"}
+
+
+class BlobStore:
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.thumbs = self.root / "thumbs"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.thumbs.mkdir(parents=True, exist_ok=True)
+
+    def path(self, digest: str) -> Path:
+        if len(digest) != 64 or not all(ch in "0123456789abcdef" for ch in digest):
+            raise ValueError(f"Invalid blob hash: {digest!r}")
+        return self.objects / digest[:2] / digest
+
+    def exists(self, digest: str) -> bool:
+        return self.path(digest).exists()
+
+    def put(self, fileobj) -> str:
+        """Stream a file-like object into the store and return its hash."""
+        sha = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.objects)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for chunk in iter(lambda: fileobj.read(CHUNK), b""):
+                    sha.update(chunk)
+                    out.write(chunk)
+
+            digest = sha.hexdigest()
+            target = self.path(digest)
+            if target.exists():
+                os.unlink(tmp)
+            else:
+                target.parent.mkdir(exist_ok=True)
+                os.replace(tmp, target)
+            return digest
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def put_bytes(self, data: bytes) -> str:
+        return self.put(io.BytesIO(data))
+
+    def read(self, digest: str) -> bytes:
+        return self.path(digest).read_bytes()
+
+    def thumbnail(self, digest: str, file_type: str, width: int = 480):
+        """PNG thumbnail bytes for image blobs, generated on first request; None otherwise."""
+        if file_type.lower() not in IMAGE_TYPES:
+            return None
+
+        thumb = self.thumbs / f"{digest}_{width}.png"
+        if not thumb.exists():
+            try:
+                from PIL import Image
+            except ImportError:
+                return None
+
+            with Image.open(self.path(digest)) as img:
+                img.thumbnail((width, width * 4))
+                fd, tmp = tempfile.mkstemp(dir=self.thumbs, suffix=".png")
+                with os.fdopen(fd, "wb") as out:
+                    img.save(out, format="PNG")
+                os.replace(tmp, thumb)
+
+        return thumb.read_bytes()
@@ -0,0 +1,66 @@
+import hashlib
+import json
+from collections import OrderedDict
+
+
+# =========================
+# PER-SESSION CALCULATION CACHE
+# =========================
+
+def _content(obj):
+    # NumPy arrays (CT sections, casing) hash by their bytes: str() would
+    # abbreviate a long array with "..."
+    if hasattr(obj, "tobytes"):
+        return [str(obj.dtype), hashlib.sha1(obj.tobytes()).hexdigest()]
+    return str(obj)
+
+
+def stable_hash(obj) -> str:
+    """Order-independent hash of job data (dicts / lists / numbers / str / arrays)."""
+    payload = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=_content)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class CalcCache:
+    """Small LRU of derived results, keyed by (tag, hash of inputs).
+
+    The tag names the part of the job the inputs come from ("ct", "well",
+    "fluids") so a mutation there can drop every entry derived from it.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, tag: str, inputs, fn):
+        key = (tag, stable_hash(inputs))
+
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        value = fn()
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, tag: str = None):
+        if tag is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == tag]:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0
+        }
@@ -0,0 +1,153 @@
+import math
+
+import numpy as np
+
+from model import active_string, sections_array
+
+
+# =========================
+# CT STRING
+# =========================
+
+def ct_string_summary(sections):
+    """Per-section ID / areas / volumes plus string totals (sections whip -> core)."""
+    arr = sections_array(sections)
+    id_mm = arr["od"] - 2.0 * arr["wall"]
+
+    area_id = math.pi * (np.maximum(id_mm, 0.0) / 1000.0 / 2.0) ** 2
+    area_od = math.pi * (arr["od"] / 1000.0 / 2.0) ** 2
+
+    vol_internal = area_id * arr["length"]
+    vol_disp = area_od * arr["length"]
+
+    rows = [
+        {
+            "id_mm": i,
+            "area_id": a_id,
+            "area_od": a_od,
+            "internal_volume": v_id,
+            "displacement_volume": v_od
+        }
+        for i, a_id, a_od, v_id, v_od in zip(
+            id_mm.tolist(), area_id.tolist(), area_od.tolist(), vol_internal.tolist(), vol_disp.tolist()
+        )
+    ]
+
+    return {
+        "sections": rows,
+        "total_length": float(arr["length"].sum()),
+        "internal_volume": float(vol_internal.sum()),
+        "displacement_volume": float(vol_disp.sum())
+    }
+
+
+def section_volumes(sec) -> dict:
+    """ct_string_summary row for one section, for patching totals after a single edit."""
+    sec_len = float(sec["length"])
+    od_mm = float(sec["od"])
+    id_mm = od_mm - 2.0 * float(sec["wall"])
+    area_id = math.pi * (max(id_mm, 0.0) / 1000.0 / 2.0) ** 2
+    area_od = math.pi * (od_mm / 1000.0 / 2.0) ** 2
+    return {
+        "id_mm": id_mm,
+        "area_id": area_id,
+        "area_od": area_od,
+        "internal_volume": area_id * sec_len,
+        "displacement_volume": area_od * sec_len
+    }
+
+
+# =========================
+# FLUIDS
+# =========================
+
+def blended_density(base_density: float, chemicals) -> float:
+    """Density (kg/m³) of 1 m³ base fluid with chemicals dosed in L/m³."""
+    total_volume = 1.0  # 1 m³ reference
+    total_mass = base_density * total_volume
+
+    for chem in chemicals:
+        chem_vol = chem["rate"] / 1000  # L → m³
+        total_volume += chem_vol
+        total_mass += chem_vol * chem["density"]
+
+    return total_mass / total_volume
+
+
+# =========================
+# HYDROSTATIC
+# =========================
+
+G = 9.80665  # m/s²
+
+
+def hydrostatic_pa(rho: float, depth_m: float) -> float:
+    return rho * G * depth_m
+
+
+# =========================
+# WHOLE JOB (headless)
+# =========================
+
+def evaluate_job(job, rate_m3_min: float = 0.0, depth_m: float = None) -> dict:
+    """One flat row of the page calculations for a job; missing inputs give None.
+
+    Volumes and velocity are evaluated at depth_m (default TD) for the active string.
+    """
+    from geometry import geometry_for
+
+    well = job["well"]
+    fluids = job["fluids"]
+    ct = active_string(job)
+
+    row = {
+        "name": job["meta"].get("name"),
+        "ct_string": ct["name"] if ct else None,
+        "td_m": well.get("td"),
+        "tvd_m": well.get("tvd"),
+        "depth_m": None,
+        "rate_m3_min": rate_m3_min,
+        "ct_length_m": None,
+        "ct_internal_m3": None,
+        "ct_displacement_total_m3": None,
+        "hole_m3": None,
+        "annular_m3": None,
+        "ct_displacement_m3": None,
+        "total_circulating_m3": None,
+        "annular_velocity_m_min": None,
+        "bottoms_up_min": None,
+        "base_density_kg_m3": fluids.get("density"),
+        "blended_density_kg_m3": None,
+        "hydrostatic_kpa": None
+    }
+
+    if ct and len(ct["sections"]):
+        summary = ct_string_summary(ct["sections"])
+        row["ct_length_m"] = summary["total_length"]
+        row["ct_internal_m3"] = summary["internal_volume"]
+        row["ct_displacement_total_m3"] = summary["displacement_volume"]
+
+        depth = depth_m if depth_m is not None else well.get("td")
+        if len(well["casing"]) and depth is not None:
+            depth = float(depth)
+            geom = geometry_for(well["casing"], ct["sections"][0]["od"])
+            hole, ann = geom.hole_and_annular_to_depth(depth)
+            ann_area = geom.annular_area_at(depth)
+
+            row["depth_m"] = depth
+            row["hole_m3"] = hole
+            row["annular_m3"] = ann
+            row["ct_displacement_m3"] = geom.ct_od_area * min(depth, summary["total_length"])
+            row["total_circulating_m3"] = summary["internal_volume"] + ann
+            if rate_m3_min > 0:
+                if ann_area:
+                    row["annular_velocity_m_min"] = rate_m3_min / ann_area
+                row["bottoms_up_min"] = geom.bottoms_up_min(depth, rate_m3_min)
+
+    if fluids.get("density"):
+        rho = blended_density(float(fluids["density"]), fluids.get("chemicals", []))
+        row["blended_density_kg_m3"] = rho
+        if well.get("tvd"):
+            row["hydrostatic_kpa"] = hydrostatic_pa(rho, float(well["tvd"])) / 1000.0
+
+    return row
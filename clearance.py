@@ -0,0 +1,95 @@
+import numpy as np
+
+
+# =========================
+# RESTRICTION CLEARANCE (range-minimum index)
+# =========================
+# The well is flattened into depth-ordered pieces: casing intervals split at
+# every restriction, plus a zero-length piece per restriction. Starts and ends
+# are then both sorted, so the pieces touching [a, b] are one contiguous index
+# range found by two binary searches, and a sparse table answers the minimum ID
+# over that range in O(1).
+
+class ClearanceIndex:
+
+    def __init__(self, geom, restrictions=()):
+        points = sorted(
+            (float(r["depth"]), float(r["id"]), r.get("name") or "Restriction")
+            for r in restrictions if r.get("id")
+        )
+        point_depths = [p[0] for p in points]
+
+        pieces = []
+        for top, bottom, id_mm in zip(geom.tops, geom.bottoms, geom.ids_mm):
+            name = f"Casing/liner {top:.0f}–{bottom:.0f} m"
+            cuts = [d for d in point_depths if top < d < bottom]
+            for a, b in zip([top] + cuts, cuts + [bottom]):
+                pieces.append((a, b, id_mm, name))
+        pieces.extend((d, d, id_mm, name) for d, id_mm, name in points)
+        pieces.sort(key=lambda p: (p[0], p[1]))
+
+        if not pieces:
+            raise ValueError("Clearance needs casing geometry or restrictions.")
+
+        self.starts = np.array([p[0] for p in pieces])
+        self.ends = np.array([p[1] for p in pieces])
+        self.ids_mm = np.array([p[2] for p in pieces])
+        self.names = [p[3] for p in pieces]
+
+        # sparse table of argmin indices: level k covers 2**k pieces
+        n = len(self.ids_mm)
+        self._table = [np.arange(n)]
+        width = 1
+        while 2 * width <= n:
+            prev = self._table[-1]
+            left, right = prev[:n - 2 * width + 1], prev[width:n - width + 1]
+            self._table.append(np.where(self.ids_mm[left] <= self.ids_mm[right], left, right))
+            width *= 2
+
+        # running minimum from surface, for "how deep can this OD go"
+        self._prefix_min = np.minimum.accumulate(self.ids_mm)
+
+    def _range(self, top, bottom):
+        lo = np.searchsorted(self.ends, top, side="left")
+        hi = np.searchsorted(self.starts, bottom, side="right") - 1
+        return lo, hi
+
+    def _argmin(self, lo, hi):
+        lo, hi = np.asarray(lo), np.asarray(hi)
+        empty = hi < lo
+        span = np.where(empty, 1, hi - lo + 1)
+        k = np.floor(np.log2(span)).astype(int)
+
+        out = np.full(np.shape(lo), -1)
+        for level in np.unique(k[~empty]):
+            sel = ~empty & (k == level)
+            table = self._table[level]
+            a = table[lo[sel]]
+            b = table[hi[sel] - (1 << level) + 1]
+            out[sel] = np.where(self.ids_mm[a] <= self.ids_mm[b], a, b)
+        return out
+
+    def min_id(self, top, bottom):
+        """Smallest ID (mm) between two depths; scalars or arrays. NaN where nothing is known."""
+        idx = self._argmin(*self._range(top, bottom))
+        result = np.where(idx >= 0, self.ids_mm[np.maximum(idx, 0)], np.nan)
+        return float(result) if result.ndim == 0 else result
+
+    def tightest(self, top, bottom):
+        """The controlling restriction between two depths, or None."""
+        i = int(self._argmin(*self._range(top, bottom)))
+        if i < 0:
+            return None
+        return {"name": self.names[i], "depth": float(self.starts[i]), "id_mm": float(self.ids_mm[i])}
+
+    def max_reach(self, od_mm, min_clearance_mm: float = 0.0):
+        """Deepest depth an OD (scalar or array) reaches from surface: the top of the first
+        piece it cannot pass, or the deepest known depth if it clears everything."""
+        need = np.asarray(od_mm, dtype=float) + min_clearance_mm
+        # prefix minimum is non-increasing, so search it negated
+        i = np.searchsorted(-self._prefix_min, -need, side="left")
+        reach = np.where(i < len(self.starts), self.starts[np.minimum(i, len(self.starts) - 1)], self.ends[-1])
+        return float(reach) if reach.ndim == 0 else reach
+
+    def can_pass(self, od_mm, depth_m, min_clearance_mm: float = 0.0):
+        return bool(self.min_id(0.0, depth_m) > od_mm + min_clearance_mm)
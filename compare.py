@@ -0,0 +1,82 @@
+import numpy as np
+
+import hydraulics
+from geometry import geometry_for, depth_sweep, CTStringIndex
+
+
+# =========================
+# CT STRING COMPARISON
+# =========================
+# Every string in the job is evaluated against the same casing in one call.
+# Strings that share a whip OD share the annulus, so the geometry index and the
+# depth sweep are built once per OD and reused.
+
+CRITERIA = {
+    "internal_m3": ("Smallest internal volume", False),
+    "min_annular_velocity_m_min": ("Highest annular velocity", True),
+    "bottoms_up_min": ("Shortest bottoms-up", False),
+    "pump_pressure_kpa": ("Lowest pump pressure", False),
+    "burst_margin_kpa": ("Largest burst margin", True)
+}
+
+
+def compare_strings(strings, casing, depth_m: float, rate_m3_min: float, fluid=None,
+                    reel_core_diameter_m: float = 2.4, whp_kpa: float = 0.0, points: int = 200):
+    """One row per CT string (plus its annular velocity profile) at the same depth and rate."""
+    depths = np.linspace(0.0, depth_m, points)
+    by_od = {}
+    rows = []
+
+    for i, ct in enumerate(strings):
+        sections = ct.get("sections")
+        if sections is None or not len(sections):
+            continue
+
+        od = float(sections[0]["od"])
+        if od not in by_od:
+            geom = geometry_for(casing, od)
+            by_od[od] = (geom, depth_sweep(geom, depths, rate_m3_min))
+        geom, sweep = by_od[od]
+
+        index = CTStringIndex(sections)
+        run = min(depth_m, index.length)
+        annular = float(sweep["annular_m3"][-1])
+        velocity = sweep["annular_velocity_m_min"]
+
+        row = {
+            "index": i,
+            "name": ct["name"],
+            "length_m": index.length,
+            "whip_od_mm": od,
+            "reaches_depth": index.length >= depth_m,
+            "internal_m3": index.internal_total,
+            "displacement_m3": index.displacement_to(run),
+            "annular_m3": annular,
+            "circulating_m3": index.internal_total + annular,
+            "min_annular_velocity_m_min": float(np.nanmin(velocity)) if np.isfinite(velocity).any() else None,
+            "bottoms_up_min": annular / rate_m3_min if rate_m3_min > 0 else None,
+            "pump_pressure_kpa": None,
+            "burst_kpa": (ct.get("ratings") or {}).get("burst"),
+            "burst_margin_kpa": None,
+            "velocity_profile": velocity
+        }
+
+        if fluid is not None and rate_m3_min > 0:
+            curve = hydraulics.pump_pressure_curve(
+                fluid, sections, geom, run, [rate_m3_min], reel_core_diameter_m, whp_kpa
+            )
+            row["pump_pressure_kpa"] = float(curve["pump_pressure_kpa"][0])
+            if row["burst_kpa"]:
+                row["burst_margin_kpa"] = row["burst_kpa"] - row["pump_pressure_kpa"]
+
+        rows.append(row)
+
+    return {"depth": depths, "rows": rows}
+
+
+def rank(rows, criterion: str):
+    """Rows best-first by a CRITERIA key; strings missing the value go last."""
+    _, descending = CRITERIA[criterion]
+    have = [r for r in rows if r[criterion] is not None]
+    missing = [r for r in rows if r[criterion] is None]
+    return sorted(have, key=lambda r: r[criterion], reverse=descending) + missing
@@ -0,0 +1,58 @@
+import numpy as np
+
+
+# =========================
+# HOLE-CLEANING OPERATING ENVELOPE
+# =========================
+# With the CT tip at depth D, returns travel up the annulus from D to surface,
+# so the slowest point is the largest annular area above D. Everything below
+# is driven by a running maximum of annular area down the geometry index.
+
+def _controlling_interval(geom, depths):
+    depths = np.asarray(depths, dtype=float)
+    areas = geom.ann_areas_a
+
+    if len(geom) == 0:
+        return depths, np.full(depths.shape, -1), np.zeros_like(depths)
+
+    run_max = np.maximum.accumulate(areas)
+    idx = np.arange(len(areas))
+    run_arg = np.maximum.accumulate(np.where(areas == run_max, idx, 0))
+
+    k = np.searchsorted(geom.tops_a, depths, side="right") - 1
+    above = k < 0
+    k = np.clip(k, 0, None)
+
+    ctrl = np.where(above, -1, run_arg[k])
+    max_area = np.where(above, 0.0, run_max[k])
+    return depths, ctrl, max_area
+
+
+def required_rate(geom, depths, min_velocity_m_min):
+    """Minimum pump rate (m³/min) to hold the target annular velocity to each depth.
+
+    Returns a dict with the rate, the controlling interval index into the geometry
+    (-1 above the first casing) and that interval's casing ID.
+    """
+    depths, ctrl, max_area = _controlling_interval(geom, depths)
+    # Trailing NaN so index -1 (no controlling interval) maps to NaN
+    ids = np.append(np.asarray(geom.ids_mm, dtype=float), np.nan)
+
+    return {
+        "depth": depths,
+        "rate_m3_min": min_velocity_m_min * max_area,
+        "controlling_index": ctrl,
+        "controlling_id_mm": ids[ctrl]
+    }
+
+
+def velocity_grid(geom, rates_m3_min, depths):
+    """Minimum annular velocity (m/min) over surface -> depth for every rate × depth.
+
+    Shape is (len(rates), len(depths)); NaN where there is no open annulus above depth.
+    """
+    rates = np.asarray(rates_m3_min, dtype=float)
+    _, _, max_area = _controlling_interval(geom, depths)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(max_area > 0, rates[:, None] / max_area[None, :], np.nan)
@@ -0,0 +1,206 @@
+import json
+import math
+import os
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from model import sections_array
+
+
+# =========================
+# CT FATIGUE (per-metre damage map)
+# =========================
+# Each reel keeps an accumulated Miner's-rule damage value per resolution_m of
+# string, measured from the whip end, in a memory-mapped float64 file. A trip
+# adds damage only to the metres that were run out, so updates are incremental
+# and never replay history; trims/deletes shift the map with the string. The
+# exact string length is kept in meta.json and the map always has
+# ceil(length / resolution) cells, so short trims add up instead of each one
+# costing a whole cell.
+#
+# Low-cycle life per bending event (Coffin–Manson style, derated for pressure):
+#     N = C · ε^(−m) · (1 − σhoop/σy)^k,   ε = OD / bend diameter
+# A round trip bends each metre run out 6 times: off/on the reel (2) and
+# over/off the gooseneck both ways (4).
+
+LIFE_C = 0.6
+LIFE_M = 2.0
+PRESSURE_K = 2.0
+REEL_EVENTS = 2
+GOOSENECK_EVENTS = 4
+
+
+def bending_strain(od_mm, bend_diameter_m):
+    return np.asarray(od_mm, dtype=float) / 1000.0 / bend_diameter_m
+
+
+def cycles_to_failure(strain, hoop_ratio):
+    derate = np.clip(1.0 - np.asarray(hoop_ratio, dtype=float), 1e-3, 1.0) ** PRESSURE_K
+    return LIFE_C * np.asarray(strain, dtype=float) ** -LIFE_M * derate
+
+
+def trip_damage(sections, n, resolution_m, pressure_kpa, gooseneck_d_m, reel_d_m, yield_mpa=620.0):
+    """Damage per metre (first n cells from the whip) for one round trip at pressure_kpa."""
+    arr = sections_array(sections)
+    edges = np.concatenate(([0.0], np.cumsum(arr["length"])))
+    od = arr["od"]
+    wall = arr["wall"]
+
+    hoop_mpa = pressure_kpa / 1000.0 * (od - 2.0 * wall) / (2.0 * wall)
+    per_section = (
+        REEL_EVENTS / cycles_to_failure(bending_strain(od, reel_d_m), hoop_mpa / yield_mpa)
+        + GOOSENECK_EVENTS / cycles_to_failure(bending_strain(od, gooseneck_d_m), hoop_mpa / yield_mpa)
+    )
+
+    mid = (np.arange(n) + 0.5) * resolution_m
+    k = np.clip(np.searchsorted(edges, mid, side="right") - 1, 0, len(arr) - 1)
+    return per_section[k]
+
+
+class FatigueMap:
+
+    def __init__(self, root, length_m: float, resolution_m: float = 1.0):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._meta_file = self.root / "meta.json"
+        self._data_file = self.root / "damage.f8"
+
+        if self._meta_file.exists():
+            self.meta = json.loads(self._meta_file.read_text(encoding="utf-8"))
+            self.resolution_m = float(self.meta["resolution_m"])
+            self._open(self.meta["cells"])
+        else:
+            # new reel: undamaged over the string's current length
+            self.meta = {"resolution_m": resolution_m, "cells": 0, "length_m": float(length_m), "trips": 0, "log": []}
+            self.resolution_m = float(resolution_m)
+            self._open(self._cells(length_m))
+            self.flush()
+        # maps written before the exact length was kept
+        self.meta.setdefault("length_m", self.cells * self.resolution_m)
+
+        # Opening never reshapes the saved history. A string that differs from the
+        # map by a cell or more (edited before tracking began, or in another job
+        # on the same reel) is reported here; the caller decides where to
+        # remove() or insert() pipe to line them up.
+        self.mismatch_m = float(length_m) - self.length_m
+        if abs(self.mismatch_m) < self.resolution_m and self._cells(length_m) == self.cells:
+            # same cells, so only the recorded length was off (e.g. a map from
+            # before the exact length was kept); saved with the next write
+            self.meta["length_m"] = float(length_m)
+            self.mismatch_m = 0.0
+
+    def _cells(self, length_m):
+        return int(math.ceil(round(length_m / self.resolution_m, 6)))
+
+    def _open(self, cells):
+        self.cells = cells
+        if cells == 0:
+            self._data = np.zeros(0)
+            return
+        mode = "r+" if self._data_file.exists() else "w+"
+        self._data = np.memmap(self._data_file, dtype="f8", mode=mode, shape=(cells,))
+
+    def _resize(self, new):
+        # write the new layout beside the old one, then swap it in
+        tmp = self._data_file.with_suffix(".tmp")
+        if len(new):
+            out = np.memmap(tmp, dtype="f8", mode="w+", shape=(len(new),))
+            out[:] = new
+            out.flush()
+            del out
+            self._data = None
+            os.replace(tmp, self._data_file)
+        elif self._data_file.exists():
+            self._data = None
+            self._data_file.unlink()
+        self._open(len(new))
+        self.flush()
+
+    @property
+    def length_m(self):
+        return float(self.meta["length_m"])
+
+    @property
+    def damage(self):
+        return self._data[:self.cells]
+
+    def distance(self):
+        """Distance from the whip (m) at the centre of every cell."""
+        return (np.arange(self.cells) + 0.5) * self.resolution_m
+
+    # --- Usage ---
+    def record(self, sections, depth_m, pressure_kpa, trips: int = 1, gooseneck_d_m: float = 2.44,
+               reel_d_m: float = 2.4, yield_mpa: float = 620.0, start_m: float = 0.0):
+        """Add damage for trips that ran the string out to depth_m (cycling from start_m if set)."""
+        lo = int(start_m // self.resolution_m)
+        hi = min(self._cells(depth_m), self.cells)
+        if hi <= lo or trips <= 0:
+            return 0.0
+
+        per_trip = trip_damage(sections, hi, self.resolution_m, pressure_kpa, gooseneck_d_m, reel_d_m, yield_mpa)
+        self._data[lo:hi] += trips * per_trip[lo:]
+
+        self.meta["trips"] += trips
+        self.meta["log"].append({
+            "time": datetime.utcnow().isoformat(timespec="seconds"),
+            "depth_m": depth_m,
+            "start_m": start_m,
+            "pressure_kpa": pressure_kpa,
+            "trips": trips,
+            "gooseneck_d_m": gooseneck_d_m,
+            "reel_d_m": reel_d_m
+        })
+        self.flush()
+        return float(self._data[lo:hi].max())
+
+    # --- String edits ---
+    def _boundary(self, offset_m):
+        # nearest cell boundary to a point on the string
+        return min(int(round(offset_m / self.resolution_m)), self.cells)
+
+    def remove(self, offset_m: float, length_m: float):
+        """Cut length_m of pipe starting offset_m from the whip (trim or section delete)."""
+        length_m = min(max(float(length_m), 0.0), self.length_m)
+        self.meta["length_m"] = self.length_m - length_m
+        n = self.cells - self._cells(self.length_m)
+        if n <= 0:
+            self.flush()
+            return
+        lo = min(self._boundary(offset_m), self.cells - n)
+        self._resize(np.concatenate([self.damage[:lo], self.damage[lo + n:]]))
+
+    def insert(self, offset_m: float, length_m: float):
+        """New (undamaged) pipe spliced in offset_m from the whip."""
+        self.meta["length_m"] = self.length_m + max(float(length_m), 0.0)
+        n = self._cells(self.length_m) - self.cells
+        if n <= 0:
+            self.flush()
+            return
+        at = self._boundary(offset_m)
+        self._resize(np.concatenate([self.damage[:at], np.zeros(n), self.damage[at:]]))
+
+    def flush(self):
+        if self.cells and isinstance(self._data, np.memmap):
+            self._data.flush()
+        self.meta["cells"] = self.cells
+        tmp = self._meta_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.meta), encoding="utf-8")
+        os.replace(tmp, self._meta_file)
+
+    def section_summary(self, sections):
+        """Max damage and where it sits, per section (whip -> core)."""
+        rows = []
+        start = 0.0
+        for length in sections_array(sections)["length"].tolist():
+            end = start + length
+            lo, hi = int(start // self.resolution_m), min(self._cells(end), self.cells)
+            chunk = self.damage[lo:hi]
+            if len(chunk):
+                i = int(chunk.argmax())
+                rows.append({"max_damage": float(chunk[i]), "at_m": (lo + i + 0.5) * self.resolution_m})
+            else:
+                rows.append({"max_damage": 0.0, "at_m": None})
+            start = end
+        return rows
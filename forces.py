@@ -0,0 +1,173 @@
+import math
+
+import numpy as np
+
+import calcs
+from model import sections_array
+
+
+# =========================
+# SOFT-STRING FORCES (Johancsik) + BUCKLING
+# =========================
+# Axial (effective) force is marched from the CT tip to surface over dz-long
+# elements, tension positive:
+#     F_top = F_bottom + w·dz·cos(inc) ± μ·Fn      (+ pulling out, − running in)
+#     Fn    = √((F·Δazi·sin inc)² + (F·Δinc + w·dz·sin inc)²)
+# Compression above the helical limit adds Mitchell's wall contact r·F²/(4EI).
+# Every tip depth is marched at once: step j handles the element j metres above
+# the tip for all tip depths, which sit at well elements 0 .. n-1-j.
+
+STEEL_E_PA = 207e9
+STEEL_DENSITY = 7850.0
+HELICAL_FACTOR = 2.0 * math.sqrt(2.0)
+
+
+def _string_profile(sections, n, dz, rho_in, rho_out):
+    """Per-element (from the whip) buoyed weight N/m, EI, OD area and OD (m)."""
+    arr = sections_array(sections)
+    edges = np.concatenate(([0.0], np.cumsum(arr["length"])))
+    od = arr["od"] / 1000.0
+    id_ = np.maximum(od - 2.0 * arr["wall"] / 1000.0, 0.0)
+
+    mid = (np.arange(n) + 0.5) * dz
+    k = np.clip(np.searchsorted(edges, mid, side="right") - 1, 0, len(arr) - 1)
+
+    a_od = math.pi / 4.0 * od ** 2
+    a_id = math.pi / 4.0 * id_ ** 2
+    weight = calcs.G * (STEEL_DENSITY * (a_od - a_id) + rho_in * a_id - rho_out * a_od)
+    ei = STEEL_E_PA * math.pi / 64.0 * (od ** 4 - id_ ** 4)
+
+    return {"section": k, "w": weight[k], "ei": ei[k], "a_od": a_od[k], "od": od[k]}
+
+
+def _well_profile(geom, survey, n, dz):
+    """Per-element (from surface) inclination terms and radial clearance to the hole."""
+    md = np.arange(n + 1) * dz
+    if survey is None:
+        inc = np.zeros(n + 1)
+        azi = np.zeros(n + 1)
+    else:
+        inc = np.asarray(survey.inc_at(md), dtype=float)
+        azi = np.asarray(survey.azi_at(md), dtype=float)
+
+    inc_mid = 0.5 * (inc[:-1] + inc[1:])
+
+    # below the last interval the deepest ID is assumed to continue (open hole)
+    k = np.clip(np.searchsorted(geom.tops_a, md[:-1] + 0.5 * dz, side="right") - 1, 0, len(geom) - 1)
+    hole_id = np.asarray(geom.ids_mm, dtype=float)[k] / 1000.0
+
+    return {
+        "md": md,
+        "inc": inc_mid,
+        "sin": np.sin(inc_mid),
+        "cos": np.cos(inc_mid),
+        "dinc": np.diff(inc),
+        "dazi": np.diff(azi),
+        "hole_id": hole_id
+    }
+
+
+def _buckling_limits(w, ei, sin_inc, clearance):
+    # Dawson–Paslay sinusoidal limit, floored by the vertical-well limit; helical = 2√2 × sinusoidal
+    w = np.maximum(w, 1e-6)
+    f_sin = np.maximum(2.0 * np.sqrt(ei * w * sin_inc / clearance), 2.55 * np.cbrt(ei * w ** 2))
+    return f_sin, HELICAL_FACTOR * f_sin
+
+
+def _step(f, w, dz, sin_i, cos_i, dinc, dazi, mu, direction, ei, clearance, f_hel):
+    fn = np.hypot(f * dazi * sin_i, f * dinc + w * dz * sin_i)
+    compression = np.maximum(-f, 0.0)
+    fn += (compression > f_hel) * (clearance * dz / (4.0 * ei)) * compression ** 2
+    return f + w * dz * cos_i + direction * mu * fn
+
+
+def force_sweep(sections, geom, survey=None, mu_rih=0.25, mu_pooh=0.25, rho_in=1000.0, rho_out=1000.0,
+                whp_kpa=0.0, tip_load_n=0.0, max_depth_m=None, dz=1.0, max_snub_n=None):
+    """Surface weight running in and pulling out for every tip depth (every dz) in one march.
+
+    Surface weight is the hook load on the injector: positive = string pulls,
+    negative = injector must snub. Lockup is flagged where the running-in
+    compression diverges (surface weight becomes NaN) or exceeds max_snub_n.
+    """
+    ct_length = float(sections_array(sections)["length"].sum())
+    max_depth_m = min(ct_length, max_depth_m or ct_length)
+    n = int(max_depth_m // dz)
+    if n < 1:
+        raise ValueError("CT must be run at least one step into the well.")
+
+    ct = _string_profile(sections, n, dz, rho_in, rho_out)
+    well = _well_profile(geom, survey, n, dz)
+
+    # row 0 running in, row 1 pulling out
+    f = np.full((2, n), float(tip_load_n))
+    mu = np.array([[mu_rih], [mu_pooh]])
+    direction = np.array([[-1.0], [1.0]])
+    worst = np.zeros(n)            # largest running-in compression / sinusoidal limit ratio
+
+    # clearance and buckling limits only change with the section, so tabulate them per section
+    limits = {}
+    for s in np.unique(ct["section"]):
+        j = int(np.argmax(ct["section"] == s))
+        clearance = np.maximum((well["hole_id"] - ct["od"][j]) / 2.0, 1e-4)
+        limits[s] = (clearance, *_buckling_limits(ct["w"][j], ct["ei"][j], well["sin"], clearance))
+
+    for j in range(n):
+        k = slice(0, n - j)        # well elements under string element j, for tips j .. n-1
+        w, ei = ct["w"][j], ct["ei"][j]
+        terms = (well["sin"][k], well["cos"][k], well["dinc"][k], well["dazi"][k])
+        clearance, f_sin, f_hel = (a[k] for a in limits[ct["section"][j]])
+
+        with np.errstate(over="ignore", invalid="ignore"):
+            f[:, j:] = _step(f[:, j:], w, dz, *terms, mu, direction, ei, clearance, f_hel)
+
+        np.fmax(worst[j:], -f[0, j:] / f_sin, out=worst[j:])
+
+    # wellhead pressure pushes the CT out of the well through the stripper
+    snub = whp_kpa * 1000.0 * ct["a_od"]
+    rih_surface = f[0] - snub
+    pooh_surface = f[1] - snub
+
+    lockup = ~np.isfinite(f[0]) | (f[0] < -1e9)
+    if max_snub_n is not None:
+        lockup |= rih_surface < -abs(max_snub_n)
+
+    return {
+        "tip_md": (np.arange(n) + 1) * dz,
+        "rih_surface_n": rih_surface,
+        "pooh_surface_n": pooh_surface,
+        "buckling_ratio": worst,
+        "sinusoidal": worst > 1.0,
+        "helical": worst > HELICAL_FACTOR,
+        "lockup": lockup
+    }
+
+
+def force_profile(sections, geom, tip_md, survey=None, mu=0.25, direction=-1.0, rho_in=1000.0,
+                  rho_out=1000.0, tip_load_n=0.0, dz=1.0):
+    """Axial force along the string (tip -> surface) for one tip depth, with buckling limits."""
+    n = int(tip_md // dz)
+    if n < 1:
+        raise ValueError("CT must be run at least one step into the well.")
+
+    ct = _string_profile(sections, n, dz, rho_in, rho_out)
+    well = _well_profile(geom, survey, n, dz)
+
+    k = np.arange(n)[::-1]         # string element j sits at well element n-1-j
+    clearance = np.maximum((well["hole_id"][k] - ct["od"]) / 2.0, 1e-4)
+    f_sin, f_hel = _buckling_limits(ct["w"], ct["ei"], well["sin"][k], clearance)
+
+    force = np.empty(n + 1)
+    force[0] = tip_load_n
+    with np.errstate(over="ignore", invalid="ignore"):
+        for j in range(n):
+            i = k[j]
+            force[j + 1] = _step(force[j], ct["w"][j], dz, well["sin"][i], well["cos"][i], well["dinc"][i],
+                                 well["dazi"][i], mu, direction, ct["ei"][j], clearance[j], f_hel[j])
+
+    # reorder top-down so it lines up with MD
+    return {
+        "md": well["md"],
+        "force_n": force[::-1],
+        "sinusoidal_n": np.concatenate([f_sin[::-1], f_sin[:1]]),
+        "helical_n": np.concatenate([f_hel[::-1], f_hel[:1]])
+    }
@@ -0,0 +1,178 @@
+import numpy as np
+
+
+# =========================
+# FLUID FRONT TRACKING (event-driven)
+# =========================
+# Pumped fluid enters the CT at the reel core, travels to the whip end (CT tip)
+# and returns up the annulus to surface. The path is piecewise constant in area,
+# so volume -> position is piecewise linear between "knots" (CT section
+# boundaries, the tip, casing ID changes). Fronts only need evaluating at knots
+# and stage changes; everything in between is interpolation.
+
+class FluidPath:
+
+    def __init__(self, ct_index, geom, tip_depth_m: float):
+        self.ct_length = ct_index.length
+        self.tip_depth = min(float(tip_depth_m), ct_index.length)
+        self.ct_volume = ct_index.internal_total
+
+        s, v, labels = [], [], []
+
+        # CT leg: core (distance = length) -> whip (distance 0)
+        for x in sorted(set(ct_index.edges), reverse=True):
+            s.append(self.ct_length - x)
+            v.append(self.ct_volume - ct_index.internal_to(x))
+            if x == self.ct_length:
+                labels.append("CT core (pump in)")
+            elif x == 0.0:
+                labels.append(f"CT tip ({self.tip_depth:.0f} m)")
+            else:
+                labels.append(f"CT section boundary ({x:.0f} m from whip)")
+
+        # Annulus leg: tip depth -> surface
+        ann_at_tip = geom.annular_volume_to(self.tip_depth)
+        edges = {e for e in geom.tops + geom.bottoms if 0.0 < e < self.tip_depth}
+        for depth in sorted(edges, reverse=True) + [0.0]:
+            s.append(self.ct_length + self.tip_depth - depth)
+            v.append(self.ct_volume + ann_at_tip - geom.annular_volume_to(depth))
+            labels.append("Surface returns" if depth == 0.0 else f"Annulus {depth:.0f} m")
+
+        self.knots_s = np.asarray(s, dtype=float)
+        self.knots_v = np.asarray(v, dtype=float)
+        self.labels = labels
+
+    @property
+    def volume(self):
+        return float(self.knots_v[-1])
+
+    def positions(self, travelled_m3):
+        """Where fluid that has travelled the given volume(s) into the path is."""
+        travelled = np.atleast_1d(np.asarray(travelled_m3, dtype=float))
+        s = np.interp(travelled, self.knots_v, self.knots_s)
+
+        out = []
+        for v, si in zip(travelled, s):
+            if v < 0:
+                out.append({"leg": "not pumped", "depth_m": None, "distance_from_whip_m": None})
+            elif v >= self.volume:
+                out.append({"leg": "returned", "depth_m": 0.0, "distance_from_whip_m": None})
+            elif si <= self.ct_length:
+                x = self.ct_length - si
+                out.append({
+                    "leg": "CT",
+                    "depth_m": float(self.tip_depth - x) if x <= self.tip_depth else None,
+                    "distance_from_whip_m": float(x)
+                })
+            else:
+                out.append({
+                    "leg": "annulus",
+                    "depth_m": float(self.tip_depth - (si - self.ct_length)),
+                    "distance_from_whip_m": None
+                })
+        return out
+
+
+class PumpSchedule:
+    """Stages pumped in order: [{"name", "volume_m3", "rate_m3_min"}].
+
+    A stage with zero rate is a pause and needs "duration_min".
+    """
+
+    def __init__(self, stages):
+        self.stages = stages
+        volumes, durations = [], []
+        for st in stages:
+            rate = float(st.get("rate_m3_min") or 0.0)
+            if rate > 0:
+                volumes.append(float(st["volume_m3"]))
+                durations.append(volumes[-1] / rate)
+            else:
+                volumes.append(0.0)
+                durations.append(float(st["duration_min"]))
+
+        self.start_volume = np.concatenate([[0.0], np.cumsum(volumes)])
+        self.start_time = np.concatenate([[0.0], np.cumsum(durations)])
+        # pauses put no new fluid in the path, so they have no front of their own
+        self.pumped = np.asarray(volumes) > 0
+
+    @property
+    def total_volume(self):
+        return float(self.start_volume[-1])
+
+    @property
+    def total_time(self):
+        return float(self.start_time[-1])
+
+    def pumped_at(self, time_min):
+        return np.interp(time_min, self.start_time, self.start_volume)
+
+    def time_at(self, pumped_m3):
+        """Earliest time each pumped volume is reached (pauses don't pump)."""
+        pumped = np.asarray(pumped_m3, dtype=float)
+        k = np.clip(np.searchsorted(self.start_volume, pumped, side="left"), 1, len(self.start_volume) - 1)
+        v0, v1 = self.start_volume[k - 1], self.start_volume[k]
+        t0, t1 = self.start_time[k - 1], self.start_time[k]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.where(v1 > v0, (pumped - v0) / (v1 - v0), 1.0)
+        return np.where(pumped <= 0.0, 0.0, t0 + frac * (t1 - t0))
+
+
+class FrontSimulation:
+
+    def __init__(self, path: FluidPath, schedule: PumpSchedule):
+        self.path = path
+        self.schedule = schedule
+        self.events = self._events()
+
+    def _events(self):
+        sched = self.schedule
+        n = len(sched.stages)
+        front_start = sched.start_volume[:n]
+
+        # every front passing every knot, in one broadcast
+        reach = front_start[:, None] + self.path.knots_v[None, 1:]
+        front_idx, knot_idx = np.nonzero((reach <= sched.total_volume + 1e-12) & sched.pumped[:, None])
+        reach = reach[front_idx, knot_idx]
+        times = sched.time_at(reach)
+
+        events = [
+            {
+                "time_min": float(sched.start_time[k]),
+                "pumped_m3": float(sched.start_volume[k]),
+                "event": "stage start",
+                "stage": sched.stages[k]["name"],
+                "where": self.path.labels[0]
+            }
+            for k in range(n)
+        ]
+        events += [
+            {
+                "time_min": float(t),
+                "pumped_m3": float(v),
+                "event": "front passes",
+                "stage": sched.stages[f]["name"],
+                "where": self.path.labels[j + 1]
+            }
+            for f, j, v, t in zip(front_idx, knot_idx, reach, times)
+        ]
+        events.sort(key=lambda e: (e["time_min"], e["pumped_m3"]))
+        return events
+
+    def fronts_at(self, time_min=None, pumped_m3=None):
+        """Leading-edge position of every stage at a time or total pumped volume."""
+        sched = self.schedule
+        if pumped_m3 is None:
+            pumped_m3 = float(sched.pumped_at(time_min))
+
+        n = len(sched.stages)
+        travelled = pumped_m3 - sched.start_volume[:n]
+        return [
+            {"stage": st["name"], "travelled_m3": max(float(v), 0.0), **pos}
+            for st, v, pos, pumped in zip(sched.stages, travelled, self.path.positions(travelled), sched.pumped)
+            if pumped
+        ]
+
+
+def simulate(ct_index, geom, tip_depth_m, stages) -> FrontSimulation:
+    return FrontSimulation(FluidPath(ct_index, geom, tip_depth_m), PumpSchedule(stages))
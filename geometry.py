@@ -0,0 +1,294 @@
+import math
+import heapq
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+import numpy as np
+
+from model import casing_array, sections_array
+
+
+# =========================
+# WELLBORE GEOMETRY INDEX
+# =========================
+
+def casing_key(casing):
+    """Stable, hashable form of job["well"]["casing"]."""
+    return tuple(casing_array(casing).tolist())
+
+
+class WellGeometry:
+    """Sorted interval index over the casing / liner list.
+
+    Overlapping strings (liner inside casing) are resolved to the smallest ID at
+    each depth, and cumulative hole / annular volumes are stored at the top of
+    every interval so volume-to-depth is one bisect plus a partial interval.
+    """
+
+    def __init__(self, intervals, ct_od_mm):
+        self.ct_od_mm = float(ct_od_mm)
+        ct_od_m = self.ct_od_mm / 1000.0
+        self.ct_od_area = math.pi * (ct_od_m / 2.0) ** 2
+
+        self.tops = []
+        self.bottoms = []
+        self.ids_mm = []
+        self.hole_areas = []
+        self.ann_areas = []
+        self.cum_hole = []   # hole volume surface -> tops[k]
+        self.cum_ann = []    # annular volume surface -> tops[k]
+
+        for top, bottom, id_mm in _effective_intervals(intervals):
+            if self.tops and self.bottoms[-1] == top and self.ids_mm[-1] == id_mm:
+                self.bottoms[-1] = bottom
+                continue
+            self.tops.append(top)
+            self.bottoms.append(bottom)
+            self.ids_mm.append(id_mm)
+
+        hole_total = 0.0
+        ann_total = 0.0
+        for top, bottom, id_mm in zip(self.tops, self.bottoms, self.ids_mm):
+            casing_id_m = id_mm / 1000.0
+            hole_area = math.pi * (casing_id_m / 2.0) ** 2
+            ann_area = max(hole_area - self.ct_od_area, 0.0)
+
+            self.hole_areas.append(hole_area)
+            self.ann_areas.append(ann_area)
+            self.cum_hole.append(hole_total)
+            self.cum_ann.append(ann_total)
+
+            hole_total += hole_area * (bottom - top)
+            ann_total += ann_area * (bottom - top)
+
+        self.hole_total = hole_total
+        self.ann_total = ann_total
+
+        # cumulative volumes at each interval bottom, for inverse (volume -> depth) lookups
+        self.cum_hole_end = self.cum_hole[1:] + [hole_total]
+        self.cum_ann_end = self.cum_ann[1:] + [ann_total]
+
+        # NumPy views of the index for batch (multi-depth) queries
+        self.tops_a = np.asarray(self.tops, dtype=float)
+        self.bottoms_a = np.asarray(self.bottoms, dtype=float)
+        self.ann_areas_a = np.asarray(self.ann_areas, dtype=float)
+        self.hole_areas_a = np.asarray(self.hole_areas, dtype=float)
+        self.cum_hole_a = np.asarray(self.cum_hole, dtype=float)
+        self.cum_ann_a = np.asarray(self.cum_ann, dtype=float)
+
+    def __len__(self):
+        return len(self.tops)
+
+    @property
+    def bottom(self):
+        return self.bottoms[-1] if self.bottoms else 0.0
+
+    # --- Point lookups ---
+    def interval_at(self, depth_m: float):
+        k = bisect_right(self.tops, depth_m) - 1
+        if k < 0 or depth_m > self.bottoms[k]:
+            return None
+        return k
+
+    def casing_id_at(self, depth_m: float):
+        k = self.interval_at(depth_m)
+        return None if k is None else self.ids_mm[k]
+
+    def annular_area_at(self, depth_m: float):
+        k = self.interval_at(depth_m)
+        return None if k is None else self.ann_areas[k]
+
+    # --- Volumes to depth ---
+    def _to_depth(self, depth_m: float, cum, areas):
+        k = bisect_right(self.tops, depth_m) - 1
+        if k < 0:
+            return 0.0
+        seg_end = min(depth_m, self.bottoms[k])
+        return cum[k] + areas[k] * (seg_end - self.tops[k])
+
+    def hole_volume_to(self, depth_m: float) -> float:
+        return self._to_depth(depth_m, self.cum_hole, self.hole_areas)
+
+    def annular_volume_to(self, depth_m: float) -> float:
+        return self._to_depth(depth_m, self.cum_ann, self.ann_areas)
+
+    def hole_and_annular_to_depth(self, depth_m: float):
+        return self.hole_volume_to(depth_m), self.annular_volume_to(depth_m)
+
+    def depth_at_volume(self, volume_m3: float, annular: bool = True):
+        """Shallowest depth at which the cumulative (annular or hole) volume reaches volume_m3."""
+        if not self.tops:
+            return None
+        cum = self.cum_ann if annular else self.cum_hole
+        cum_end = self.cum_ann_end if annular else self.cum_hole_end
+        areas = self.ann_areas if annular else self.hole_areas
+
+        k = bisect_left(cum_end, volume_m3)
+        if k == len(cum_end):
+            return None
+        if areas[k] <= 0 or volume_m3 <= cum[k]:
+            return self.tops[k]
+        return self.tops[k] + (volume_m3 - cum[k]) / areas[k]
+
+    def bottoms_up_min(self, depth_m: float, rate_m3_min: float):
+        if rate_m3_min <= 0:
+            return None
+        return self.annular_volume_to(depth_m) / rate_m3_min
+
+    def segments_to(self, depth_m: float):
+        """Intervals from surface to depth with a positive annulus."""
+        segments = []
+        last = bisect_right(self.tops, depth_m)
+        for k in range(last):
+            seg_end = min(depth_m, self.bottoms[k])
+            if seg_end <= self.tops[k] or self.ann_areas[k] <= 0:
+                continue
+            segments.append({
+                "from": self.tops[k],
+                "to": seg_end,
+                "len": seg_end - self.tops[k],
+                "id_mm": self.ids_mm[k],
+                "ann_area": self.ann_areas[k]
+            })
+        return segments
+
+
+# =========================
+# CT STRING INDEX
+# =========================
+
+class CTStringIndex:
+    """Cumulative internal / displacement volume along a CT string, measured from the whip end.
+
+    sections are ordered whip -> core, as stored in job["ct"]["strings"][i]["sections"]
+    or as a model.SECTION_DTYPE array.
+    """
+
+    def __init__(self, sections):
+        arr = sections_array(sections)
+        id_m = np.maximum(arr["od"] - 2.0 * arr["wall"], 0.0) / 1000.0
+        id_areas = math.pi * (id_m / 2.0) ** 2
+        od_areas = math.pi * (arr["od"] / 1000.0 / 2.0) ** 2
+
+        # bisect on plain lists stays faster than NumPy for the scalar lookups below
+        self.edges = [0.0] + np.cumsum(arr["length"]).tolist()      # distance from whip at each boundary
+        self.id_areas = id_areas.tolist()
+        self.od_areas = od_areas.tolist()
+        self.cum_internal = [0.0] + np.cumsum(id_areas * arr["length"]).tolist()    # internal volume whip -> edges[k]
+        self.cum_displacement = [0.0] + np.cumsum(od_areas * arr["length"]).tolist()
+
+    @property
+    def length(self):
+        return self.edges[-1]
+
+    @property
+    def internal_total(self):
+        return self.cum_internal[-1]
+
+    def _to(self, distance_m, cum, areas):
+        distance_m = min(max(distance_m, 0.0), self.length)
+        k = min(bisect_right(self.edges, distance_m) - 1, len(areas) - 1)
+        if k < 0:
+            return 0.0
+        return cum[k] + areas[k] * (distance_m - self.edges[k])
+
+    def internal_to(self, distance_m: float) -> float:
+        return self._to(distance_m, self.cum_internal, self.id_areas)
+
+    def displacement_to(self, distance_m: float) -> float:
+        return self._to(distance_m, self.cum_displacement, self.od_areas)
+
+    def distance_at_internal_volume(self, volume_m3: float):
+        """Distance from whip at which the internal volume (from whip) reaches volume_m3."""
+        if volume_m3 > self.internal_total:
+            return None
+        k = max(bisect_right(self.cum_internal, volume_m3) - 1, 0)
+        k = min(k, len(self.id_areas) - 1)
+        if self.id_areas[k] <= 0:
+            return self.edges[k]
+        return self.edges[k] + (volume_m3 - self.cum_internal[k]) / self.id_areas[k]
+
+
+# =========================
+# MULTI-DEPTH SWEEP
+# =========================
+
+def depth_sweep(geom, depths, rate_m3_min=0.0, ct_length_m=None):
+    """Volumes, annular velocity and bottoms-up for an array of depths in one pass.
+
+    Returns a dict of equal-length arrays. Velocity is NaN where no casing covers
+    the depth or the annulus is closed; rate-dependent columns are NaN at zero rate.
+    """
+    depths = np.asarray(depths, dtype=float)
+
+    if len(geom) == 0:
+        zeros = np.zeros_like(depths)
+        nan = np.full_like(depths, np.nan)
+        hole = ann = zeros
+        ann_area = nan
+    else:
+        k = np.searchsorted(geom.tops_a, depths, side="right") - 1
+        above = k < 0
+        k = np.clip(k, 0, None)
+
+        seg_end = np.minimum(depths, geom.bottoms_a[k])
+        partial = np.where(above, 0.0, seg_end - geom.tops_a[k])
+
+        hole = np.where(above, 0.0, geom.cum_hole_a[k] + geom.hole_areas_a[k] * partial)
+        ann = np.where(above, 0.0, geom.cum_ann_a[k] + geom.ann_areas_a[k] * partial)
+
+        covered = ~above & (depths <= geom.bottoms_a[k])
+        ann_area = np.where(covered, geom.ann_areas_a[k], np.nan)
+
+    run_len = depths if ct_length_m is None else np.minimum(depths, float(ct_length_m))
+    ct_disp = geom.ct_od_area * run_len
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if rate_m3_min > 0:
+            vel = np.where(ann_area > 0, rate_m3_min / ann_area, np.nan)
+            bottoms_up = ann / rate_m3_min
+        else:
+            vel = np.full_like(depths, np.nan)
+            bottoms_up = np.full_like(depths, np.nan)
+
+    return {
+        "depth": depths,
+        "hole_m3": hole,
+        "annular_m3": ann,
+        "ct_displacement_m3": ct_disp,
+        "annular_velocity_m_min": vel,
+        "bottoms_up_min": bottoms_up
+    }
+
+
+def _effective_intervals(intervals):
+    # Sweep the interval edges top-down, keeping the covering strings in a
+    # min-heap on ID so each elementary interval gets the innermost ID.
+    cleaned = sorted(
+        (max(0.0, top), bottom, id_mm)
+        for top, bottom, id_mm in intervals
+        if bottom > max(0.0, top) and id_mm > 0
+    )
+    edges = sorted({e for top, bottom, _ in cleaned for e in (top, bottom)})
+
+    heap = []
+    i = 0
+    for start, end in zip(edges, edges[1:]):
+        while i < len(cleaned) and cleaned[i][0] <= start:
+            top, bottom, id_mm = cleaned[i]
+            heapq.heappush(heap, (id_mm, bottom))
+            i += 1
+        while heap and heap[0][1] <= start:
+            heapq.heappop(heap)
+        if heap:
+            yield start, end, heap[0][0]
+
+
+@lru_cache(maxsize=32)
+def _cached_geometry(key, ct_od_mm):
+    return WellGeometry(key, ct_od_mm)
+
+
+def geometry_for(casing, ct_od_mm):
+    """Geometry index for a casing list, rebuilt only when the casing or CT OD changes."""
+    return _cached_geometry(casing_key(casing), float(ct_od_mm))
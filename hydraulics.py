@@ -0,0 +1,143 @@
+import math
+
+import numpy as np
+
+from model import sections_array
+
+
+# =========================
+# FRICTIONAL PRESSURE LOSS
+# =========================
+# Every model is reduced to a laminar wall shear stress τw for the geometry
+# (pipe, or annulus as a slot with dh = D - d). The generalised Reynolds number
+# is Re = 8 ρ v² / τw_lam, which is ρvd/μ for a Newtonian pipe and the
+# Metzner–Reed number for power-law fluids. Above the critical Re the turbulent
+# Fanning factor gives τw = f ρ v² / 2, and dp/dL = 4 τw / dh.
+#
+# fluid = {"model": "newtonian",  "density", "viscosity"}      (kg/m³, Pa·s)
+#         {"model": "power_law",  "density", "k", "n"}         (Pa·sⁿ)
+#         {"model": "bingham",    "density", "pv", "yp"}       (Pa·s, Pa)
+
+MODELS = ("newtonian", "power_law", "bingham")
+
+
+def _laminar_wall_shear(fluid, v, dh, annulus):
+    model = fluid["model"]
+    shear_rate = (12.0 if annulus else 8.0) * v / dh
+
+    if model == "newtonian":
+        return float(fluid["viscosity"]) * shear_rate
+    if model == "power_law":
+        n = float(fluid["n"])
+        correction = (2 * n + 1) / (3 * n) if annulus else (3 * n + 1) / (4 * n)
+        return float(fluid["k"]) * (correction * shear_rate) ** n
+    if model == "bingham":
+        # Buckingham approximation: pipe τy·4/3, slot τy·3/2
+        return float(fluid["pv"]) * shear_rate + float(fluid["yp"]) * (1.5 if annulus else 4.0 / 3.0)
+    raise ValueError(f"Unknown rheology model: {model!r}")
+
+
+def _turbulent_fanning(fluid, re):
+    if fluid["model"] == "power_law":
+        # Dodge–Metzner, explicit form
+        n = float(fluid["n"])
+        a = (math.log10(n) + 3.93) / 50.0
+        b = (1.75 - math.log10(n)) / 7.0
+        return a / re ** b
+    return 0.0791 / re ** 0.25  # Blasius, smooth pipe
+
+
+def _critical_re(fluid):
+    if fluid["model"] == "power_law":
+        return 3470.0 - 1370.0 * float(fluid["n"])
+    return 2100.0
+
+
+def wall_shear(fluid, v, dh, annulus=False, coil_ratio=0.0):
+    """Wall shear stress (Pa) and Reynolds number for velocities v (m/s).
+
+    coil_ratio = d / D_coil applies the Mishra–Gupta curvature correction to
+    pipe wound on a reel (laminar via the Dean number, turbulent additive term).
+    """
+    v = np.asarray(v, dtype=float)
+    rho = float(fluid["density"])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tau_lam = _laminar_wall_shear(fluid, v, dh, annulus)
+        re = np.where(tau_lam > 0, 8.0 * rho * v ** 2 / tau_lam, 0.0)
+        f_turb = np.where(re > 0, _turbulent_fanning(fluid, np.maximum(re, 1.0)), 0.0)
+
+        if coil_ratio > 0:
+            dean = re * math.sqrt(coil_ratio)
+            tau_lam = tau_lam * np.where(dean > 11.6, 1.0 + 0.033 * np.log10(np.maximum(dean, 1.0)) ** 4, 1.0)
+            f_turb = f_turb + 0.0075 * math.sqrt(coil_ratio)
+
+        tau_turb = f_turb * rho * v ** 2 / 2.0
+
+    turbulent = re > _critical_re(fluid)
+    return np.where(turbulent, np.maximum(tau_lam, tau_turb), tau_lam), re
+
+
+def pipe_gradient(fluid, rates_m3_min, id_m, coil_diameter_m=None):
+    """Friction gradient (Pa/m) inside a pipe for an array of pump rates."""
+    area = math.pi * (id_m / 2.0) ** 2
+    v = np.asarray(rates_m3_min, dtype=float) / 60.0 / area
+    coil_ratio = id_m / coil_diameter_m if coil_diameter_m else 0.0
+    tau, _ = wall_shear(fluid, v, id_m, annulus=False, coil_ratio=coil_ratio)
+    return 4.0 * tau / id_m
+
+
+def annulus_gradient(fluid, rates_m3_min, outer_id_m, inner_od_m):
+    """Friction gradient (Pa/m) in a concentric annulus for an array of pump rates."""
+    dh = outer_id_m - inner_od_m
+    area = math.pi / 4.0 * (outer_id_m ** 2 - inner_od_m ** 2)
+    rates = np.asarray(rates_m3_min, dtype=float)
+    if dh <= 0 or area <= 0:
+        return np.full(rates.shape, np.nan)
+    v = rates / 60.0 / area
+    tau, _ = wall_shear(fluid, v, dh, annulus=True)
+    return 4.0 * tau / dh
+
+
+def pump_pressure_curve(fluid, ct_sections, geom, run_depth_m, rates_m3_min,
+                        reel_core_diameter_m=None, whp_kpa=0.0):
+    """Friction (kPa) along the CT (on reel and in hole) and annulus for every rate.
+
+    CT sections are whip -> core: the first run_depth_m metres from the whip are
+    in the hole (straight), the rest is still wound on the reel.
+    """
+    rates = np.atleast_1d(np.asarray(rates_m3_min, dtype=float))
+    ct_straight = np.zeros_like(rates)
+    ct_reel = np.zeros_like(rates)
+
+    start = 0.0
+    arr = sections_array(ct_sections)
+    for length, od, wall in zip(arr["length"].tolist(), arr["od"].tolist(), arr["wall"].tolist()):
+        id_m = max(od - 2.0 * wall, 0.0) / 1000.0
+        in_hole = min(max(run_depth_m - start, 0.0), length)
+        on_reel = length - in_hole
+        start += length
+        if id_m <= 0:
+            continue
+
+        if in_hole > 0:
+            ct_straight += pipe_gradient(fluid, rates, id_m) * in_hole
+        if on_reel > 0:
+            ct_reel += pipe_gradient(fluid, rates, id_m, reel_core_diameter_m) * on_reel
+
+    annulus = np.zeros_like(rates)
+    ct_od_m = geom.ct_od_mm / 1000.0
+    for seg in geom.segments_to(run_depth_m):
+        annulus += annulus_gradient(fluid, rates, seg["id_mm"] / 1000.0, ct_od_m) * seg["len"]
+
+    ct_straight /= 1000.0
+    ct_reel /= 1000.0
+    annulus /= 1000.0
+
+    return {
+        "rate_m3_min": rates,
+        "ct_reel_kpa": ct_reel,
+        "ct_in_hole_kpa": ct_straight,
+        "annulus_kpa": annulus,
+        "pump_pressure_kpa": ct_reel + ct_straight + annulus + whp_kpa
+    }
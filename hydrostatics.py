@@ -0,0 +1,58 @@
+import numpy as np
+
+import calcs
+
+
+# =========================
+# MULTI-COLUMN HYDROSTATIC PROFILE
+# =========================
+# A column stack is [{"name", "density" (kg/m³), "top_md" (m)}, ...]; each fluid
+# runs from its top to the next column's top (the last one to bottom). Pressure is
+# integrated against TVD, so columns are located by MD and converted through the
+# survey when there is one.
+
+class FluidColumns:
+
+    def __init__(self, columns, tvd_at=None, surface_pressure_kpa: float = 0.0):
+        columns = sorted(columns, key=lambda c: float(c["top_md"]))
+        if not columns:
+            raise ValueError("At least one fluid column is required.")
+
+        self.names = [c.get("name") or f"Fluid {i + 1}" for i, c in enumerate(columns)]
+        self.top_md = np.array([float(c["top_md"]) for c in columns])
+        self.top_md[0] = 0.0  # the shallowest fluid fills to surface
+
+        self.tvd_at = tvd_at or (lambda md: np.asarray(md, dtype=float))
+        self.top_tvd = np.asarray(self.tvd_at(self.top_md), dtype=float)
+
+        # per-column gradient (kPa per m TVD) and pressure at each column top
+        self.gradient_kpa_m = np.array([float(c["density"]) for c in columns]) * calcs.G / 1000.0
+        dp = self.gradient_kpa_m[:-1] * np.diff(self.top_tvd)
+        self.top_pressure_kpa = surface_pressure_kpa + np.concatenate([[0.0], np.cumsum(dp)])
+
+    def column_at(self, md):
+        return np.clip(np.searchsorted(self.top_md, md, side="right") - 1, 0, len(self.top_md) - 1)
+
+    def pressure_at(self, md, tvd=None):
+        """Pressure (kPa) at MD (scalar or array); pass tvd if it is already known."""
+        md = np.asarray(md, dtype=float)
+        tvd = np.asarray(self.tvd_at(md) if tvd is None else tvd, dtype=float)
+        k = self.column_at(md)
+        return self.top_pressure_kpa[k] + self.gradient_kpa_m[k] * (tvd - self.top_tvd[k])
+
+
+def pressure_profile(md, ct_columns: FluidColumns, ann_columns: FluidColumns, tvd_at=None):
+    """CT, annulus and differential (CT - annulus) pressure in kPa at every MD in one pass."""
+    md = np.asarray(md, dtype=float)
+    tvd = np.asarray(tvd_at(md), dtype=float) if tvd_at is not None else md
+
+    p_ct = ct_columns.pressure_at(md, tvd)
+    p_ann = ann_columns.pressure_at(md, tvd)
+
+    return {
+        "md": md,
+        "tvd": tvd,
+        "ct_kpa": p_ct,
+        "annulus_kpa": p_ann,
+        "differential_kpa": p_ct - p_ann
+    }
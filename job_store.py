@@ -0,0 +1,243 @@
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from model import migrate, records
+
+
+# =========================
+# LOCAL JOB STORE
+# =========================
+# <root>/index.json        {id: {name, last_modified}} — the job list, read alone
+# <root>/<id>.json         versioned snapshot {"version", "job"}
+# <root>/<id>.journal      append-only JSON lines of {"op", "path", "value"}
+#
+# Jobs are upgraded to the current model.SCHEMA_VERSION as they load, which
+# also turns their sections / casing into structured arrays; saving turns them
+# back into lists of dicts.
+# Saving diffs the job against what is already on disk and appends only the
+# changed subtrees; the journal is folded into the snapshot once it gets long.
+# One store is shared by every session on the server, so index and journal
+# writes happen under a lock. The in-memory index is current after every save;
+# only its copy on disk is refreshed at most every INDEX_REFRESH_S.
+
+FORMAT_VERSION = 1
+COMPACT_AFTER = 200          # journal entries before rewriting the snapshot
+INDEX_REFRESH_S = 60.0       # min seconds between index.json rewrites
+
+
+def _stored(obj):
+    # sections / casing arrays are stored as lists of dicts; anything else that
+    # isn't JSON-able (e.g. an uploaded file object) is stored as null
+    return records(obj) if getattr(obj, "dtype", None) is not None and obj.dtype.names else None
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=_stored)
+
+
+def _plain(job):
+    return json.loads(_dumps(job))
+
+
+def _diff(old, new, path=()):
+    ops = []
+    for key in old.keys() - new.keys():
+        ops.append({"op": "del", "path": [*path, key]})
+    for key, value in new.items():
+        if key not in old:
+            ops.append({"op": "set", "path": [*path, key], "value": value})
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            ops.extend(_diff(old[key], value, (*path, key)))
+        elif old[key] != value:
+            ops.append({"op": "set", "path": [*path, key], "value": value})
+    return ops
+
+
+def _apply(job, op):
+    target = job
+    for key in op["path"][:-1]:
+        target = target.setdefault(key, {})
+    if op["op"] == "del":
+        target.pop(op["path"][-1], None)
+    else:
+        target[op["path"][-1]] = op["value"]
+
+
+def _atomic_write(path: Path, text: str):
+    # a tmp name per write, so two writers never replace each other's file
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class JobStore:
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / "index.json"
+        self._saved = {}          # job_id -> last persisted plain job
+        self._journal_len = {}    # job_id -> entries in journal
+        self._index = None
+        self._index_written = 0.0
+        self._lock = threading.RLock()
+
+    # --- Index ---
+    def _load_index(self):
+        if self._index is None:
+            try:
+                data = json.loads(self.index_path.read_text(encoding="utf-8"))
+                self._index = data["jobs"]
+            except (OSError, ValueError, KeyError):
+                self._index = self.rebuild_index()
+        return self._index
+
+    def _write_index(self):
+        _atomic_write(self.index_path, _dumps({"version": FORMAT_VERSION, "jobs": self._index}))
+        self._index_written = time.time()
+
+    def _touch_index(self, job_id, job, force=False):
+        index = self._load_index()
+        entry = index.get(job_id)
+        name = job["meta"].get("name")
+        now = time.time()
+
+        index[job_id] = {
+            "name": name,
+            "last_modified": job["meta"].get("last_modified"),
+            "saved_at": now
+        }
+        if force or entry is None or entry["name"] != name or now - self._index_written > INDEX_REFRESH_S:
+            self._write_index()
+
+    def rebuild_index(self):
+        with self._lock:
+            return self._rebuild_index()
+
+    def _rebuild_index(self):
+        index = {}
+        for snap in self.root.glob("*.json"):
+            if snap == self.index_path:
+                continue
+            try:
+                job = self.load(snap.stem)
+            except (OSError, ValueError, KeyError):
+                continue
+            index[snap.stem] = {
+                "name": job["meta"].get("name"),
+                "last_modified": job["meta"].get("last_modified"),
+                "saved_at": snap.stat().st_mtime
+            }
+        self._index = index
+        self._write_index()
+        return index
+
+    def list_jobs(self):
+        """[{id, name, last_modified}] newest first, without opening any job file."""
+        with self._lock:
+            jobs = [
+                {"id": job_id, "name": e["name"], "last_modified": e["last_modified"]}
+                for job_id, e in self._load_index().items()
+            ]
+        return sorted(jobs, key=lambda j: j["last_modified"] or "", reverse=True)
+
+    # --- Jobs ---
+    def _snapshot_path(self, job_id):
+        if not job_id.isalnum():
+            raise ValueError(f"Invalid job id: {job_id!r}")
+        return self.root / f"{job_id}.json"
+
+    def _journal_path(self, job_id):
+        return self._snapshot_path(job_id).with_suffix(".journal")
+
+    def create(self, job) -> str:
+        job_id = uuid.uuid4().hex[:12]
+        job["meta"]["last_modified"] = datetime.utcnow().isoformat()
+        with self._lock:
+            self._compact(job_id, _plain(job))
+        return job_id
+
+    def load(self, job_id):
+        # snapshot and journal are read together, so a compaction can't land in between
+        with self._lock:
+            data = json.loads(self._snapshot_path(job_id).read_text(encoding="utf-8"))
+            if data.get("version", 0) > FORMAT_VERSION:
+                raise ValueError(f"Job {job_id} was saved by a newer version ({data['version']}).")
+            job = data["job"]
+
+            entries = 0
+            journal = self._journal_path(job_id)
+            if journal.exists():
+                with journal.open("r+b") as fh:
+                    good = 0
+                    for line in fh:
+                        try:
+                            if not line.endswith(b"\n"):
+                                raise ValueError("unterminated journal line")
+                            op = json.loads(line)
+                        except ValueError:
+                            # torn final write — keep everything before it, and cut it off
+                            # so the next save() doesn't append behind an unreadable line
+                            fh.truncate(good)
+                            break
+                        _apply(job, op)
+                        entries += 1
+                        good += len(line)
+
+            self._saved[job_id] = _plain(job)
+            self._journal_len[job_id] = entries
+
+        # upgraded after _saved is taken, so the next save journals the upgrade like any edit
+        migrate(job)
+        return job
+
+    def save(self, job_id, job) -> int:
+        """Append changes since the last save; returns the number of journal entries written."""
+        with self._lock:
+            if job_id not in self._saved:
+                self.load(job_id)
+
+            old = self._saved[job_id]
+            new = _plain(job)
+            ops = _diff(old, new)
+            if not ops:
+                return 0
+
+            job["meta"]["last_modified"] = new["meta"]["last_modified"] = datetime.utcnow().isoformat()
+            ops = _diff(old, new)
+
+            with self._journal_path(job_id).open("a", encoding="utf-8") as fh:
+                fh.write("".join(_dumps(op) + "\n" for op in ops))
+
+            self._saved[job_id] = new
+            self._journal_len[job_id] = self._journal_len.get(job_id, 0) + len(ops)
+
+            if self._journal_len[job_id] > COMPACT_AFTER:
+                self._compact(job_id, new)
+            else:
+                self._touch_index(job_id, new)
+            return len(ops)
+
+    def _compact(self, job_id, plain_job):
+        _atomic_write(
+            self._snapshot_path(job_id),
+            _dumps({"version": FORMAT_VERSION, "job": plain_job})
+        )
+        self._journal_path(job_id).unlink(missing_ok=True)
+        self._saved[job_id] = plain_job
+        self._journal_len[job_id] = 0
+        self._touch_index(job_id, plain_job, force=True)
+
+    def delete(self, job_id):
+        with self._lock:
+            self._snapshot_path(job_id).unlink(missing_ok=True)
+            self._journal_path(job_id).unlink(missing_ok=True)
+            self._saved.pop(job_id, None)
+            self._journal_len.pop(job_id, None)
+            if self._load_index().pop(job_id, None) is not None:
+                self._write_index()
@@ -0,0 +1,192 @@
+import uuid
+from datetime import datetime
+from functools import lru_cache
+
+from calc_cache import stable_hash
+
+
+# =========================
+# JOB MODEL
+# =========================
+# The job is a dict of parts (meta, ct, well, fluids, settings) that pages edit
+# in place. The bulky, numeric parts -- each CT string's sections and the
+# well's casing intervals -- are held as NumPy structured arrays from the
+# moment a job is migrated, so engines read whole columns (sections["length"])
+# and a 50-section string is one 1.2 kB block instead of 50 dicts. They turn
+# back into lists of dicts only where the job is written out (records(), used
+# by the job store).
+#
+# Schema versions live in job["meta"]["schema"]:
+#   1  untagged dicts from before versioning (settings "units" / "flow_unit")
+#   2  per-quantity unit settings, schema tag
+#   3  blended density no longer stored (derived in reactive.job_graph)
+
+SCHEMA_VERSION = 3
+
+# NumPy is imported when the first job is migrated, not when model (and so
+# app.py) is imported; the dtypes are built on first use (model.SECTION_DTYPE)
+_DTYPE_FIELDS = {
+    "SECTION_DTYPE": [("length", "f8"), ("od", "f8"), ("wall", "f8")],
+    "CASING_DTYPE": [("top", "f8"), ("bottom", "f8"), ("id", "f8")]
+}
+
+
+@lru_cache(maxsize=None)
+def _dtype(name):
+    import numpy as np
+    return np.dtype(_DTYPE_FIELDS[name])
+
+
+def __getattr__(name):
+    if name in _DTYPE_FIELDS:
+        return _dtype(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def sections_array(sections):
+    """CT sections (whip -> core) as a SECTION_DTYPE array; list of dicts or array."""
+    import numpy as np
+    dtype = _dtype("SECTION_DTYPE")
+    if isinstance(sections, np.ndarray) and sections.dtype == dtype:
+        return sections
+    return np.array(
+        [(float(s["length"]), float(s["od"]), float(s["wall"])) for s in sections],
+        dtype=dtype
+    )
+
+
+def casing_array(casing):
+    """Casing / liner intervals as a CASING_DTYPE array; list of dicts or array."""
+    import numpy as np
+    dtype = _dtype("CASING_DTYPE")
+    if isinstance(casing, np.ndarray) and casing.dtype == dtype:
+        return casing
+    return np.array(
+        [(float(c["top"]), float(c["bottom"]), float(c["id"])) for c in casing],
+        dtype=dtype
+    )
+
+
+def records(arr):
+    """Structured array -> list of plain dicts (the stored / JSON form)."""
+    return [dict(zip(arr.dtype.names, row)) for row in arr.tolist()]
+
+
+def new_reel_id():
+    """Id of a physical reel; its fatigue map lives under this name."""
+    return uuid.uuid4().hex[:12]
+
+
+def survey_digest(survey):
+    """Hash of a survey's stations, stored with it so caches don't rehash every station per run."""
+    return stable_hash([survey["md"], survey["inc"], survey["azi"]])
+
+
+def _reel_name(name):
+    # how fatigue maps were named before strings carried a reel id
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+
+
+def active_string(job):
+    strings = job["ct"]["strings"]
+    if not strings:
+        return None
+    return strings[job["ct"].get("active_index") or 0]
+
+
+def default_job():
+    return {
+        "meta": {
+            "name": None,
+            "last_modified": datetime.utcnow().isoformat(),
+            "schema": SCHEMA_VERSION
+        },
+        "ct": {
+            "strings": [],
+            "active_index": None
+        },
+        "well": {
+            "tvd": None,
+            "kop": None,
+            "td": None,
+            "casing": [],
+            "restrictions": [],
+            "survey": None,
+            "schematic": None
+        },
+        "fluids": {
+            "base": None,
+            "density": None,
+            "chemicals": []
+        },
+        "settings": {
+            "theme": "dark",
+            "accent_color": "#F97316",
+            "length_unit": "m",
+            "pressure_unit": "kPa",
+            "rate_unit": "m³/min",
+            "volume_unit": "m³",
+            "force_unit": "daN",
+            "decimals": 2
+        }
+    }
+
+
+# =========================
+# MIGRATION
+# =========================
+
+def _v1_to_v2(job):
+    # the single "units"/"flow_unit" pair became one setting per quantity
+    settings = job["settings"]
+    legacy = settings.pop("units", None)
+    flow = settings.pop("flow_unit", None)
+    if "length_unit" not in settings and (legacy == "imperial" or flow == "ft/min"):
+        settings["length_unit"] = "ft"
+
+
+def _v2_to_v3(job):
+    # a stored copy went stale whenever the chemicals changed off the Fluids page
+    job.get("fluids", {}).pop("blended_density", None)
+
+
+MIGRATIONS = {1: _v1_to_v2, 2: _v2_to_v3}
+
+
+def migrate(job):
+    """Bring a job dict up to SCHEMA_VERSION in place (missing sections and keys get defaults).
+
+    Also converts CT sections and casing to structured arrays; a job that is
+    already migrated passes through unchanged.
+    """
+    meta = job.setdefault("meta", {})
+    version = meta.get("schema", 1)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Job schema {version} is newer than this version of the app ({SCHEMA_VERSION}).")
+
+    while version < SCHEMA_VERSION:
+        job.setdefault("settings", {})
+        MIGRATIONS[version](job)
+        version += 1
+    meta["schema"] = SCHEMA_VERSION
+
+    defaults = default_job()
+    for part, values in defaults.items():
+        target = job.setdefault(part, {})
+        for key, value in values.items():
+            target.setdefault(key, value)
+
+    # strings from before reel ids keep the map named after them, unless another
+    # string in the job already claimed that name
+    reels = {ct["reel_id"] for ct in job["ct"]["strings"] if ct.get("reel_id")}
+    for ct in job["ct"]["strings"]:
+        if not ct.get("reel_id"):
+            legacy = _reel_name(ct.get("name") or "")
+            ct["reel_id"] = legacy if legacy and legacy not in reels else new_reel_id()
+            reels.add(ct["reel_id"])
+        ct["sections"] = sections_array(ct["sections"] if ct.get("sections") is not None else [])
+    job["well"]["casing"] = casing_array(job["well"]["casing"])
+    survey = job["well"]["survey"]
+    if survey and not survey.get("digest"):
+        survey["digest"] = survey_digest(survey)
+    return job
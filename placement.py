@@ -0,0 +1,110 @@
+# =========================
+# PLUG / PILL PLACEMENT
+# =========================
+# Everything here is an inverse lookup on the cumulative volume indexes:
+# WellGeometry (annulus / open hole vs depth) and CTStringIndex (internal volume
+# vs distance from the whip). Depths are MD; CT tip at the plug bottom.
+
+def _solve_depth(fn, target, lo, hi, tol=1e-4):
+    # fn is non-increasing in depth over [lo, hi]: smallest depth with fn(depth) <= target
+    if fn(lo) <= target:
+        return lo
+    while hi - lo > tol:
+        mid = 0.5 * (lo + hi)
+        if fn(mid) > target:
+            lo = mid
+        else:
+            hi = mid
+    return hi
+
+
+def annular_top(geom, bottom_m: float, volume_m3: float):
+    """Top of volume_m3 sitting in the annulus above bottom_m (None if it overflows surface)."""
+    below = geom.annular_volume_to(bottom_m) - volume_m3
+    if below < 0:
+        return None
+    return geom.depth_at_volume(below, annular=True) or 0.0
+
+
+def hole_top(geom, bottom_m: float, volume_m3: float):
+    """Top of volume_m3 in the hole with no CT in it (None if it overflows surface)."""
+    below = geom.hole_volume_to(bottom_m) - volume_m3
+    if below < 0:
+        return None
+    return geom.depth_at_volume(below, annular=False) or 0.0
+
+
+def depth_reached(geom, ct_index, volume_m3: float):
+    """How far a volume pumped from surface reaches: into the CT from the reel end, down the annulus, down open hole."""
+    ct_distance = ct_index.distance_at_internal_volume(ct_index.internal_total - volume_m3) \
+        if volume_m3 <= ct_index.internal_total else None
+    return {
+        "ct_from_reel_m": None if ct_distance is None else ct_index.length - ct_distance,
+        "annulus_from_surface_m": geom.depth_at_volume(volume_m3, annular=True),
+        "hole_from_surface_m": geom.depth_at_volume(volume_m3, annular=False)
+    }
+
+
+def balanced_plug(geom, ct_index, bottom_m: float, plug_m3: float, spacer_ahead_m3: float = 0.0,
+                  pull_margin_m: float = 50.0):
+    """Balanced plug with the CT tip at bottom_m.
+
+    The plug stands at the same top inside the CT and in the annulus; the spacer
+    behind is sized to the same height as the spacer ahead so the columns balance
+    when pumping stops.
+    """
+    if bottom_m > ct_index.length:
+        raise ValueError("CT string is shorter than the plug bottom depth.")
+
+    ann_bottom = geom.annular_volume_to(bottom_m)
+
+    def plug_volume_above(top):
+        # annulus plus CT interior between top and bottom
+        return ann_bottom - geom.annular_volume_to(top) + ct_index.internal_to(bottom_m - top)
+
+    if plug_volume_above(0.0) < plug_m3:
+        raise ValueError("Plug volume exceeds the annulus and CT volume above the bottom depth.")
+
+    top = _solve_depth(plug_volume_above, plug_m3, 0.0, bottom_m)
+
+    # spacer ahead stands in the annulus above the plug; spacer behind matches its height in the CT
+    spacer_top = annular_top(geom, top, spacer_ahead_m3) if spacer_ahead_m3 > 0 else top
+    if spacer_top is None:
+        raise ValueError("Spacer ahead overflows the annulus.")
+    spacer_behind = ct_index.internal_to(bottom_m - spacer_top) - ct_index.internal_to(bottom_m - top)
+
+    # pump plug + spacer behind, then displace until the CT holds only the balanced columns
+    displacement = ct_index.internal_total - ct_index.internal_to(bottom_m - spacer_top)
+
+    # once the CT is out the plug fills the full hole and stands shorter
+    top_after_pull = hole_top(geom, bottom_m, plug_m3)
+    pull_to = max(min(top_after_pull, spacer_top) - pull_margin_m, 0.0)
+
+    return {
+        "plug_top_m": top,
+        "plug_length_m": bottom_m - top,
+        "plug_in_annulus_m3": ann_bottom - geom.annular_volume_to(top),
+        "plug_in_ct_m3": ct_index.internal_to(bottom_m - top),
+        "spacer_top_m": spacer_top,
+        "spacer_behind_m3": spacer_behind,
+        "displacement_m3": displacement,
+        "pumped_total_m3": spacer_ahead_m3 + plug_m3 + spacer_behind + displacement,
+        "top_after_pull_m": top_after_pull,
+        "pull_out_to_m": pull_to
+    }
+
+
+def spot_pill(geom, ct_index, tip_m: float, pill_m3: float):
+    """Pill pumped and displaced out of the CT tip so it sits in the annulus above tip_m."""
+    if tip_m > ct_index.length:
+        raise ValueError("CT string is shorter than the spotting depth.")
+    top = annular_top(geom, tip_m, pill_m3)
+    if top is None:
+        raise ValueError("Pill volume exceeds the annular volume above the tip.")
+    return {
+        "pill_top_m": top,
+        "pill_length_m": tip_m - top,
+        "displacement_m3": ct_index.internal_total,
+        "pumped_total_m3": pill_m3 + ct_index.internal_total,
+        "top_after_pull_m": hole_top(geom, tip_m, pill_m3)
+    }
@@ -0,0 +1,129 @@
+from calc_cache import stable_hash
+from model import active_string, sections_array
+from units import Units
+
+
+# =========================
+# REACTIVE JOB GRAPH
+# =========================
+# Inputs are parts of the job, hashed each run; derived nodes are functions of
+# named upstream nodes. A node recomputes only when read and only if an input
+# it depends on (directly or through other nodes) changed since it last ran.
+# Every node carries a version that bumps when its value is replaced, so a
+# change to the casing never touches the fluid nodes and vice versa.
+
+class Graph:
+
+    def __init__(self):
+        self._inputs = {}     # name -> (hash, value, version)
+        self._nodes = {}      # name -> (fn, deps)
+        self._values = {}     # name -> (upstream versions, value, version)
+        self.computes = 0
+
+    def input(self, name: str, value):
+        """Set an input; downstream nodes go stale only if its content changed."""
+        digest = stable_hash(value)
+        current = self._inputs.get(name)
+        if current is not None and current[0] == digest:
+            return
+        self._inputs[name] = (digest, value, (current[2] + 1) if current else 0)
+
+    def node(self, name: str, *deps):
+        """Decorator registering fn(*dep_values) as a derived node."""
+        def register(fn):
+            self._nodes[name] = (fn, deps)
+            self._values.pop(name, None)
+            return fn
+        return register
+
+    def _version(self, name):
+        if name in self._inputs:
+            return self._inputs[name][2]
+        self.get(name)
+        return self._values[name][2]
+
+    def get(self, name: str):
+        if name in self._inputs:
+            return self._inputs[name][1]
+        if name not in self._nodes:
+            raise KeyError(f"Unknown graph node: {name!r}")
+
+        fn, deps = self._nodes[name]
+        upstream = tuple(self._version(d) for d in deps)
+        cached = self._values.get(name)
+        if cached is not None and cached[0] == upstream:
+            return cached[1]
+
+        value = fn(*(self.get(d) for d in deps))
+        self.computes += 1
+        self._values[name] = (upstream, value, (cached[2] + 1) if cached else 0)
+        return value
+
+    def __getitem__(self, name: str):
+        return self.get(name)
+
+
+# =========================
+# JOB NODES
+# =========================
+
+def job_inputs(graph: Graph, job):
+    """Feed the graph the job parts derived values depend on.
+
+    Called at the top of every run, and again after an edit that is read back
+    later in the same run.
+    """
+    ct = active_string(job)
+    graph.input("ct_sections", ct["sections"] if ct else sections_array([]))
+    graph.input("casing", job["well"]["casing"])
+    graph.input("restrictions", job["well"]["restrictions"])
+    graph.input("base_density", job["fluids"].get("density"))
+    graph.input("chemicals", job["fluids"].get("chemicals") or [])
+    graph.input("settings", job["settings"])
+
+
+def job_graph():
+    """The derived quantities shared by the pages.
+
+    The engines are imported inside the nodes, so a run that reads none of
+    them (Home, Settings) never loads NumPy.
+    """
+    graph = Graph()
+
+    # the pages read derived values only from here, so each is built once per change
+    @graph.node("ct_summary", "ct_sections")
+    def _(sections):
+        import calcs
+        return calcs.ct_string_summary(sections)
+
+    @graph.node("ct_od_mm", "ct_sections")
+    def _(sections):
+        return float(sections[0]["od"]) if len(sections) else None
+
+    # annular / hole area profile vs depth for the active string's OD
+    @graph.node("geometry", "casing", "ct_od_mm")
+    def _(casing, ct_od_mm):
+        from geometry import WellGeometry, casing_key
+        return WellGeometry(casing_key(casing), ct_od_mm) if len(casing) and ct_od_mm else None
+
+    # narrowest ID over depth ranges; independent of the CT, so no OD
+    @graph.node("clearance", "casing", "restrictions")
+    def _(casing, restrictions):
+        if not len(casing) and not restrictions:
+            return None
+        from clearance import ClearanceIndex
+        from geometry import WellGeometry, casing_key
+        return ClearanceIndex(WellGeometry(casing_key(casing), 0.0), restrictions)
+
+    @graph.node("blended_density", "base_density", "chemicals")
+    def _(base_density, chemicals):
+        if not base_density:
+            return None
+        import calcs
+        return calcs.blended_density(float(base_density), chemicals)
+
+    @graph.node("units", "settings")
+    def _(settings):
+        return Units(settings)
+
+    return graph
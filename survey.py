@@ -0,0 +1,142 @@
+import csv
+import io
+
+import numpy as np
+
+from model import survey_digest
+
+
+# =========================
+# DIRECTIONAL SURVEY (minimum curvature)
+# =========================
+
+MD_KEYS = ("md", "measured depth", "depth")
+INC_KEYS = ("inc", "incl", "inclination")
+AZI_KEYS = ("azi", "az", "azimuth")
+
+
+def parse_survey_csv(text: str) -> dict:
+    """{"md", "inc", "azi"} lists from CSV text with an MD / inclination / azimuth header."""
+    reader = csv.reader(io.StringIO(text))
+    header = [h.strip().lower() for h in next(reader)]
+
+    def column(keys):
+        for i, name in enumerate(header):
+            base = name.split("(")[0].strip()
+            if base in keys:
+                return i
+        raise ValueError(f"Survey CSV needs a column named one of: {', '.join(keys)}")
+
+    i_md, i_inc, i_azi = column(MD_KEYS), column(INC_KEYS), column(AZI_KEYS)
+
+    md, inc, azi = [], [], []
+    for row in reader:
+        if not row or not row[i_md].strip():
+            continue
+        md.append(float(row[i_md]))
+        inc.append(float(row[i_inc]))
+        azi.append(float(row[i_azi]))
+
+    if len(md) < 2:
+        raise ValueError("Survey needs at least two stations.")
+    survey = {"md": md, "inc": inc, "azi": azi}
+    survey["digest"] = survey_digest(survey)
+    return survey
+
+
+class Survey:
+    """Minimum-curvature positions for every station, computed in one vectorised pass,
+    plus MD -> TVD / inclination lookups that follow the arc between stations."""
+
+    def __init__(self, md, inc_deg, azi_deg):
+        md = np.asarray(md, dtype=float)
+        inc = np.radians(np.asarray(inc_deg, dtype=float))
+        azi = np.radians(np.asarray(azi_deg, dtype=float))
+
+        order = np.argsort(md, kind="stable")
+        md, inc, azi = md[order], inc[order], azi[order]
+
+        # tie on vertical at surface when the first station is below it
+        if md[0] > 0:
+            md = np.concatenate([[0.0], md])
+            inc = np.concatenate([[0.0], inc])
+            azi = np.concatenate([[azi[0]], azi])
+
+        self.md = md
+        self.inc = inc
+        self.azi = azi
+
+        # unit tangent at every station (north, east, down)
+        self.tangent = np.column_stack([
+            np.sin(inc) * np.cos(azi),
+            np.sin(inc) * np.sin(azi),
+            np.cos(inc)
+        ])
+
+        d_md = np.diff(md)
+        cos_dl = np.clip(np.einsum("ij,ij->i", self.tangent[:-1], self.tangent[1:]), -1.0, 1.0)
+        self.dogleg = np.arccos(cos_dl)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rf = np.where(self.dogleg > 1e-9, 2.0 / self.dogleg * np.tan(self.dogleg / 2.0), 1.0)
+
+        step = (d_md * rf / 2.0)[:, None] * (self.tangent[:-1] + self.tangent[1:])
+        pos = np.vstack([np.zeros(3), np.cumsum(step, axis=0)])
+
+        self.north = pos[:, 0]
+        self.east = pos[:, 1]
+        self.tvd = pos[:, 2]
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(data["md"], data["inc"], data["azi"])
+
+    def __len__(self):
+        return len(self.md)
+
+    @property
+    def dls_deg_30m(self):
+        """Dogleg severity per interval (°/30 m)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(np.diff(self.md) > 0, np.degrees(self.dogleg) * 30.0 / np.diff(self.md), 0.0)
+
+    def _interval(self, md):
+        k = np.searchsorted(self.md, md, side="right") - 1
+        return np.clip(k, 0, len(self.md) - 2)
+
+    def tvd_at(self, md):
+        """TVD at any MD (scalar or array), interpolated along the minimum-curvature arc.
+
+        Below the last station the final tangent is extended straight."""
+        md = np.asarray(md, dtype=float)
+        k = self._interval(md)
+
+        d_md = self.md[k + 1] - self.md[k]
+        dm = md - self.md[k]
+        dl = self.dogleg[k]
+        t1 = self.tangent[k, 2]
+        t2 = self.tangent[k + 1, 2]
+
+        beyond = md > self.md[-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # arc of radius d_md / dl: z(φ) = R (sin φ t1 + (1 - cos φ) n), n ⟂ t1 in the dogleg plane
+            phi = dl * dm / d_md
+            radius = d_md / dl
+            normal = (t2 - t1 * np.cos(dl)) / np.sin(dl)
+            arc = radius * (np.sin(phi) * t1 + (1.0 - np.cos(phi)) * normal)
+
+        straight = dm * t1
+        dz = np.where(dl > 1e-9, arc, straight)
+        dz = np.where(beyond, (md - self.md[-1]) * self.tangent[-1, 2], dz)
+        base = np.where(beyond, self.tvd[-1], self.tvd[k])
+
+        tvd = base + dz
+        return float(tvd) if tvd.ndim == 0 else tvd
+
+    def inc_at(self, md):
+        """Inclination (radians) at any MD, linear between stations."""
+        return np.interp(md, self.md, self.inc)
+
+    def azi_at(self, md):
+        """Azimuth (radians) at any MD, linear between stations (unwrapped across north)."""
+        return np.interp(md, self.md, np.unwrap(self.azi))
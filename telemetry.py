@@ -0,0 +1,203 @@
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+
+
+# =========================
+# TELEMETRY RING BUFFER + MIN/MAX/MEAN PYRAMID
+# =========================
+# Level 0 holds raw samples; level L holds one (min, max, mean) bucket per
+# FACTOR**L raw samples. Every level is a fixed-size ring of per-channel NumPy
+# columns (optionally np.memmap files), updated incrementally on append, so a
+# chart query reads at most ~max_points entries from whichever level fits.
+
+FACTOR = 4
+
+
+class _Level:
+
+    def __init__(self, channels, capacity, path=None, level=0, fresh=True):
+        self.capacity = capacity
+        self.count = 0
+        self.cols = {}
+
+        names = ["t"] + [f"{c}_{stat}" for c in channels for stat in ("min", "max", "mean")]
+        if level == 0:
+            names = ["t"] + list(channels)
+
+        for name in names:
+            if path is None:
+                self.cols[name] = np.full(capacity, np.nan)
+            else:
+                f = Path(path) / f"L{level}_{name}.f8"
+                mode = "w+" if fresh or not f.exists() else "r+"
+                self.cols[name] = np.memmap(f, dtype="f8", mode=mode, shape=(capacity,))
+
+    def write(self, values: dict):
+        slot = self.count % self.capacity
+        for name, value in values.items():
+            self.cols[name][slot] = value
+        self.count += 1
+
+    def index_range(self, t0, t1):
+        """Logical [i0, i1) of entries with t0 <= t <= t1 (logical 0 = oldest retained)."""
+        n = min(self.count, self.capacity)
+        if n == 0:
+            return 0, 0
+
+        t = self.cols["t"]
+        start = self.count % self.capacity if self.count > self.capacity else 0
+        older, newer = t[start:n] if start else t[:n], t[:start]
+
+        i0 = np.searchsorted(older, t0, side="left")
+        i1 = np.searchsorted(older, t1, side="right")
+        if start:
+            i0 = i0 if i0 < len(older) else len(older) + np.searchsorted(newer, t0, side="left")
+            i1 = i1 if i1 < len(older) else len(older) + np.searchsorted(newer, t1, side="right")
+        return int(i0), int(i1)
+
+    def take(self, i0, i1):
+        start = self.count % self.capacity if self.count > self.capacity else 0
+        idx = (np.arange(i0, i1) + start) % self.capacity
+        return {name: np.asarray(col[idx]) for name, col in self.cols.items()}
+
+
+def _stats(value):
+    # (min, max, sum, n) of the non-NaN samples in a bucket
+    if math.isnan(value):
+        return (math.nan, math.nan, 0.0, 0)
+    return (value, value, value, 1)
+
+
+def _merge(a, b):
+    if not a[3]:
+        return b
+    if not b[3]:
+        return a
+    return (min(a[0], b[0]), max(a[1], b[1]), a[2] + b[2], a[3] + b[3])
+
+
+class RingBuffer:
+
+    def __init__(self, channels, capacity: int = 432_000, path=None, levels: int = None):
+        self.channels = list(channels)
+        self.capacity = capacity
+        self.path = None if path is None else Path(path)
+
+        if levels is None:
+            levels = 1
+            while capacity // FACTOR ** levels >= 256:
+                levels += 1
+
+        fresh = True
+        meta = None
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            meta_file = self.path / "meta.json"
+            if meta_file.exists():
+                meta = json.loads(meta_file.read_text(encoding="utf-8"))
+                fresh = meta["channels"] != self.channels or meta["capacity"] != capacity or meta["levels"] != levels
+
+        self.levels = [
+            _Level(self.channels, max(capacity // FACTOR ** L, 1), self.path, L, fresh)
+            for L in range(levels)
+        ]
+        if meta is not None and not fresh:
+            for level, count in zip(self.levels, meta["counts"]):
+                level.count = count
+
+        # partial bucket per aggregate level: {"n", "t" (first), "stats": {channel: (min, max, sum, n)}}
+        self._acc = [None] * levels
+
+    def __len__(self):
+        return min(self.levels[0].count, self.capacity)
+
+    def append(self, t: float, **values):
+        raw = {"t": t}
+        raw.update({c: float(values.get(c, math.nan)) for c in self.channels})
+        self.levels[0].write(raw)
+
+        # roll the sample up the pyramid: each completed bucket feeds the next level
+        item = {c: _stats(raw[c]) for c in self.channels}
+        t_first = t
+        for L in range(1, len(self.levels)):
+            acc = self._acc[L]
+            if acc is None:
+                acc = self._acc[L] = {"n": 0, "t": t_first, "stats": item}
+            else:
+                acc["stats"] = {c: _merge(acc["stats"][c], item[c]) for c in self.channels}
+            acc["n"] += 1
+            if acc["n"] < FACTOR:
+                break
+
+            out = {"t": acc["t"]}
+            for c, (lo, hi, total, n) in acc["stats"].items():
+                out[f"{c}_min"] = lo
+                out[f"{c}_max"] = hi
+                out[f"{c}_mean"] = total / n if n else math.nan
+            self.levels[L].write(out)
+
+            item = acc["stats"]
+            t_first = acc["t"]
+            self._acc[L] = None
+
+    def query(self, t0=-np.inf, t1=np.inf, max_points: int = 2000):
+        """Downsampled view of [t0, t1]: {"t", "<ch>_min", "<ch>_max", "<ch>_mean", "level"}."""
+        for L, level in enumerate(self.levels):
+            i0, i1 = level.index_range(t0, t1)
+            if i1 - i0 <= max_points or L == len(self.levels) - 1:
+                break
+
+        data = level.take(i0, i1)
+        if L == 0:
+            t = data.pop("t")
+            data = {f"{c}_{stat}": data[c] for c in self.channels for stat in ("min", "max", "mean")}
+            data["t"] = t
+        data["level"] = L
+        return data
+
+    def last(self):
+        level = self.levels[0]
+        if level.count == 0:
+            return None
+        slot = (level.count - 1) % level.capacity
+        return {name: float(col[slot]) for name, col in level.cols.items()}
+
+    def flush(self):
+        if self.path is None:
+            return
+        for level in self.levels:
+            for col in level.cols.values():
+                col.flush()
+        (self.path / "meta.json").write_text(json.dumps({
+            "channels": self.channels,
+            "capacity": self.capacity,
+            "levels": len(self.levels),
+            "counts": [level.count for level in self.levels]
+        }), encoding="utf-8")
+
+
+# =========================
+# LIVE FEED -> BUFFER
+# =========================
+
+LIVE_CHANNELS = ("depth_m", "rate_m3_min", "pressure_kpa", "annular_velocity_m_min", "hydrostatic_kpa")
+
+
+def recorder(buffer: RingBuffer, flush_every: int = 60):
+    """on_reading callback for acquisition.LiveFeed that appends each reading to the buffer.
+
+    Flushes every flush_every samples; pass buffer.flush as the feed's on_done
+    to keep the tail when the feed ends or is stopped.
+    """
+    def on_reading(reading):
+        buffer.append(
+            reading["t"],
+            **{c: math.nan if reading.get(c) is None else reading[c] for c in buffer.channels}
+        )
+        # total appended, not len(buffer): that sticks at capacity once the ring is full
+        if buffer.levels[0].count % flush_every == 0:
+            buffer.flush()
+    return on_reading
@@ -0,0 +1,72 @@
+# =========================
+# UNITS
+# =========================
+# Engines work in one base unit per quantity (m, kPa, m³/min, m³, N, m/min,
+# kPa/m). Conversion happens only at the display boundary: each table holds how
+# many base units one display unit is, so a scalar, NumPy array or pandas column
+# converts with a single multiply.
+
+FACTORS = {
+    "length": {"m": 1.0, "ft": 0.3048},
+    "pressure": {"kPa": 1.0, "psi": 6.894757293168, "bar": 100.0, "MPa": 1000.0},
+    "rate": {"m³/min": 1.0, "L/min": 0.001, "bbl/min": 0.158987294928},
+    "volume": {"m³": 1.0, "L": 0.001, "bbl": 0.158987294928},
+    "force": {"daN": 10.0, "lbf": 4.4482216152605, "N": 1.0, "kN": 1000.0},
+    "velocity": {"m/min": 1.0, "ft/min": 0.3048},
+    "gradient": {"kPa/m": 1.0, "psi/ft": 6.894757293168 / 0.3048}
+}
+
+INVERSE = {q: {u: 1.0 / f for u, f in table.items()} for q, table in FACTORS.items()}
+
+# settings key holding the display unit for each quantity; velocity follows length
+SETTING_KEYS = {
+    "length": "length_unit",
+    "pressure": "pressure_unit",
+    "rate": "rate_unit",
+    "volume": "volume_unit",
+    "force": "force_unit"
+}
+FOLLOWS_LENGTH = {
+    "velocity": {"m": "m/min", "ft": "ft/min"},
+    "gradient": {"m": "kPa/m", "ft": "psi/ft"}
+}
+
+
+def to_si(value, quantity: str, unit: str):
+    return value * FACTORS[quantity][unit]
+
+
+def from_si(value, quantity: str, unit: str):
+    return value * INVERSE[quantity][unit]
+
+
+def convert(value, quantity: str, from_unit: str, to_unit: str):
+    return value * (FACTORS[quantity][from_unit] * INVERSE[quantity][to_unit])
+
+
+class Units:
+    """Display units picked in Settings, bound once per run."""
+
+    def __init__(self, settings: dict):
+        self.units = {q: settings.get(key) or next(iter(FACTORS[q])) for q, key in SETTING_KEYS.items()}
+        for q, by_length in FOLLOWS_LENGTH.items():
+            self.units[q] = by_length[self.units["length"]]
+
+    def unit(self, quantity: str) -> str:
+        return self.units[quantity]
+
+    def to_si(self, value, quantity: str):
+        """Display value (as typed) -> base unit."""
+        return to_si(value, quantity, self.units[quantity])
+
+    def from_si(self, value, quantity: str):
+        """Base unit -> display value."""
+        return from_si(value, quantity, self.units[quantity])
+
+    def label(self, name: str, quantity: str) -> str:
+        return f"{name} ({self.units[quantity]})"
+
+    def fmt(self, value, quantity: str, decimals: int = 2) -> str:
+        if value is None:
+            return "—"
+        return f"{self.from_si(value, quantity):,.{decimals}f} {self.units[quantity]}"
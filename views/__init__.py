@@ -0,0 +1,25 @@
+import importlib
+
+
+# =========================
+# PAGES
+# =========================
+# Each page is a module with render(job). It is imported the first time the
+# page is opened, so its plotting / engine imports are paid for only then.
+
+PAGES = {
+    "Home": ("home", "🏠 Home"),
+    "CT Strings": ("ct_strings", "🧵 CT Strings"),
+    "Well / Job": ("well_job", "🛢️ Well / Job"),
+    "Flow & Velocity": ("flow", "🌀 Flow & Velocity"),
+    "Volumes": ("volumes", "🧊 Volumes"),
+    "Fluids": ("fluids", "🧪 Fluids"),
+    "Pressure": ("pressure", "📉 Pressure"),
+    "Forces": ("forces", "🏋️ Forces"),
+    "Settings": ("settings", "⚙️ Settings")
+}
+
+
+def render(page: str, job):
+    module, _ = PAGES[page]
+    importlib.import_module(f"{__name__}.{module}").render(job)
@@ -0,0 +1,179 @@
+import os
+import statistics
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+from calc_cache import stable_hash
+from model import default_job, migrate
+
+
+# =========================
+# SHARED PAGE HELPERS
+# =========================
+# Everything here is per process (stores, assets, CSS) or reads the per-session
+# objects app.py puts in st.session_state (job, calc_cache, graph). app.py
+# imports this module on every cold start, so the engines are imported inside
+# the helpers that use them.
+
+@st.cache_resource
+def get_job_store():
+    from job_store import JobStore
+    return JobStore(os.environ.get("WELLOPS_JOB_DIR", "jobs"))
+
+
+@st.cache_resource
+def get_blob_store():
+    from blob_store import BlobStore
+    return BlobStore(os.environ.get("WELLOPS_BLOB_DIR", "blobs"))
+
+
+@lru_cache(maxsize=None)
+def asset(name: str) -> bytes:
+    return (Path(__file__).resolve().parent.parent / "assets" / name).read_bytes()
+
+
+def open_job(job_id):
+    st.session_state.job = get_job_store().load(job_id)
+    st.session_state.job_id = job_id
+    st.query_params["job"] = job_id
+
+
+def _untouched(job):
+    # the default job a session starts with, before any edit
+    fresh = migrate(default_job())
+    fresh["meta"]["last_modified"] = job["meta"].get("last_modified")
+    return stable_hash(job) == stable_hash(fresh)
+
+
+def autosave():
+    job = st.session_state.job
+    if st.session_state.get("job_id"):
+        get_job_store().save(st.session_state.job_id, job)
+    elif not _untouched(job):
+        # first edit of a job that was never started or opened: give it a store
+        # entry (and a URL) so a refresh doesn't lose it
+        job_id = get_job_store().create(job)
+        st.session_state.job_id = job_id
+        st.query_params["job"] = job_id
+
+
+def survey_key(job):
+    # stands in for the survey in cache keys: hashing the digest, not every station
+    data = job["well"].get("survey")
+    return data["digest"] if data else None
+
+
+def cached_survey(job):
+    data = job["well"].get("survey")
+    if not data:
+        return None
+    from survey import Survey
+    return st.session_state.calc_cache.get_or_compute("well", {"survey": survey_key(job)}, lambda: Survey.from_dict(data))
+
+
+def fatigue_map(ct):
+    # damage history belongs to the physical reel, so it lives outside the job, keyed by reel id
+    from fatigue import FatigueMap
+    root = Path(os.environ.get("WELLOPS_FATIGUE_DIR", "fatigue"))
+    return FatigueMap(root / ct["reel_id"], float(ct["sections"]["length"].sum()))
+
+
+# =========================
+# THEME
+# =========================
+
+@lru_cache(maxsize=8)
+def theme_css(theme: str, accent: str) -> str:
+    if theme == "light":
+        bg = "#F8FAFC"
+        sidebar_bg = "#FFFFFF"
+        text = "#0F172A"
+        input_bg = "#FFFFFF"
+        border = "#CBD5E1"
+    else:
+        bg = "#000000"
+        sidebar_bg = "#0B1220"
+        text = "#F9FAFB"
+        input_bg = "#111827"
+        border = "#374151"
+
+    return f"""
+        <style>
+        .stApp {{
+            background-color: {bg};
+        }}
+
+        section[data-testid="stSidebar"] {{
+            background-color: {sidebar_bg};
+        }}
+
+        button {{
+            background-color: {accent} !important;
+            color: white !important;
+            border-radius: 8px !important;
+            border: 0 !important;
+        }}
+
+        input, select, textarea {{
+            background-color: {input_bg} !important;
+            color: {text} !important;
+            border: 1px solid {border} !important;
+        }}
+
+        h1, h2, h3, h4, p, span, label, div {{
+            color: {text};
+        }}
+        </style>
+        """
+
+
+def apply_theme(settings: dict):
+    theme = settings.get("theme", "dark")
+    accent = settings.get("accent_color", "#F97316")  # default orange
+    st.markdown(theme_css(theme, accent), unsafe_allow_html=True)
+
+
+# =========================
+# RUN TIMINGS
+# =========================
+
+@st.cache_resource
+def _timings():
+    # per process, shared by every session: the first run carries the cold imports
+    return {"cold_ms": None, "opened": set(), "runs": deque(maxlen=500)}
+
+
+def record_run(page: str, ms: float):
+    timings = _timings()
+    if timings["cold_ms"] is None:
+        timings["cold_ms"] = ms
+    first_open = page not in timings["opened"]
+    timings["opened"].add(page)
+    timings["runs"].append((page, ms, first_open))
+
+
+def run_timings():
+    """Cold-start ms plus, per page, the first open (with its imports) and rerun stats."""
+    timings = _timings()
+    pages = {}
+    for page, ms, first_open in list(timings["runs"]):
+        entry = pages.setdefault(page, {"first_open_ms": None, "reruns": []})
+        if first_open:
+            entry["first_open_ms"] = ms
+        else:
+            entry["reruns"].append(ms)
+
+    rows = [
+        {
+            "page": page,
+            "first_open_ms": entry["first_open_ms"],
+            "reruns": len(entry["reruns"]),
+            "median_ms": statistics.median(entry["reruns"]) if entry["reruns"] else None,
+            "last_ms": entry["reruns"][-1] if entry["reruns"] else None
+        }
+        for page, entry in pages.items()
+    ]
+    return {"cold_ms": timings["cold_ms"], "pages": rows}
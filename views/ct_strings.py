@@ -0,0 +1,472 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from compare import compare_strings, rank, CRITERIA
+import calcs
+from model import new_reel_id, records, sections_array
+from reactive import job_inputs
+from units import convert
+from views.common import autosave, fatigue_map
+
+
+# =========================
+# SECTION TABLE
+# =========================
+# The table edits a copy; pending changes (edited cells, added / pasted rows,
+# deleted rows) are priced row by row against the committed summary, so the
+# totals update without recomputing the whole string. Apply commits them in
+# one go, fatigue hooks included; the committed summary is then worked out
+# from the rows again, so the deltas' rounding never outlives the preview.
+
+EDITOR_COLUMNS = {"Length (m)": "length", "OD (mm)": "od", "Wall (mm)": "wall"}
+TOTALS = ("total_length", "internal_volume", "displacement_volume")
+
+
+def _no_changes(changes):
+    return not (changes["edited_rows"] or changes["added_rows"] or changes["deleted_rows"])
+
+
+def _section_frame(sections, summary):
+    rows = pd.DataFrame(summary["sections"], columns=["id_mm", "internal_volume", "displacement_volume"])
+    return pd.DataFrame({
+        "Section": np.arange(1, len(sections) + 1),
+        **{col: sections[field] for col, field in EDITOR_COLUMNS.items()},
+        "ID (mm)": rows["id_mm"].to_numpy(),
+        "Internal (m³)": rows["internal_volume"].to_numpy(),
+        "Displacement (m³)": rows["displacement_volume"].to_numpy()
+    })
+
+
+def _pending(sections, summary, changes):
+    """Sections, summary and per-original-section new lengths (None = deleted) after the pending changes."""
+    sections = records(sections)
+    new_sections = list(sections)
+    rows = list(summary["sections"])
+    totals = {k: summary[k] for k in TOTALS}
+    problems = []
+
+    def count(sec, row, sign):
+        totals["total_length"] += sign * float(sec["length"])
+        totals["internal_volume"] += sign * row["internal_volume"]
+        totals["displacement_volume"] += sign * row["displacement_volume"]
+
+    def check(sec, label):
+        if sec["length"] <= 0 or sec["od"] <= 0 or sec["wall"] <= 0:
+            problems.append(f"{label}: length, OD and wall must be positive.")
+        elif 2.0 * sec["wall"] >= sec["od"]:
+            problems.append(f"{label}: wall is too thick for the OD.")
+
+    for i, change in changes["edited_rows"].items():
+        i = int(i)
+        sec = dict(sections[i])
+        for col, value in change.items():
+            if col not in EDITOR_COLUMNS:
+                continue
+            if value is None:
+                problems.append(f"Section {i + 1}: {col} is empty.")
+                continue
+            sec[EDITOR_COLUMNS[col]] = float(value)
+        check(sec, f"Section {i + 1}")
+        row = calcs.section_volumes(sec)
+        count(sections[i], rows[i], -1)
+        count(sec, row, +1)
+        new_sections[i] = sec
+        rows[i] = row
+
+    deleted = set(changes["deleted_rows"])
+    for i in deleted:
+        count(new_sections[i], rows[i], -1)
+    new_lengths = [None if i in deleted else float(sec["length"]) for i, sec in enumerate(new_sections)]
+    new_sections = [sec for i, sec in enumerate(new_sections) if i not in deleted]
+    rows = [row for i, row in enumerate(rows) if i not in deleted]
+
+    for n, added in enumerate(changes["added_rows"], start=1):
+        values = {EDITOR_COLUMNS[c]: v for c, v in added.items() if c in EDITOR_COLUMNS and v is not None}
+        if len(values) < len(EDITOR_COLUMNS):
+            problems.append(f"New row {n}: needs length, OD and wall.")
+            continue
+        sec = {"length": float(values["length"]), "od": float(values["od"]), "wall": float(values["wall"])}
+        check(sec, f"New row {n}")
+        row = calcs.section_volumes(sec)
+        count(sec, row, +1)
+        new_sections.append(sec)
+        rows.append(row)
+
+    return new_sections, {"sections": rows, **totals}, new_lengths, problems
+
+
+def _commit(ct, new_sections, new_lengths):
+    # the map is opened at the committed length; working from the core end keeps
+    # every earlier section's offset valid while pipe is cut or spliced
+    fmap = fatigue_map(ct)
+    lengths = ct["sections"]["length"].tolist()
+    starts = np.concatenate(([0.0], np.cumsum(lengths)[:-1])).tolist()
+
+    for i in reversed(range(len(lengths))):
+        old = lengths[i]
+        new = new_lengths[i]
+        if new is None:
+            fmap.remove(starts[i], old)
+        elif new < old:
+            fmap.remove(starts[i], old - new)       # shortened: cut from the section's whip end
+        elif new > old:
+            fmap.insert(starts[i], new - old)
+
+    kept = sum(x for x in new_lengths if x is not None)
+    added = sum(float(sec["length"]) for sec in new_sections) - kept
+    if added > 0:
+        fmap.insert(kept, added)
+
+    ct["sections"] = sections_array(new_sections)
+
+
+def _summary():
+    # callbacks and fragment reruns skip app.py, so bring the graph up to the job as it is now
+    graph = st.session_state.graph
+    job_inputs(graph, st.session_state.job)
+    return graph["ct_summary"]
+
+
+def _reset_editor():
+    st.session_state.sections_editor_n = st.session_state.get("sections_editor_n", 0) + 1
+
+
+# Button callbacks run before the fragment body, so the table redraws from the
+# committed sections without a second rerun
+
+def _apply_changes(ct, editor_key):
+    summary = _summary()
+    new_sections, _, new_lengths, problems = _pending(ct["sections"], summary, st.session_state[editor_key])
+    if not problems:
+        _commit(ct, new_sections, new_lengths)
+        _reset_editor()
+        autosave()
+
+
+def _cut_whip(ct):
+    ends = np.cumsum(ct["sections"]["length"])
+    cut = min(st.session_state.whip_cut, float(ends[-1]))
+    fatigue_map(ct).remove(0.0, cut)
+    # sections wholly inside the cut go; the first one left keeps what lies past it
+    keep = ends > cut + 1e-9
+    remaining = ct["sections"][keep].copy()
+    if len(remaining):
+        remaining["length"][0] = ends[keep][0] - cut
+    ct["sections"] = remaining
+    st.session_state.whip_cut = 0.0
+    _reset_editor()
+    autosave()
+
+
+@st.fragment
+def _sections_editor(job, ct, ct_od_options):
+    # table edits from the last interaction are already in session state at this point
+    editor_key = f"sections_{job['ct']['active_index']}_{st.session_state.get('sections_editor_n', 0)}"
+    changes = st.session_state.get(editor_key) or {"edited_rows": {}, "added_rows": [], "deleted_rows": []}
+    editing = not _no_changes(changes)
+
+    # ---- ADD SECTION ----
+    st.markdown("### Add Section (Whip → Core)")
+
+    c1, c2, c3 = st.columns(3)
+
+    with c1:
+        sec_length_txt = st.text_input("Length (m)", value="", key="sec_len")
+    with c2:
+        sec_od_label = st.selectbox("OD", list(ct_od_options.keys()))
+    with c3:
+        sec_wall_txt = st.text_input("Wall thickness (mm)", value="", key="sec_wall")
+
+    if st.button("Add Section", disabled=editing):
+        if sec_length_txt and sec_wall_txt:
+            sec_length = float(sec_length_txt)
+            sec_wall = float(sec_wall_txt)
+
+            fatigue_map(ct).insert(0.0, sec_length)
+            new = sections_array([{"length": sec_length, "od": ct_od_options[sec_od_label], "wall": sec_wall}])
+            ct["sections"] = np.concatenate([new, ct["sections"]])
+            _reset_editor()
+            autosave()
+        else:
+            st.warning("All fields must be filled.")
+
+    # ---- SECTION TABLE ----
+    st.markdown("### Sections (Whip → Core)")
+    st.caption(
+        "Edit cells, add rows at the core end or paste rows copied from a spreadsheet, "
+        "select rows to delete, then Apply. Shortening a section cuts pipe from that section's whip end."
+    )
+
+    if not len(ct["sections"]):
+        st.info("No sections added yet.")
+
+    # Add Section above may have started a fresh table
+    editor_key = f"sections_{job['ct']['active_index']}_{st.session_state.get('sections_editor_n', 0)}"
+    summary = _summary()
+    st.data_editor(
+        _section_frame(ct["sections"], summary),
+        key=editor_key,
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        disabled=["Section", "ID (mm)", "Internal (m³)", "Displacement (m³)"],
+        column_config={
+            "Length (m)": st.column_config.NumberColumn(min_value=0.0, format="%.2f"),
+            "OD (mm)": st.column_config.NumberColumn(min_value=0.0, format="%.1f"),
+            "Wall (mm)": st.column_config.NumberColumn(min_value=0.0, format="%.2f"),
+            "ID (mm)": st.column_config.NumberColumn(format="%.2f"),
+            "Internal (m³)": st.column_config.NumberColumn(format="%.3f"),
+            "Displacement (m³)": st.column_config.NumberColumn(format="%.3f")
+        }
+    )
+
+    if editing:
+        _, shown, _, problems = _pending(ct["sections"], summary, changes)
+        for problem in problems:
+            st.warning(problem)
+
+        a1, a2 = st.columns(2)
+        with a1:
+            st.button("Apply changes", type="primary", disabled=bool(problems), use_container_width=True,
+                      on_click=_apply_changes, args=(ct, editor_key))
+        with a2:
+            st.button("Discard changes", use_container_width=True, on_click=_reset_editor)
+    else:
+        shown = summary
+
+    # ---- SUMMARY ----
+    pending = " (pending)" if editing else ""
+    st.markdown("---")
+    st.success(f"Total CT Length{pending}: {shown['total_length']:.1f} m")
+    st.success(f"CT Internal Volume{pending}: {shown['internal_volume']:.3f} m³")
+    st.success(f"CT Displacement Volume{pending}: {shown['displacement_volume']:.3f} m³")
+
+    # ---- CUT FROM WHIP ----
+    if len(ct["sections"]):
+        t1, t2 = st.columns([3, 1])
+        with t1:
+            cut = st.number_input("Cut from whip end (m)", min_value=0.0, key="whip_cut")
+        with t2:
+            st.write("")
+            st.button("Cut", disabled=editing or cut <= 0, use_container_width=True, on_click=_cut_whip, args=(ct,))
+
+    if editing:
+        st.caption("Apply or discard the table edits before adding or cutting sections.")
+
+
+# =========================
+# CT STRINGS
+# =========================
+
+def render(job):
+    calc_cache = st.session_state.calc_cache
+    graph = st.session_state.graph
+    units = graph["units"]
+
+    st.header("CT String Builder")
+
+    # ---- OD OPTIONS ----
+    ct_od_options = {
+        '1" – 25.4 mm': 25.4,
+        '1-1/4" – 31.8 mm': 31.8,
+        '1-1/2" – 38.1 mm': 38.1,
+        '1-3/4" – 44.5 mm': 44.5,
+        '2" – 50.8 mm': 50.8,
+        '2-3/8" – 60.3 mm': 60.3,
+        '2-7/8" – 73.0 mm': 73.0
+    }
+
+    # ---- CREATE STRING ----
+    st.subheader("CT Strings")
+
+    new_name = st.text_input("Create new CT string", value="")
+
+    if st.button("Add CT String"):
+        if new_name.strip():
+            job["ct"]["strings"].append({
+                "name": new_name.strip(),
+                "reel_id": new_reel_id(),
+                "sections": sections_array([]),
+                "ratings": {
+                    "burst": None,
+                    "collapse": None,
+                    "pull": None
+                }
+            })
+            job["ct"]["active_index"] = len(job["ct"]["strings"]) - 1
+
+    if not job["ct"]["strings"]:
+        st.info("Create a CT string to begin.")
+        st.stop()
+
+    names = [s["name"] for s in job["ct"]["strings"]]
+    job["ct"]["active_index"] = st.selectbox(
+        "Active CT String",
+        range(len(names)),
+        format_func=lambda i: names[i],
+        index=job["ct"]["active_index"] or 0
+    )
+
+    ct = job["ct"]["strings"][job["ct"]["active_index"]]
+
+    # ---- COMPARE ALL STRINGS ----
+    if len(job["ct"]["strings"]) > 1 and len(job["well"]["casing"]):
+        with st.expander("Compare all strings against this well"):
+            q1, q2, q3 = st.columns(3)
+            with q1:
+                cmp_depth = units.to_si(st.number_input(
+                    units.label("Depth", "length"), min_value=float(units.from_si(1.0, "length")),
+                    value=float(units.from_si(job["well"]["td"] or 1000.0, "length")), key="cmp_depth"
+                ), "length")
+            with q2:
+                cmp_rate = units.to_si(st.number_input(
+                    units.label("Pump rate", "rate"), min_value=0.0,
+                    value=float(units.from_si(0.5, "rate")), key="cmp_rate"
+                ), "rate")
+            with q3:
+                criterion = st.selectbox("Rank by", list(CRITERIA), format_func=lambda c: CRITERIA[c][0])
+
+            # water-like Newtonian fluid at the job density for the friction comparison
+            cmp_fluid = {"model": "newtonian", "density": float(graph["blended_density"] or 1000.0), "viscosity": 0.001}
+            comparison = calc_cache.get_or_compute(
+                "ct",
+                {"compare": job["ct"]["strings"], "casing": job["well"]["casing"],
+                 "depth": cmp_depth, "rate": cmp_rate, "fluid": cmp_fluid},
+                lambda: compare_strings(job["ct"]["strings"], job["well"]["casing"], cmp_depth, cmp_rate, cmp_fluid)
+            )
+
+            def shown(value, quantity):
+                return None if value is None else units.from_si(value, quantity)
+
+            ranked = rank(comparison["rows"], criterion)
+            st.dataframe(pd.DataFrame([
+                {
+                    "String": r["name"],
+                    units.label("Length", "length"): shown(r["length_m"], "length"),
+                    "Reaches depth": r["reaches_depth"],
+                    units.label("Internal", "volume"): shown(r["internal_m3"], "volume"),
+                    units.label("Displacement", "volume"): shown(r["displacement_m3"], "volume"),
+                    units.label("Circulating", "volume"): shown(r["circulating_m3"], "volume"),
+                    units.label("Min annular velocity", "velocity"): shown(r["min_annular_velocity_m_min"], "velocity"),
+                    "Bottoms-up (min)": r["bottoms_up_min"],
+                    units.label("Pump pressure", "pressure"): shown(r["pump_pressure_kpa"], "pressure"),
+                    units.label("Burst margin", "pressure"): shown(r["burst_margin_kpa"], "pressure")
+                }
+                for r in ranked
+            ]).round(2), hide_index=True, use_container_width=True)
+
+            if cmp_rate > 0 and comparison["rows"]:
+                depth_col = units.label("Depth", "length")
+                profiles = pd.DataFrame({depth_col: units.from_si(comparison["depth"], "length")})
+                for r in comparison["rows"]:
+                    profiles[r["name"]] = units.from_si(r["velocity_profile"], "velocity")
+                st.line_chart(profiles, x=depth_col)
+                st.caption(f"Annular velocity ({units.unit('velocity')}) by depth. "
+                           "Friction uses water-like fluid at the job density.")
+
+    # ---- RATINGS (MANUAL) ----
+    st.markdown("### CT Ratings (80%)")
+
+    r1, r2, r3 = st.columns(3)
+
+    with r1:
+        burst = st.text_input(units.label("Burst", "pressure"), value="")
+    with r2:
+        collapse = st.text_input(units.label("Collapse", "pressure"), value="")
+    with r3:
+        pull = st.text_input(units.label("Max Pull", "force"), value="")
+
+    # stored as kPa, and daN for pull
+    if burst:
+        ct["ratings"]["burst"] = units.to_si(float(burst), "pressure")
+    if collapse:
+        ct["ratings"]["collapse"] = units.to_si(float(collapse), "pressure")
+    if pull:
+        ct["ratings"]["pull"] = convert(float(pull), "force", units.unit("force"), "daN")
+
+    # ---- SECTIONS ----
+    # Section edits rerun only this fragment, not the whole app
+    _sections_editor(job, ct, ct_od_options)
+
+    if not len(ct["sections"]):
+        return
+
+    total_length = _summary()["total_length"]
+
+    # ---- FATIGUE ----
+    with st.expander("Fatigue life (per-metre damage)"):
+        fmap = fatigue_map(ct)
+
+        if fmap.mismatch_m:
+            st.warning(
+                f"The damage map for reel '{ct['name']}' covers {units.fmt(fmap.length_m, 'length', 0)} but this "
+                f"string is {units.fmt(total_length, 'length', 1)}. It may have been edited before tracking began "
+                "or in another job on the same reel. Line them up before recording runs."
+            )
+            a1, a2 = st.columns(2)
+            with a1:
+                align_end = st.selectbox("Adjust at", ["Core end", "Whip end"], key="fatigue_align_end")
+            with a2:
+                st.markdown("<br>", unsafe_allow_html=True)
+                if fmap.mismatch_m > 0:
+                    align = st.button(f"Splice {units.fmt(fmap.mismatch_m, 'length', 1)} of new pipe")
+                else:
+                    align = st.button(f"Trim {units.fmt(-fmap.mismatch_m, 'length', 1)} from the map")
+            if align:
+                at = fmap.length_m if align_end == "Core end" else 0.0
+                if fmap.mismatch_m > 0:
+                    fmap.insert(at, fmap.mismatch_m)
+                else:
+                    fmap.remove(at + fmap.mismatch_m if at else 0.0, -fmap.mismatch_m)
+                st.rerun()
+
+        f1, f2, f3 = st.columns(3)
+        with f1:
+            run_depth = min(units.to_si(st.number_input(
+                units.label("Run depth", "length"), min_value=0.0,
+                max_value=float(units.from_si(total_length, "length")),
+                value=float(units.from_si(min(total_length, job["well"].get("td") or total_length), "length"))
+            ), "length"), total_length)
+            run_pressure = units.to_si(st.number_input(
+                units.label("Circulating pressure", "pressure"), min_value=0.0, value=0.0
+            ), "pressure")
+        with f2:
+            run_trips = st.number_input("Round trips", min_value=1, value=1, step=1)
+            cycle_from = units.to_si(st.number_input(
+                f"Cycling only below ({units.unit('length')} from whip)", min_value=0.0, value=0.0,
+                help="Set for repeated cycling over part of the string, e.g. working a tool"
+            ), "length")
+        with f3:
+            gooseneck_d = st.number_input("Gooseneck diameter (m)", min_value=0.5, value=2.44)
+            reel_d = st.number_input("Reel core diameter (m)", min_value=0.5, value=2.4, key="fatigue_reel_d")
+            yield_mpa = st.number_input("Yield strength (MPa)", min_value=100.0, value=620.0)
+
+        if st.button("Record run", disabled=bool(fmap.mismatch_m)):
+            worst = fmap.record(ct["sections"], run_depth, run_pressure, int(run_trips),
+                                gooseneck_d, reel_d, yield_mpa, start_m=cycle_from)
+            st.success(f"Recorded. Worst point in the run now at {worst:.1%} life used.")
+
+        if fmap.cells:
+            distance_col = f"Distance from whip ({units.unit('length')})"
+            st.line_chart(pd.DataFrame({
+                distance_col: units.from_si(fmap.distance(), "length"),
+                "Life used (%)": fmap.damage * 100.0
+            }), x=distance_col)
+
+            fatigue_rows = fmap.section_summary(ct["sections"])
+            st.dataframe(pd.DataFrame([
+                {
+                    "Section": i + 1,
+                    "Max life used (%)": row["max_damage"] * 100.0,
+                    f"At ({units.unit('length')} from whip)": units.from_si(row["at_m"], "length")
+                }
+                for i, row in enumerate(fatigue_rows)
+            ]), hide_index=True)
+
+            if fmap.damage.max() >= 0.8:
+                st.error("Part of this string has used 80% or more of its fatigue life — consider trimming.")
+
+        if fmap.meta["log"]:
+            st.caption(f"{fmap.meta['trips']} trips recorded on this reel")
+            st.dataframe(pd.DataFrame(fmap.meta["log"][::-1]), hide_index=True)
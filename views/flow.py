@@ -0,0 +1,266 @@
+from pathlib import Path
+import os
+
+import numpy as np
+import pandas as pd
+import altair as alt
+import streamlit as st
+
+from acquisition import LiveFeed, LiveTracker, replay_file, read_socket
+from telemetry import RingBuffer, LIVE_CHANNELS, recorder
+from envelope import required_rate, velocity_grid
+from views.common import cached_survey
+
+
+# =========================
+# FLOW & VELOCITY
+# =========================
+
+def render(job):
+    graph = st.session_state.graph
+    units = graph["units"]
+
+    st.header("🌀 Flow & Velocity")
+
+    # --- Guardrails ---
+    if job["ct"]["active_index"] is None or not job["ct"]["strings"]:
+        st.info("Select an active CT string first (CT Strings page).")
+        st.stop()
+
+    if not len(job["well"]["casing"]):
+        st.info("Add casing geometry first (Well / Job page).")
+        st.stop()
+
+    geom = graph["geometry"]
+    if geom is None:
+        st.info("Add sections to the active CT string first (CT Strings page).")
+        st.stop()
+
+    # --- Settings ---
+    decimals = int(job["settings"].get("decimals", 2))
+
+    # --- Inputs (display units -> m, m³/min) ---
+    col1, col2 = st.columns(2)
+    with col1:
+        depth_in = st.number_input(units.label("Depth", "length"), min_value=0.0, value=0.0, placeholder="Enter depth")
+    with col2:
+        rate_in = st.number_input(units.label("Pump rate", "rate"), min_value=0.0, value=0.0, placeholder="Enter pump rate")
+
+    depth_m = units.to_si(depth_in, "length")
+    rate_m3_min = units.to_si(rate_in, "rate")
+
+    # --- Active CT OD (OD constant across string) ---
+    ct = job["ct"]["strings"][job["ct"]["active_index"]]
+    ct_od_mm = graph["ct_od_mm"]
+
+    # --- Operating envelope: required rate for a minimum annular velocity ---
+    with st.expander("Operating envelope — minimum hole-cleaning rate"):
+        depth_col = units.label("Depth", "length")
+        rate_col = units.label("Required rate", "rate")
+        vel_col = units.label("Min velocity", "velocity")
+
+        e1, e2, e3 = st.columns(3)
+        with e1:
+            min_vel = st.number_input(units.label("Target min annular velocity", "velocity"), min_value=0.0, value=30.0)
+        with e2:
+            env_step_m = units.to_si(st.number_input(
+                units.label("Depth step", "length"), min_value=float(units.from_si(1.0, "length")),
+                value=float(units.from_si(10.0, "length")), key="env_step"
+            ), "length")
+        with e3:
+            max_rate_in = st.number_input(units.label("Max rate for grid", "rate"), min_value=0.0, value=0.0, key="env_max_rate")
+
+        env_depths = np.append(np.arange(env_step_m, geom.bottom, env_step_m), geom.bottom)
+        env = required_rate(geom, env_depths, units.to_si(min_vel, "velocity"))
+
+        env_table = pd.DataFrame({
+            depth_col: units.from_si(env["depth"], "length"),
+            rate_col: units.from_si(env["rate_m3_min"], "rate"),
+            "Controlling casing ID (mm)": env["controlling_id_mm"]
+        })
+        st.line_chart(env_table, x=depth_col, y=rate_col)
+
+        if max_rate_in > 0:
+            env_rates = np.linspace(max_rate_in / 20, max_rate_in, 20)
+            grid = velocity_grid(geom, units.to_si(env_rates, "rate"), env_depths)
+
+            heat = pd.DataFrame({
+                depth_col: np.tile(units.from_si(env_depths, "length"), len(env_rates)),
+                units.label("Rate", "rate"): np.repeat(env_rates, len(env_depths)),
+                vel_col: units.from_si(grid.ravel(), "velocity")
+            })
+            st.altair_chart(
+                alt.Chart(heat).mark_rect().encode(
+                    x=alt.X(f"{depth_col}:O", axis=alt.Axis(labelOverlap=True)),
+                    y=alt.Y(f"{units.label('Rate', 'rate')}:O", sort="descending", axis=alt.Axis(format=f".{decimals}f")),
+                    color=alt.Color(
+                        f"{vel_col}:Q",
+                        scale=alt.Scale(domainMid=min_vel, scheme="redyellowgreen")
+                    )
+                ),
+                use_container_width=True
+            )
+
+        st.dataframe(env_table.round(decimals), hide_index=True, use_container_width=True)
+
+    # --- Live acquisition feed (replaces retyping depth / rate) ---
+    with st.expander("Live acquisition feed"):
+        feed = st.session_state.get("live_feed")
+
+        if feed is None or not feed.running:
+            source_txt = st.text_input(
+                "Source (replay file path, or host:port for a JSON-lines socket)",
+                value="",
+                key="live_source"
+            )
+            replay_speed = st.number_input("Replay speed (×, 0 = as fast as possible)", min_value=0.0, value=1.0)
+
+            source = None
+            if st.button("Start live feed") and source_txt.strip():
+                source_txt = source_txt.strip()
+                host, sep, port = source_txt.rpartition(":")
+                if Path(source_txt).exists():
+                    source = replay_file(source_txt, replay_speed)
+                elif sep and port.isdigit() and 0 < int(port) < 65536:
+                    source = read_socket(host or "127.0.0.1", int(port))
+                else:
+                    st.error(f"'{source_txt}' is not an existing file or a host:port address.")
+
+            if source is not None:
+                density = graph["blended_density"]
+                job_id = st.session_state.get("job_id")
+                buffer = RingBuffer(
+                    LIVE_CHANNELS,
+                    path=Path(os.environ.get("WELLOPS_TELEMETRY_DIR", "telemetry")) / job_id if job_id else None
+                )
+                survey = cached_survey(job)
+                tracker = LiveTracker(geom, density, survey.tvd_at if survey is not None else None)
+                st.session_state.telemetry = buffer
+                st.session_state.live_feed = LiveFeed(source, tracker, recorder(buffer), on_done=buffer.flush).start()
+        else:
+            if st.button("Stop live feed"):
+                feed.stop()
+
+        # Re-render only this panel each second while the feed runs; no timer otherwise
+        feed = st.session_state.get("live_feed")
+        st.session_state.live_ticking = feed is not None and feed.running
+
+        @st.fragment(run_every=1.0 if st.session_state.live_ticking else None)
+        def live_panel():
+            feed = st.session_state.get("live_feed")
+            if feed is None:
+                return
+            if not feed.running and st.session_state.get("live_ticking"):
+                # feed ended between ticks: one full rerun drops the timer and shows Start again
+                st.session_state.live_ticking = False
+                st.rerun()
+            if feed.error is not None:
+                st.error(f"Feed stopped: {feed.error}")
+
+            reading = feed.tracker.reading
+            if reading is None:
+                st.info("Waiting for the first sample…")
+                return
+
+            m1, m2, m3 = st.columns(3)
+            m1.metric("CT depth", units.fmt(reading["depth_m"], "length", decimals))
+            m2.metric("Annular velocity at tip", units.fmt(reading["annular_velocity_m_min"], "velocity", decimals))
+            m3.metric("Bottoms-up", "—" if reading["bottoms_up_min"] is None else f"{reading['bottoms_up_min']:.{decimals}f} min")
+
+            m4, m5, m6 = st.columns(3)
+            m4.metric("Pump rate", units.fmt(reading["rate_m3_min"], "rate", decimals))
+            m5.metric("Pressure", units.fmt(reading["pressure_kpa"], "pressure", decimals))
+            m6.metric("Hydrostatic at tip", units.fmt(reading["hydrostatic_kpa"], "pressure", decimals))
+
+            st.caption(f"Pumped since start: {units.fmt(reading['pumped_m3'], 'volume', decimals)}" + ("" if feed.running else " (feed ended)"))
+
+            buffer = st.session_state.get("telemetry")
+            if buffer is not None and len(buffer) > 1:
+                window_min = st.select_slider(
+                    "Chart window",
+                    options=[5, 15, 60, 180, 720],
+                    value=60,
+                    format_func=lambda m: f"last {m} min" if m < 60 else f"last {m // 60} h",
+                    key="live_window"
+                )
+                view = buffer.query(reading["t"] - window_min * 60.0, reading["t"], max_points=1000)
+                chart = pd.DataFrame({
+                    "t": pd.to_datetime(view["t"], unit="s"),
+                    units.label("Depth", "length"): units.from_si(view["depth_m_mean"], "length"),
+                    units.label("Rate", "rate"): units.from_si(view["rate_m3_min_mean"], "rate")
+                })
+                st.line_chart(chart, x="t", y=units.label("Depth", "length"))
+                st.line_chart(chart, x="t", y=units.label("Rate", "rate"))
+
+        live_panel()
+
+    if depth_m <= 0 or rate_m3_min <= 0:
+        st.info("Enter Depth and Pump rate to calculate annular velocity and bottoms-up time.")
+        st.stop()
+
+    # --- Casing at depth (for point velocity) ---
+    k = geom.interval_at(depth_m)
+    if k is None:
+        st.warning("No casing section covers this depth. Check casing top/bottom depths in Well / Job.")
+        st.stop()
+
+    casing_id_mm = geom.ids_mm[k]
+    ann_area_m2 = geom.ann_areas[k]
+    if ann_area_m2 <= 0:
+        st.error("Annular area is ≤ 0. Check casing ID vs CT OD.")
+        st.stop()
+
+    vel_at_depth = rate_m3_min / ann_area_m2
+
+    # --- Segment velocities + length-weighted average to depth ---
+    segments = []
+    total_len = 0.0
+    vel_len_sum = 0.0
+
+    for seg in geom.segments_to(depth_m):
+        seg_vel = rate_m3_min / seg["ann_area"]
+        segments.append({**seg, "vel": seg_vel})
+
+        total_len += seg["len"]
+        vel_len_sum += seg_vel * seg["len"]
+
+    avg_vel_to_depth = (vel_len_sum / total_len) if total_len > 0 else None
+    bottoms_up_min = geom.bottoms_up_min(depth_m, rate_m3_min)
+
+    # --- Output ---
+    st.subheader("Results")
+
+    st.success(f"Annular velocity at {units.fmt(depth_m, 'length', 0)}: {units.fmt(vel_at_depth, 'velocity', decimals)}")
+    st.caption(f"At depth uses casing ID {casing_id_mm} mm and CT OD {ct_od_mm} mm.")
+
+    # --- Compact mobile-friendly segment cards ---
+    if segments:
+        st.markdown("### Velocity by casing section (surface → depth)")
+
+        for i, s in enumerate(segments, start=1):
+            with st.container(border=True):
+                left, right = st.columns([1, 1])
+
+                with left:
+                    st.markdown(f"**Section {i}**")
+                    st.write(f"Depth: **{units.from_si(s['from'], 'length'):.0f}–{units.fmt(s['to'], 'length', 0)}**")
+                    st.write(f"Casing ID: **{s['id_mm']:.1f} mm**")
+
+                with right:
+                    st.markdown("**Velocity**")
+                    st.markdown(
+                        f"<div style='font-size: 26px; font-weight: 800; color: #F9FAFB;'>"
+                        f"{units.fmt(s['vel'], 'velocity', decimals)}</div>",
+                        unsafe_allow_html=True
+                    )
+                    st.write(f"Length: **{units.fmt(s['len'], 'length', 0)}**")
+
+        if avg_vel_to_depth is not None:
+            st.success(
+                f"Average annular velocity (length-weighted) to {units.fmt(depth_m, 'length', 0)}: "
+                f"{units.fmt(avg_vel_to_depth, 'velocity', decimals)}"
+            )
+
+    if bottoms_up_min is not None:
+        st.success(f"Bottoms-up time to {units.fmt(depth_m, 'length', 0)}: {bottoms_up_min:.{decimals}f} min")
+        st.caption("Calculated from annular volume (surface → depth) ÷ pump rate.")
@@ -0,0 +1,102 @@
+import streamlit as st
+
+from reactive import job_inputs
+
+
+# =========================
+# FLUIDS
+# =========================
+
+def render(job):
+    graph = st.session_state.graph
+
+    st.header("🧪 Fluids")
+
+    st.subheader("Base Fluid")
+
+    # Nothing is preselected for a new job, so opening this page doesn't write
+    # a fluid into the job (and start a saved job) on its own
+    base_options = ["Fresh Water", "Produced Water", "Custom"]
+    base_fluid = st.selectbox(
+        "Select base fluid",
+        base_options,
+        index=base_options.index(job["fluids"]["base"]) if job["fluids"]["base"] in base_options else None,
+        placeholder="Choose a base fluid"
+    )
+
+    if base_fluid is None:
+        base_density = None
+
+    elif base_fluid == "Fresh Water":
+        base_density = 1000.0  # kg/m³
+        st.info("Fresh water density assumed: 1000 kg/m³")
+
+    elif base_fluid == "Produced Water":
+        base_density = 1100.0  # kg/m³ (average)
+        st.info("Produced water density assumed: 1100 kg/m³")
+
+    else:
+        base_density = st.number_input(
+            "Custom base fluid density (kg/m³)",
+            min_value=500.0,
+            max_value=2000.0,
+            value=min(max(float(job["fluids"]["density"] or 1000.0), 500.0), 2000.0),
+            step=1.0
+        )
+
+    if base_fluid is not None:
+        job["fluids"]["base"] = base_fluid
+        job["fluids"]["density"] = base_density
+
+    # -------------------------
+    # Chemicals
+    # -------------------------
+
+    st.subheader("Chemicals")
+
+    chem_name = st.text_input("Chemical name")
+    chem_density = st.number_input(
+        "Chemical density (kg/m³)",
+        min_value=500.0,
+        max_value=3000.0,
+        step=1.0
+    )
+    chem_rate = st.number_input(
+        "Concentration (L/m³)",
+        min_value=0.0,
+        step=0.1
+    )
+
+    if st.button("Add chemical"):
+        if chem_name and chem_rate > 0:
+            job["fluids"]["chemicals"].append({
+                "name": chem_name,
+                "density": chem_density,
+                "rate": chem_rate
+            })
+
+    # -------------------------
+    # Blended Density
+    # -------------------------
+
+    for chem in job["fluids"]["chemicals"]:
+        st.write(
+            f"{chem['name']}: "
+            f"{chem['rate']} L/m³ | "
+            f"{chem['density']} kg/m³"
+        )
+
+    job_inputs(graph, job)
+    blended = graph["blended_density"]
+
+    # -------------------------
+    # Results
+    # -------------------------
+
+    st.markdown("---")
+    st.subheader("Results")
+
+    if blended is None:
+        st.info("Choose a base fluid to get the blended density.")
+    else:
+        st.metric("Blended Fluid Density", f"{blended:.1f} kg/m³")
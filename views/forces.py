@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from units import convert
+import calcs
+import forces
+from views.common import cached_survey, survey_key
+
+
+# =========================
+# FORCES (soft-string)
+# =========================
+
+def render(job):
+    calc_cache = st.session_state.calc_cache
+    graph = st.session_state.graph
+    units = graph["units"]
+
+    st.header("🏋️ Forces — Weight, Buckling & Lockup")
+
+    ct = calcs.active_string(job)
+    if ct is None or not len(ct["sections"]):
+        st.info("Select an active CT string with sections first (CT Strings page).")
+        st.stop()
+
+    if not len(job["well"]["casing"]):
+        st.info("Add casing geometry first (Well / Job page).")
+        st.stop()
+
+    force_unit = units.unit("force")
+    decimals = int(job["settings"].get("decimals", 2))
+
+    survey = cached_survey(job)
+    if survey is None:
+        st.caption("No survey imported — the well is treated as vertical (Well / Job page to import one).")
+
+    geom = graph["geometry"]
+    default_rho = float(graph["blended_density"] or 1000.0)
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        mu_rih = st.number_input("Friction factor RIH", min_value=0.0, max_value=1.0, value=0.25, step=0.01)
+        mu_pooh = st.number_input("Friction factor POOH", min_value=0.0, max_value=1.0, value=0.25, step=0.01)
+    with c2:
+        rho_in = st.number_input("Fluid inside CT (kg/m³)", min_value=0.0, value=default_rho)
+        rho_out = st.number_input("Fluid in annulus (kg/m³)", min_value=0.0, value=default_rho)
+    with c3:
+        whp_kpa = units.to_si(st.number_input(
+            units.label("Wellhead pressure", "pressure"), min_value=0.0, value=0.0, key="forces_whp"
+        ), "pressure")
+        tip_load = units.to_si(st.number_input(f"Tip load ({force_unit}, − = set-down)", value=0.0), "force")
+        max_snub = units.to_si(st.number_input(f"Injector snub capacity ({force_unit})", min_value=0.0, value=0.0,
+                                               help="0 = only flag lockup where the force march diverges"), "force")
+
+    inputs = {
+        "ct": ct["sections"], "casing": job["well"]["casing"], "survey": survey_key(job),
+        "mu": (mu_rih, mu_pooh), "rho": (rho_in, rho_out), "whp": whp_kpa,
+        "tip": tip_load, "snub": max_snub
+    }
+    sweep = calc_cache.get_or_compute("forces", inputs, lambda: forces.force_sweep(
+        ct["sections"], geom, survey, mu_rih, mu_pooh, rho_in, rho_out, whp_kpa,
+        tip_load, max_depth_m=geom.bottom, max_snub_n=max_snub or None
+    ))
+
+    tip_col = units.label("Tip MD", "length")
+    sweep_df = pd.DataFrame({
+        tip_col: units.from_si(sweep["tip_md"], "length"),
+        f"RIH ({force_unit})": units.from_si(sweep["rih_surface_n"], "force"),
+        f"POOH ({force_unit})": units.from_si(sweep["pooh_surface_n"], "force")
+    })
+    pull = ct["ratings"].get("pull")
+    pull_n = convert(pull, "force", "daN", "N") if pull else None  # rating is entered in daN
+    if pull_n:
+        sweep_df[f"Max pull ({force_unit})"] = units.from_si(pull_n, "force")
+
+    st.subheader("Surface weight")
+    st.line_chart(sweep_df, x=tip_col)
+
+    def first_depth(mask):
+        return float(sweep["tip_md"][mask.argmax()]) if mask.any() else None
+
+    m1, m2, m3, m4 = st.columns(4)
+    for col, label, depth in (
+        (m1, "Sinusoidal buckling from", first_depth(sweep["sinusoidal"])),
+        (m2, "Helical buckling from", first_depth(sweep["helical"])),
+        (m3, "Lockup at", first_depth(sweep["lockup"]))
+    ):
+        col.metric(label, units.fmt(depth, "length", 0))
+    m4.metric("Max POOH weight", units.fmt(np.nanmax(sweep["pooh_surface_n"]), "force", decimals))
+
+    if sweep["lockup"].any():
+        st.error(f"Lockup running in at {units.fmt(first_depth(sweep['lockup']), 'length', 0)} MD.")
+    if pull_n and np.nanmax(sweep["pooh_surface_n"]) > pull_n:
+        st.error(f"Pulling out exceeds the max pull rating from {units.fmt(first_depth(sweep['pooh_surface_n'] > pull_n), 'length', 0)} MD.")
+
+    # --- Force along the string at one tip depth ---
+    with st.expander("Axial force along the string"):
+        # force_profile works in 1 m steps, so the tip has to be at least one step in
+        shallowest = float(units.from_si(1.0, "length"))
+        deepest = float(units.from_si(sweep["tip_md"][-1], "length"))
+        tip_md = max(units.to_si(st.slider(tip_col, shallowest, deepest, deepest), "length"), 1.0)
+        direction = st.radio("Direction", ["RIH", "POOH"], horizontal=True)
+
+        profile = forces.force_profile(
+            ct["sections"], geom, tip_md, survey,
+            mu_rih if direction == "RIH" else mu_pooh, -1.0 if direction == "RIH" else 1.0,
+            rho_in, rho_out, tip_load
+        )
+        md_col = units.label("MD", "length")
+        st.line_chart(pd.DataFrame({
+            md_col: units.from_si(profile["md"], "length"),
+            f"Axial force ({force_unit})": units.from_si(profile["force_n"], "force"),
+            f"−Sinusoidal limit ({force_unit})": units.from_si(-profile["sinusoidal_n"], "force"),
+            f"−Helical limit ({force_unit})": units.from_si(-profile["helical_n"], "force")
+        }), x=md_col)
+        st.caption("Tension positive. Compression below a limit line means the string is buckled there.")
@@ -0,0 +1,88 @@
+import streamlit as st
+import streamlit.components.v1 as components
+
+from model import default_job
+from views.common import get_job_store, asset, open_job
+
+
+# =========================
+# HOME
+# =========================
+
+def render(job):
+    calc_cache = st.session_state.calc_cache
+    job_store = get_job_store()
+
+    c1, c2, c3 = st.columns([1, 2, 1])
+    with c2:
+        st.image(
+            asset("wellops_logo.png"),
+            width=280
+        )
+
+    components.html(
+        """
+        <div style="
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+            height: 70vh;
+            text-align: center;
+        ">
+
+            <div style="
+                margin-top: 18px;
+                font-size: 28px;
+                font-weight: 600;
+                color: #F97316;
+            ">
+                Plan. Verify. Execute.
+            </div>
+
+            <div style="
+                margin-top: 16px;
+                max-width: 720px;
+                font-size: 19px;
+                line-height: 1.7;
+                color: #D1D5DB;
+            ">
+                Integrated calculations for flow, volumes, and pressure. 
+                Purpose-built for coiled tubing and intervention operations
+            </div>
+
+        </div>
+        """,
+        height=500
+    )
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    c1, c2, c3 = st.columns([1, 1, 1])
+
+    with c2:
+        if st.button("🟧 Start New Job", use_container_width=True):
+            new_job = default_job()
+            open_job(job_store.create(new_job))
+            calc_cache.invalidate()
+            st.session_state.page_override = "Well / Job"
+
+        if st.button("Open Saved Job", use_container_width=True):
+            st.session_state.show_saved_jobs = True
+
+        if st.session_state.get("show_saved_jobs"):
+            saved_jobs = job_store.list_jobs()
+
+            if not saved_jobs:
+                st.info("No saved jobs yet.")
+            else:
+                choice = st.selectbox(
+                    "Saved jobs",
+                    saved_jobs,
+                    format_func=lambda j: f"{j['name'] or 'Untitled'} — {(j['last_modified'] or '')[:16].replace('T', ' ')}"
+                )
+                if st.button("Open", use_container_width=True):
+                    open_job(choice["id"])
+                    calc_cache.invalidate()
+                    st.session_state.show_saved_jobs = False
+                    st.session_state.page_override = "Well / Job"
@@ -0,0 +1,263 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from hydrostatics import FluidColumns, pressure_profile
+from units import convert
+import calcs
+import hydraulics
+from views.common import cached_survey, survey_key
+
+
+# =========================
+# HYDROSTATIC PRESSURE
+# =========================
+
+def render(job):
+    calc_cache = st.session_state.calc_cache
+    graph = st.session_state.graph
+    units = graph["units"]
+
+    st.header("📉 Pressure — Hydrostatic")
+
+    # --- Settings ---
+    pressure_unit = units.unit("pressure")
+    decimals = int(job["settings"].get("decimals", 2))
+
+    # --- Blended density of the job fluid (base + chemicals) ---
+    blended_density = graph["blended_density"]
+
+    # --- Default TVD from Well / Job ---
+    default_tvd = job.get("well", {}).get("tvd")
+
+    # --- Inputs ---
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Depth")
+        use_tvd = st.checkbox("Use TVD from Well / Job", value=True)
+        survey = cached_survey(job)
+
+        if use_tvd and default_tvd is not None:
+            depth_m = units.to_si(st.number_input(
+                units.label("TVD", "length"),
+                value=float(units.from_si(float(default_tvd), "length")),
+                min_value=0.0
+            ), "length")
+        elif survey is not None and st.checkbox("Enter measured depth (convert with survey)", value=True):
+            md_m = units.to_si(st.number_input(
+                units.label("MD", "length"),
+                value=0.0,
+                min_value=0.0,
+                placeholder="Enter measured depth"
+            ), "length")
+            depth_m = survey.tvd_at(md_m)
+            st.caption(f"TVD at {units.fmt(md_m, 'length', 1)} MD: {units.fmt(depth_m, 'length', 2)}")
+        else:
+            depth_m = units.to_si(st.number_input(
+                units.label("Depth", "length"),
+                value=0.0,
+                min_value=0.0,
+                placeholder="Enter depth"
+            ), "length")
+
+    with col2:
+        st.subheader("Fluid Density")
+        use_blended = st.checkbox("Use blended density from Fluids", value=True)
+
+        if use_blended and blended_density is not None:
+            rho = st.number_input(
+                "Density (kg/m³)",
+                value=float(blended_density),
+                min_value=0.0
+            )
+        else:
+            rho = st.number_input(
+                "Density (kg/m³)",
+                value=0.0,
+                min_value=0.0,
+                placeholder="Enter density"
+            )
+
+    # --- Guidance if missing sources ---
+    if use_tvd and default_tvd is None:
+        st.warning("No TVD set in Well / Job. Either set TVD there or uncheck 'Use TVD' and enter a depth.")
+
+    if use_blended and blended_density is None:
+        st.warning("No blended density set in Fluids. Either set it in Fluids or uncheck 'Use blended density' and enter a density.")
+
+    # --- Calculate ---
+    if depth_m > 0 and rho > 0:
+        p_kpa = calcs.hydrostatic_pa(rho, depth_m) / 1000.0
+        grad_kpa_m = rho * calcs.G / 1000.0
+
+        st.subheader("Results")
+        st.success(f"Hydrostatic pressure: {units.fmt(p_kpa, 'pressure', decimals)}")
+
+        with st.expander("Show gradients"):
+            st.write(f"Gradient: **{grad_kpa_m:.{decimals}f} kPa/m**")
+            st.write(f"Gradient: **{convert(grad_kpa_m, 'gradient', 'kPa/m', 'psi/ft'):.{decimals}f} psi/ft**")
+
+    else:
+        st.info("Enter a valid Depth and Density to calculate hydrostatic pressure.")
+
+    # --- Multi-column profile (CT vs annulus) ---
+    with st.expander("Pressure profile — fluid columns in CT and annulus"):
+        survey = cached_survey(job)
+        tvd_at = survey.tvd_at if survey is not None else None
+        base_rho = float(blended_density or 1000.0)
+
+        bottom_md = units.to_si(st.number_input(
+            units.label("Profile to MD", "length"),
+            min_value=1.0,
+            value=float(units.from_si(float(job["well"].get("td") or default_tvd or 1000.0), "length"))
+        ), "length")
+
+        column_config = {
+            "name": "Fluid",
+            "density": st.column_config.NumberColumn("Density (kg/m³)", min_value=0.0),
+            "top_md": st.column_config.NumberColumn(units.label("Top MD", "length"), min_value=0.0)
+        }
+
+        pc1, pc2 = st.columns(2)
+        with pc1:
+            st.markdown("**CT (inside)**")
+            ct_cols = st.data_editor(
+                pd.DataFrame([{"name": "Base fluid", "density": base_rho, "top_md": 0.0}]),
+                num_rows="dynamic", hide_index=True, column_config=column_config, key="ct_columns"
+            )
+            ct_surface_kpa = units.to_si(st.number_input(units.label("CT surface pressure", "pressure"), min_value=0.0, value=0.0), "pressure")
+        with pc2:
+            st.markdown("**Annulus**")
+            ann_cols = st.data_editor(
+                pd.DataFrame([{"name": "Base fluid", "density": base_rho, "top_md": 0.0}]),
+                num_rows="dynamic", hide_index=True, column_config=column_config, key="ann_columns"
+            )
+            ann_surface_kpa = units.to_si(st.number_input(units.label("Wellhead pressure", "pressure"), min_value=0.0, value=0.0), "pressure")
+
+        def columns_from(df):
+            return [
+                {**row, "top_md": units.to_si(row["top_md"], "length")}
+                for row in df.to_dict("records")
+                if pd.notna(row["density"]) and pd.notna(row["top_md"])
+            ]
+
+        ct_rows, ann_rows = columns_from(ct_cols), columns_from(ann_cols)
+        if not ct_rows or not ann_rows:
+            st.info("Each side needs at least one fluid with a density and top MD.")
+        else:
+            ct_stack = calc_cache.get_or_compute(
+                "fluids", {"columns": ct_rows, "surface": ct_surface_kpa, "survey": survey_key(job)},
+                lambda: FluidColumns(ct_rows, tvd_at, ct_surface_kpa)
+            )
+            ann_stack = calc_cache.get_or_compute(
+                "fluids", {"columns": ann_rows, "surface": ann_surface_kpa, "survey": survey_key(job)},
+                lambda: FluidColumns(ann_rows, tvd_at, ann_surface_kpa)
+            )
+
+            profile_md = np.linspace(0.0, bottom_md, 500)
+            profile = pressure_profile(profile_md, ct_stack, ann_stack, tvd_at)
+
+            md_col = units.label("MD", "length")
+            profile_df = pd.DataFrame({
+                md_col: units.from_si(profile["md"], "length"),
+                f"CT ({pressure_unit})": units.from_si(profile["ct_kpa"], "pressure"),
+                f"Annulus ({pressure_unit})": units.from_si(profile["annulus_kpa"], "pressure"),
+                f"Differential CT − annulus ({pressure_unit})": units.from_si(profile["differential_kpa"], "pressure")
+            })
+            st.line_chart(profile_df, x=md_col)
+
+            bottom = profile_df.iloc[-1]
+            st.success(
+                f"At {units.fmt(bottom_md, 'length', 0)} MD: CT {bottom.iloc[1]:.{decimals}f} {pressure_unit} | "
+                f"annulus {bottom.iloc[2]:.{decimals}f} {pressure_unit} | "
+                f"differential {bottom.iloc[3]:.{decimals}f} {pressure_unit}"
+            )
+
+    # --- Friction losses / pump pressure curve ---
+    with st.expander("Friction losses — pump pressure curve"):
+        ct = calcs.active_string(job)
+        if ct is None or not len(ct["sections"]) or not len(job["well"]["casing"]):
+            st.info("Needs an active CT string (CT Strings page) and casing geometry (Well / Job page).")
+        else:
+            geom = graph["geometry"]
+            ct_length = graph["ct_summary"]["total_length"]
+
+            fc1, fc2, fc3 = st.columns(3)
+            with fc1:
+                model = st.selectbox(
+                    "Rheology model",
+                    hydraulics.MODELS,
+                    format_func=lambda m: {"newtonian": "Newtonian", "power_law": "Power law", "bingham": "Bingham plastic"}[m]
+                )
+                fluid = {"model": model, "density": st.number_input(
+                    "Fluid density (kg/m³)", min_value=1.0, value=float(blended_density or 1000.0), key="fric_density"
+                )}
+            with fc2:
+                if model == "newtonian":
+                    fluid["viscosity"] = st.number_input("Viscosity (cP)", min_value=0.01, value=1.0) / 1000.0
+                elif model == "power_law":
+                    fluid["k"] = st.number_input("K (Pa·sⁿ)", min_value=0.0001, value=0.3, format="%.4f")
+                    fluid["n"] = st.number_input("n", min_value=0.05, max_value=1.0, value=0.6)
+                else:
+                    fluid["pv"] = st.number_input("Plastic viscosity (cP)", min_value=0.1, value=15.0) / 1000.0
+                    fluid["yp"] = st.number_input("Yield point (Pa)", min_value=0.0, value=5.0)
+            with fc3:
+                run_depth = units.to_si(st.number_input(
+                    units.label("CT depth", "length"), min_value=0.0,
+                    max_value=float(units.from_si(min(ct_length, geom.bottom), "length")),
+                    value=float(units.from_si(min(ct_length, geom.bottom), "length"))
+                ), "length")
+                run_depth = min(run_depth, ct_length, geom.bottom)
+                reel_core = st.number_input("Reel core diameter (m)", min_value=0.5, value=2.4)
+                whp_kpa = units.to_si(st.number_input(
+                    units.label("Wellhead pressure", "pressure"), min_value=0.0, value=0.0, key="fric_whp"
+                ), "pressure")
+
+            max_rate = units.to_si(st.number_input(
+                units.label("Sweep to rate", "rate"), min_value=0.01, value=float(units.from_si(1.0, "rate"))
+            ), "rate")
+            curve = calc_cache.get_or_compute(
+                "hydraulics",
+                {"fluid": fluid, "ct": ct["sections"], "casing": job["well"]["casing"],
+                 "depth": run_depth, "reel": reel_core, "whp": whp_kpa, "max_rate": max_rate},
+                lambda: hydraulics.pump_pressure_curve(
+                    fluid, ct["sections"], geom, run_depth, np.linspace(0.0, max_rate, 201), reel_core, whp_kpa
+                )
+            )
+
+            rate_col = units.label("Rate", "rate")
+            curve_df = pd.DataFrame({
+                rate_col: units.from_si(curve["rate_m3_min"], "rate"),
+                f"Pump pressure ({pressure_unit})": units.from_si(curve["pump_pressure_kpa"], "pressure"),
+                f"CT on reel ({pressure_unit})": units.from_si(curve["ct_reel_kpa"], "pressure"),
+                f"CT in hole ({pressure_unit})": units.from_si(curve["ct_in_hole_kpa"], "pressure"),
+                f"Annulus ({pressure_unit})": units.from_si(curve["annulus_kpa"], "pressure")
+            })
+            st.line_chart(curve_df, x=rate_col)
+
+            max_rate_shown = float(units.from_si(max_rate, "rate"))
+            op_rate = units.to_si(st.slider(units.label("Operating rate", "rate"), 0.0, max_rate_shown, max_rate_shown / 2.0), "rate")
+            row = curve_df.iloc[int(np.abs(curve["rate_m3_min"] - op_rate).argmin())]
+            st.success(
+                f"At {row.iloc[0]:.{decimals}f} {units.unit('rate')}: pump pressure {row.iloc[1]:.{decimals}f} {pressure_unit} "
+                f"(reel {row.iloc[2]:.{decimals}f}, in hole {row.iloc[3]:.{decimals}f}, annulus {row.iloc[4]:.{decimals}f})"
+            )
+            st.caption("Frictional losses only (plus wellhead pressure); hydrostatic U-tube effects are not included.")
+
+    # --- Live pressure trend (from the Flow & Velocity live feed) ---
+    buffer = st.session_state.get("telemetry")
+    if buffer is not None and len(buffer) > 1:
+        st.subheader("Live pressure")
+        last = buffer.last()
+        window_h = st.slider("Window (h)", min_value=0.25, max_value=12.0, value=12.0, step=0.25)
+        view = buffer.query(last["t"] - window_h * 3600.0, last["t"], max_points=1500)
+
+        trend = pd.DataFrame({
+            "t": pd.to_datetime(view["t"], unit="s"),
+            f"Pressure min ({pressure_unit})": units.from_si(view["pressure_kpa_min"], "pressure"),
+            f"Pressure max ({pressure_unit})": units.from_si(view["pressure_kpa_max"], "pressure"),
+            f"Pressure mean ({pressure_unit})": units.from_si(view["pressure_kpa_mean"], "pressure"),
+            f"Hydrostatic at tip ({pressure_unit})": units.from_si(view["hydrostatic_kpa_mean"], "pressure")
+        })
+        st.line_chart(trend, x="t")
@@ -0,0 +1,87 @@
+import pandas as pd
+import streamlit as st
+
+from units import FACTORS
+from views.common import apply_theme, run_timings
+
+
+# =========================
+# SETTINGS
+# =========================
+
+def render(job):
+    calc_cache = st.session_state.calc_cache
+
+    st.header("⚙️ Settings")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        job["settings"]["theme"] = st.selectbox(
+            "Theme",
+            ["dark", "light"],
+            index=0 if job["settings"]["theme"] == "dark" else 1
+        )
+
+        job["settings"]["accent_color"] = st.selectbox(
+            "Accent colour",
+            ["#F97316  (Orange)", "#00E676  (Neon Green)", "#3B82F6  (Blue)"],
+            index=0 if job["settings"]["accent_color"] == "#F97316" else
+                  1 if job["settings"]["accent_color"] == "#00E676" else 2
+        ).split()[0]  # grab hex only
+
+        job["settings"]["decimals"] = st.slider(
+            "Decimal places",
+            min_value=0,
+            max_value=4,
+            value=int(job["settings"]["decimals"])
+        )
+
+    with col2:
+        st.subheader("Units")
+
+        for key, quantity, label in (
+            ("length_unit", "length", "Length"),
+            ("pressure_unit", "pressure", "Pressure"),
+            ("rate_unit", "rate", "Pump rate"),
+            ("volume_unit", "volume", "Volume"),
+            ("force_unit", "force", "Pull / Force")
+        ):
+            options = list(FACTORS[quantity])
+            current = job["settings"].get(key)
+            job["settings"][key] = st.selectbox(
+                label,
+                options,
+                index=options.index(current) if current in options else 0
+            )
+
+    with st.expander("Calculation cache"):
+        cache_stats = calc_cache.stats()
+        k1, k2, k3, k4 = st.columns(4)
+        k1.metric("Entries", cache_stats["entries"])
+        k2.metric("Hits", cache_stats["hits"])
+        k3.metric("Misses", cache_stats["misses"])
+        k4.metric("Hit rate", f"{cache_stats['hit_rate']:.0%}")
+
+        if st.button("Clear cache"):
+            calc_cache.invalidate()
+
+    with st.expander("Run timings"):
+        timings = run_timings()
+        st.metric("Cold start (first run in this server process)", "—" if timings["cold_ms"] is None else f"{timings['cold_ms']:.0f} ms")
+        if timings["pages"]:
+            st.dataframe(
+                pd.DataFrame(timings["pages"]).rename(columns={
+                    "page": "Page", "first_open_ms": "First open (ms)", "reruns": "Reruns",
+                    "median_ms": "Median rerun (ms)", "last_ms": "Last rerun (ms)"
+                }).round(1),
+                hide_index=True,
+                use_container_width=True
+            )
+        st.caption("Whole-script time per run, all sessions on this server. First open includes importing the page.")
+
+    st.divider()
+    st.info("Settings apply immediately. Calculations always run in SI; depth, pressure, rate, volume and force "
+            "inputs and results use the units above, except the CT string builder, which keeps the pipe tally "
+            "in metres and millimetres.")
+    apply_theme(job["settings"])
@@ -0,0 +1,327 @@
+import math
+
+import numpy as np
+import pandas as pd
+import altair as alt
+import streamlit as st
+
+from geometry import depth_sweep, CTStringIndex
+from fronts import simulate
+from montecarlo import volume_uncertainty
+import placement
+
+
+# =========================
+# VOLUMES
+# =========================
+
+def render(job):
+    calc_cache = st.session_state.calc_cache
+    graph = st.session_state.graph
+    units = graph["units"]
+
+    st.header("🧊 Volumes")
+
+    # --- Guards ---
+    if (
+        job["ct"]["active_index"] is None
+        or not job["ct"]["strings"]
+        or not len(job["ct"]["strings"][job["ct"]["active_index"]]["sections"])
+        or not len(job["well"]["casing"])
+        or job["well"].get("td") is None
+    ):
+        st.info("Define CT string and well geometry first.")
+        st.stop()
+
+    ct = job["ct"]["strings"][job["ct"]["active_index"]]
+    td = float(job["well"]["td"])
+
+    # --- Settings ---
+    decimals = int(job["settings"].get("decimals", 2))
+
+    # --- CT geometry (OD constant across string) ---
+    ct_od_m = float(ct["sections"][0]["od"]) / 1000.0
+    ct_od_area = math.pi * (ct_od_m / 2.0) ** 2
+
+    # --- Total CT length + TOTAL CT internal volume (full string) ---
+    ct_summary = graph["ct_summary"]
+    ct_total_len = ct_summary["total_length"]
+    ct_internal_total_m3 = ct_summary["internal_volume"]
+
+    # =========================
+    # Hole + Annular volume to a depth (indexed casing geometry)
+    # =========================
+    geom = graph["geometry"]
+    hole_and_annular_to_depth = geom.hole_and_annular_to_depth
+
+    # =========================
+    # A (Always On): Volumes to TD
+    # =========================
+    depth_A = td
+
+    hole_A, ann_A = hole_and_annular_to_depth(depth_A)
+
+    # CT displacement depends on how much CT is actually in hole
+    ct_run_len_A = min(depth_A, ct_total_len)
+    ct_displacement_A = ct_od_area * ct_run_len_A
+
+    total_circ_A = ct_internal_total_m3 + ann_A
+
+    st.subheader("A — Volumes to TD")
+
+    st.success(f"CT Internal Volume (total string): {units.fmt(ct_internal_total_m3, 'volume', decimals)}")
+    st.success(f"CT Displacement (to TD): {units.fmt(ct_displacement_A, 'volume', decimals)}")
+    st.success(f"Annular Volume (to TD): {units.fmt(ann_A, 'volume', decimals)}")
+    st.success(f"Hole Volume (to TD): {units.fmt(hole_A, 'volume', decimals)}")
+    st.success(f"Total Circulating Volume (to TD): {units.fmt(total_circ_A, 'volume', decimals)}")
+
+    # =========================
+    # B (Precise): Volumes to Specific Depth
+    # =========================
+    with st.expander("B — Advanced: Volumes to Specific Depth"):
+        depth_input = st.text_input(units.label("Depth", "length"), value="")
+
+        try:
+            depth_B = units.to_si(float(depth_input), "length")
+            valid_depth = 0 < depth_B <= td
+        except:
+            valid_depth = False
+
+        if not valid_depth:
+            st.info("Enter a valid depth within TD.")
+        else:
+            hole_B, ann_B = hole_and_annular_to_depth(depth_B)
+
+            ct_run_len_B = min(depth_B, ct_total_len)
+            ct_displacement_B = ct_od_area * ct_run_len_B
+
+            total_circ_B = ct_internal_total_m3 + ann_B
+
+            st.markdown("### Volumes to Depth")
+            st.write(f"Depth: **{units.fmt(depth_B, 'length', 0)}**")
+
+            st.success(f"CT Internal Volume (total string): {units.fmt(ct_internal_total_m3, 'volume', decimals)}")
+            st.success(f"CT Displacement: {units.fmt(ct_displacement_B, 'volume', decimals)}")
+            st.success(f"Annular Volume: {units.fmt(ann_B, 'volume', decimals)}")
+            st.success(f"Hole Volume: {units.fmt(hole_B, 'volume', decimals)}")
+            st.success(f"Total Circulating Volume: {units.fmt(total_circ_B, 'volume', decimals)}")
+
+    # =========================
+    # C (Table): Volumes + Velocity Every N m to TD
+    # =========================
+    with st.expander("C — Depth Table (sweep to TD)"):
+        s1, s2 = st.columns(2)
+        with s1:
+            step_m = units.to_si(st.number_input(
+                units.label("Depth step", "length"), min_value=float(units.from_si(0.1, "length")),
+                value=float(units.from_si(1.0, "length"))
+            ), "length")
+        with s2:
+            rate_in = st.number_input(units.label("Pump rate", "rate"), min_value=0.0, value=0.0, key="sweep_rate")
+
+        rate_m3_min = units.to_si(rate_in, "rate")
+
+        depths = np.append(np.arange(step_m, td, step_m), td)
+        sweep = depth_sweep(geom, depths, rate_m3_min, ct_total_len)
+
+        depth_col = units.label("Depth", "length")
+        hole_col, ann_col = units.label("Hole", "volume"), units.label("Annular", "volume")
+        vel_col = units.label("Annular velocity", "velocity")
+        table = pd.DataFrame({
+            depth_col: units.from_si(sweep["depth"], "length"),
+            hole_col: units.from_si(sweep["hole_m3"], "volume"),
+            ann_col: units.from_si(sweep["annular_m3"], "volume"),
+            units.label("CT Displacement", "volume"): units.from_si(sweep["ct_displacement_m3"], "volume"),
+            vel_col: units.from_si(sweep["annular_velocity_m_min"], "velocity"),
+            "Bottoms-up (min)": sweep["bottoms_up_min"]
+        })
+
+        st.line_chart(table, x=depth_col, y=[ann_col, hole_col])
+        if rate_m3_min > 0:
+            st.line_chart(table, x=depth_col, y=vel_col)
+        st.dataframe(table.round(decimals), hide_index=True, use_container_width=True)
+
+    # =========================
+    # D (Schedule): Fluid Fronts Through CT + Annulus
+    # =========================
+    with st.expander("D — Pump Schedule (fluid fronts)"):
+        tip_depth = units.to_si(st.number_input(
+            units.label("CT tip depth", "length"),
+            min_value=0.0,
+            max_value=float(units.from_si(min(td, ct_total_len), "length")),
+            value=float(units.from_si(min(td, ct_total_len), "length"))
+        ), "length")
+        tip_depth = min(tip_depth, td, ct_total_len)    # ft -> m round trip can land a hair past the end
+
+        stages_df = st.data_editor(
+            pd.DataFrame([
+                {"name": "Pill", "volume_m3": units.from_si(2.0, "volume"),
+                 "rate_m3_min": units.from_si(0.3, "rate"), "duration_min": None},
+                {"name": "Displacement", "volume_m3": units.from_si(10.0, "volume"),
+                 "rate_m3_min": units.from_si(0.5, "rate"), "duration_min": None}
+            ]),
+            num_rows="dynamic",
+            hide_index=True,
+            column_config={
+                "name": "Stage",
+                "volume_m3": st.column_config.NumberColumn(units.label("Volume", "volume"), min_value=0.0),
+                "rate_m3_min": st.column_config.NumberColumn(units.label("Rate", "rate"), min_value=0.0),
+                "duration_min": st.column_config.NumberColumn("Pause (min, rate 0)", min_value=0.0)
+            },
+            key="pump_schedule"
+        )
+
+        stages = [
+            {
+                **row,
+                "volume_m3": units.to_si(row["volume_m3"] or 0.0, "volume"),
+                "rate_m3_min": units.to_si(row["rate_m3_min"] or 0.0, "rate")
+            }
+            for row in stages_df.to_dict("records")
+            if row["name"] and ((row["rate_m3_min"] or 0) > 0 and (row["volume_m3"] or 0) > 0 or (row["duration_min"] or 0) > 0)
+        ]
+
+        if not stages or tip_depth <= 0:
+            st.info("Add at least one stage with volume and rate (or a pause with a duration).")
+        else:
+            sim = simulate(CTStringIndex(ct["sections"]), geom, tip_depth, stages)
+
+            t_view = st.slider(
+                "Time since start (min)",
+                min_value=0.0,
+                max_value=max(sim.schedule.total_time, 0.1),
+                value=0.0
+            )
+            st.caption(
+                f"Pumped: {units.fmt(float(sim.schedule.pumped_at(t_view)), 'volume', decimals)} | "
+                f"Circulating path: {units.fmt(sim.path.volume, 'volume', decimals)}"
+            )
+
+            st.markdown("### Leading edge of each stage")
+            st.dataframe(pd.DataFrame(sim.fronts_at(time_min=t_view)).round(decimals), hide_index=True, use_container_width=True)
+
+            st.markdown("### Events")
+            st.dataframe(pd.DataFrame(sim.events).round(decimals), hide_index=True, use_container_width=True)
+
+    # =========================
+    # E (Uncertainty): Monte Carlo on tolerances
+    # =========================
+    with st.expander("E — Uncertainty (P10 / P50 / P90)"):
+        u1, u2, u3 = st.columns(3)
+        with u1:
+            mc_depth = units.to_si(st.number_input(
+                units.label("Depth", "length"), min_value=0.0, value=float(units.from_si(td, "length")), key="mc_depth"
+            ), "length")
+            mc_rate = units.to_si(st.number_input(
+                units.label("Pump rate", "rate"), min_value=0.0, value=float(units.from_si(0.5, "rate")), key="mc_rate"
+            ), "rate")
+        with u2:
+            id_tol = st.number_input("Casing ID ± (mm)", min_value=0.0, value=0.5)
+            wall_tol = st.number_input("CT wall ± (mm)", min_value=0.0, value=0.25)
+        with u3:
+            length_tol = units.to_si(st.number_input(
+                f"Section length ± ({units.unit('length')})", min_value=0.0, value=float(units.from_si(2.0, "length"))
+            ), "length")
+            depth_tol = units.to_si(st.number_input(
+                f"Depth ± ({units.unit('length')})", min_value=0.0, value=float(units.from_si(1.0, "length"))
+            ), "length")
+
+        mc_samples = st.select_slider("Samples", [10_000, 100_000, 1_000_000], value=1_000_000)
+        st.caption("Tolerances are treated as ±2σ of a normal distribution.")
+
+        mc = calc_cache.get_or_compute(
+            "montecarlo",
+            {"ct": ct["sections"], "casing": job["well"]["casing"], "depth": mc_depth, "rate": mc_rate,
+             "tol": (id_tol, wall_tol, length_tol, depth_tol), "samples": mc_samples},
+            lambda: volume_uncertainty(
+                geom, ct["sections"], mc_depth, mc_rate, id_tol, wall_tol, length_tol, depth_tol,
+                samples=mc_samples, seed=0
+            )
+        )
+
+        rows = [
+            ("Annular volume", mc["annular_m3"], True),
+            ("Total circulating volume", mc["circulating_m3"], True)
+        ]
+        if "bottoms_up_min" in mc:
+            rows.append(("Bottoms-up time (min)", mc["bottoms_up_min"], False))
+
+        st.dataframe(pd.DataFrame([
+            {
+                "Quantity": units.label(name, "volume") if is_volume else name,
+                **{p.upper(): units.from_si(stats[p], "volume") if is_volume else stats[p] for p in ("p10", "p50", "p90")}
+            }
+            for name, stats, is_volume in rows
+        ]).round(decimals), hide_index=True, use_container_width=True)
+
+        hist = alt.Chart(pd.DataFrame({"annular": units.from_si(mc["annular_sample"], "volume")})).mark_bar().encode(
+            x=alt.X("annular:Q", bin=alt.Bin(maxbins=60), title=units.label("Annular volume", "volume")),
+            y=alt.Y("count()", title="Samples")
+        )
+        st.altair_chart(hist, use_container_width=True)
+
+    # =========================
+    # F (Placement): Balanced plug / spot pill
+    # =========================
+    with st.expander("F — Plug / Pill Placement"):
+        ct_index = CTStringIndex(ct["sections"])
+        mode = st.radio("Placement", ["Balanced plug", "Spot pill"], horizontal=True)
+
+        p1, p2, p3 = st.columns(3)
+        with p1:
+            place_bottom = units.to_si(st.number_input(
+                units.label("Bottom / CT tip depth", "length"), min_value=0.0,
+                max_value=float(units.from_si(min(td, ct_total_len), "length")),
+                value=float(units.from_si(min(td, ct_total_len), "length")), key="place_bottom"
+            ), "length")
+            place_bottom = min(place_bottom, td, ct_total_len)
+        with p2:
+            place_volume = units.to_si(st.number_input(
+                units.label("Plug / pill volume", "volume"), min_value=0.0,
+                value=float(units.from_si(1.0, "volume")), key="place_volume"
+            ), "volume")
+        with p3:
+            spacer_ahead = units.to_si(st.number_input(
+                units.label("Spacer ahead", "volume"), min_value=0.0, value=0.0, disabled=mode != "Balanced plug"
+            ), "volume")
+            pull_margin = units.to_si(st.number_input(
+                units.label("POOH margin above spacer", "length"), min_value=0.0,
+                value=float(units.from_si(50.0, "length")), disabled=mode != "Balanced plug"
+            ), "length")
+
+        if place_volume > 0 and place_bottom > 0:
+            try:
+                if mode == "Balanced plug":
+                    plan = placement.balanced_plug(geom, ct_index, place_bottom, place_volume, spacer_ahead, pull_margin)
+                    st.success(f"Plug top with CT in hole: {units.fmt(plan['plug_top_m'], 'length', 1)} ({units.fmt(plan['plug_length_m'], 'length', 1)} long)")
+                    st.success(f"Spacer behind: {units.fmt(plan['spacer_behind_m3'], 'volume', decimals)}")
+                    st.success(f"Displacement: {units.fmt(plan['displacement_m3'], 'volume', decimals)}")
+                    st.success(
+                        f"Pull out to: {units.fmt(plan['pull_out_to_m'], 'length', 1)} "
+                        f"(plug top after pulling out: {units.fmt(plan['top_after_pull_m'], 'length', 1)})"
+                    )
+                    st.caption(
+                        f"Pumped total: {units.fmt(plan['pumped_total_m3'], 'volume', decimals)} — "
+                        f"plug in annulus {units.fmt(plan['plug_in_annulus_m3'], 'volume', decimals)}, "
+                        f"in CT {units.fmt(plan['plug_in_ct_m3'], 'volume', decimals)}"
+                    )
+                else:
+                    plan = placement.spot_pill(geom, ct_index, place_bottom, place_volume)
+                    st.success(f"Pill top in annulus: {units.fmt(plan['pill_top_m'], 'length', 1)} ({units.fmt(plan['pill_length_m'], 'length', 1)} long)")
+                    st.success(f"Displacement behind pill: {units.fmt(plan['displacement_m3'], 'volume', decimals)}")
+                    st.caption(f"Pill top once CT is pulled out: {units.fmt(plan['top_after_pull_m'], 'length', 1)}")
+            except ValueError as exc:
+                st.error(str(exc))
+
+        st.markdown("**How far does a volume reach?**")
+        reach_volume = units.to_si(st.number_input(
+            units.label("Volume", "volume"), min_value=0.0, value=float(units.from_si(1.0, "volume")), key="reach_volume"
+        ), "volume")
+        reached = placement.depth_reached(geom, ct_index, reach_volume)
+        r1, r2, r3 = st.columns(3)
+        for col, label, value in (
+            (r1, "Into CT from reel", reached["ct_from_reel_m"]),
+            (r2, "Down annulus", reached["annulus_from_surface_m"]),
+            (r3, "Down open hole", reached["hole_from_surface_m"])
+        ):
+            col.metric(label, "beyond" if value is None else units.fmt(value, "length", 1))
@@ -0,0 +1,224 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from model import casing_array
+from survey import parse_survey_csv
+import calcs
+from reactive import job_inputs
+from views.common import get_blob_store, cached_survey
+
+
+# =========================
+# WELL / JOB
+# =========================
+
+def _depth_input(units, name, value, **kwargs):
+    """Length number_input in display units; returns metres (None stays None)."""
+    shown = st.number_input(
+        units.label(name, "length"),
+        value=None if value is None else float(units.from_si(value, "length")),
+        **kwargs
+    )
+    return None if shown is None else units.to_si(shown, "length")
+
+
+def render(job):
+    graph = st.session_state.graph
+    units = graph["units"]
+    blob_store = get_blob_store()
+
+    st.header("Well / Job Setup")
+
+    job["meta"]["name"] = st.text_input("Job name", value=job["meta"]["name"] or "") or None
+
+    # --- DEPTHS ---
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        job["well"]["tvd"] = _depth_input(units, "TVD", job["well"]["tvd"])
+    with c2:
+        job["well"]["kop"] = _depth_input(units, "KOP", job["well"]["kop"])
+    with c3:
+        job["well"]["td"] = _depth_input(units, "TD", job["well"]["td"])
+
+    # --- CASING / LINER ---
+    st.subheader("Casing / Liner Sections")
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        top = _depth_input(units, "Top depth", 0.0, min_value=0.0)
+    with c2:
+        bottom = _depth_input(units, "Bottom depth", 0.0, min_value=0.0)
+    with c3:
+        id_mm = st.number_input("Internal diameter (mm)", min_value=0.0)
+
+    if st.button("Add casing / liner section"):
+        if bottom > top and id_mm > 0:
+            job["well"]["casing"] = np.concatenate([
+                job["well"]["casing"],
+                casing_array([{"top": top, "bottom": bottom, "id": id_mm}]),
+            ])
+
+    for c in job["well"]["casing"]:
+        st.write(f"{units.fmt(c['top'], 'length')}–{units.fmt(c['bottom'], 'length')} | ID {c['id']} mm")
+
+    # --- RESTRICTIONS ---
+    st.subheader("Restrictions")
+
+    r1, r2, r3 = st.columns(3)
+    with r1:
+        r_name = st.text_input("Restriction name (e.g. XN nipple)")
+    with r2:
+        r_depth = _depth_input(units, "Restriction depth", 0.0, min_value=0.0)
+    with r3:
+        r_id = st.number_input("Restriction ID (mm)", min_value=0.0)
+
+    if st.button("Add restriction"):
+        if r_name and r_id > 0:
+            job["well"]["restrictions"].append({
+                "name": r_name,
+                "depth": r_depth,
+                "id": r_id
+            })
+
+    for r in job["well"]["restrictions"]:
+        st.write(
+            f"{r['name']} | Depth {units.fmt(r['depth'], 'length')} | ID {r['id']} mm"
+        )
+
+    # --- CLEARANCE CHECK ---
+    if len(job["well"]["casing"]) or job["well"]["restrictions"]:
+        with st.expander("Clearance check — CT and tool string"):
+            ct = calcs.active_string(job)
+            ct_od = float(ct["sections"]["od"].max()) if ct and len(ct["sections"]) else 0.0
+            # casing / restrictions may have been added further up this run
+            job_inputs(graph, job)
+            clearance = graph["clearance"]
+
+            k1, k2, k3 = st.columns(3)
+            with k1:
+                tool_od = st.number_input("Tool string max OD (mm)", min_value=0.0, value=max(ct_od, 50.0))
+            with k2:
+                min_gap = st.number_input("Required diametral clearance (mm)", min_value=0.0, value=2.0)
+            with k3:
+                target = _depth_input(units, "Target depth", float(job["well"]["td"] or clearance.ends[-1]),
+                                      min_value=0.0)
+
+            reach = clearance.max_reach(tool_od, min_gap)
+            if clearance.can_pass(tool_od, target, min_gap):
+                st.success(f"{tool_od:.1f} mm tool string passes to {units.fmt(target, 'length', 0)}.")
+            else:
+                stop = clearance.tightest(0.0, target)
+                st.error(
+                    f"{tool_od:.1f} mm tool string stops at {units.fmt(reach, 'length', 0)} — "
+                    f"{stop['name']} ({stop['id_mm']:.1f} mm ID at {units.fmt(stop['depth'], 'length', 0)})."
+                )
+
+            st.markdown("**Tightest point between two depths**")
+            a1, a2 = st.columns(2)
+            with a1:
+                span_top = _depth_input(units, "From", 0.0, min_value=0.0, key="clear_from")
+            with a2:
+                span_bottom = _depth_input(units, "To", target, min_value=0.0, key="clear_to")
+
+            tight = clearance.tightest(span_top, span_bottom)
+            if tight is None:
+                st.info("No casing or restrictions recorded in that interval.")
+            else:
+                c_a, c_b, c_c = st.columns(3)
+                c_a.metric("Minimum ID", f"{tight['id_mm']:.1f} mm", tight["name"], delta_color="off")
+                c_b.metric("CT clearance", f"{(tight['id_mm'] - ct_od) / 2.0:.1f} mm radial")
+                c_c.metric("Tool clearance", f"{(tight['id_mm'] - tool_od) / 2.0:.1f} mm radial")
+
+            st.markdown("**Compare tool configurations**")
+            tools = st.data_editor(
+                pd.DataFrame([{"tool": "Tool string", "od_mm": tool_od}]),
+                num_rows="dynamic", hide_index=True, key="clearance_tools",
+                column_config={"od_mm": st.column_config.NumberColumn("Max OD (mm)", min_value=0.0)}
+            ).dropna()
+            if len(tools):
+                tools[units.label("Reaches", "length")] = units.from_si(
+                    np.atleast_1d(clearance.max_reach(tools["od_mm"].to_numpy(float), min_gap)), "length"
+                )
+                tools[f"Passes {units.fmt(target, 'length', 0)}"] = tools["od_mm"] + min_gap < clearance.min_id(0.0, target)
+                st.dataframe(tools, hide_index=True)
+
+    # --- DIRECTIONAL SURVEY ---
+    st.subheader("Directional Survey")
+
+    survey_upload = st.file_uploader(
+        "Import survey CSV (MD, Inclination, Azimuth)",
+        type=["csv"],
+        key=f"survey_upload_{st.session_state.get('survey_upload_n', 0)}"
+    )
+    if survey_upload is not None:
+        try:
+            job["well"]["survey"] = parse_survey_csv(survey_upload.getvalue().decode("utf-8-sig"))
+            st.session_state.survey_upload_n = st.session_state.get("survey_upload_n", 0) + 1
+            st.rerun()
+        except (ValueError, IndexError, UnicodeDecodeError) as exc:
+            st.error(f"Could not read survey: {exc}")
+
+    survey = cached_survey(job)
+    if survey is not None:
+        s1, s2, s3 = st.columns(3)
+        s1.metric("Stations", len(survey))
+        s2.metric("Max inclination", f"{np.degrees(survey.inc.max()):.1f}°")
+        s3.metric("Max DLS", f"{survey.dls_deg_30m.max():.2f}°/30 m")
+
+        if job["well"]["td"]:
+            tvd_at_td = survey.tvd_at(float(job["well"]["td"]))
+            st.caption(f"TVD at TD ({units.fmt(job['well']['td'], 'length', 0)} MD): {units.fmt(tvd_at_td, 'length', 1)}")
+            if st.button("Use survey TVD at TD as well TVD"):
+                job["well"]["tvd"] = round(tvd_at_td, 2)
+                st.rerun()
+
+        if st.button("Remove survey"):
+            job["well"]["survey"] = None
+            st.rerun()
+
+    # --- SCHEMATIC ---
+    st.subheader("Well Schematic")
+
+    # Older sessions held the raw upload object here
+    if not isinstance(job["well"]["schematic"], dict):
+        job["well"]["schematic"] = None
+
+    uploader_key = f"schematic_upload_{st.session_state.get('schematic_upload_n', 0)}"
+    upload = st.file_uploader(
+        "Upload schematic",
+        type=["png", "jpg", "jpeg", "pdf"],
+        key=uploader_key
+    )
+
+    if upload is not None:
+        job["well"]["schematic"] = {
+            "hash": blob_store.put(upload),
+            "name": upload.name,
+            "type": upload.name.rsplit(".", 1)[-1].lower()
+        }
+        # Reset the uploader so the session stops holding the file bytes
+        st.session_state.schematic_upload_n = st.session_state.get("schematic_upload_n", 0) + 1
+        st.rerun()
+
+    schematic = job["well"]["schematic"]
+    if schematic and blob_store.exists(schematic["hash"]):
+        thumb = blob_store.thumbnail(schematic["hash"], schematic["type"])
+        if thumb is not None:
+            st.image(thumb, caption=schematic["name"])
+        else:
+            st.caption(schematic["name"])
+
+        d1, d2 = st.columns(2)
+        with d1:
+            # Only load the full file when someone actually wants it
+            if st.checkbox("Prepare download"):
+                st.download_button(
+                    "Download schematic",
+                    data=blob_store.read(schematic["hash"]),
+                    file_name=schematic["name"]
+                )
+        with d2:
+            if st.button("Remove schematic"):
+                job["well"]["schematic"] = None
+                st.rerun()